@@ -139,5 +139,9 @@ def send_app_command(method, *args, **kwargs):
     _send_app_command(format_app_command(method, *args, **kwargs))
 
 
+def send_build_result(code):
+    _send_app_command('__HATCH_SERVER__:{}'.format(code))
+
+
 def _send_app_command(command):
     print(command)
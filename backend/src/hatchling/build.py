@@ -31,6 +31,16 @@ def get_requires_for_build_wheel(config_settings=None):
     return builder.config.dependencies
 
 
+def prepare_metadata_for_build_wheel(metadata_directory, config_settings=None):
+    """
+    https://peps.python.org/pep-0517/#prepare-metadata-for-build-wheel
+    """
+    from .builders.wheel import WheelBuilder
+
+    builder = WheelBuilder(os.getcwd())
+    return os.path.basename(builder.prepare_metadata(metadata_directory, 'standard'))
+
+
 def build_wheel(wheel_directory, config_settings=None, metadata_directory=None):
     """
     https://peps.python.org/pep-0517/#build-wheel
@@ -38,6 +48,7 @@ def build_wheel(wheel_directory, config_settings=None, metadata_directory=None):
     from .builders.wheel import WheelBuilder
 
     builder = WheelBuilder(os.getcwd())
+    builder.prepared_metadata_directory = metadata_directory
     return os.path.basename(next(builder.build(wheel_directory, ['standard'])))
 
 
@@ -51,6 +62,16 @@ def get_requires_for_build_editable(config_settings=None):
     return builder.config.dependencies
 
 
+def prepare_metadata_for_build_editable(metadata_directory, config_settings=None):
+    """
+    https://peps.python.org/pep-0660/#prepare-metadata-for-build-editable
+    """
+    from .builders.wheel import WheelBuilder
+
+    builder = WheelBuilder(os.getcwd())
+    return os.path.basename(builder.prepare_metadata(metadata_directory, 'editable'))
+
+
 def build_editable(wheel_directory, config_settings=None, metadata_directory=None):
     """
     https://peps.python.org/pep-0660/#build-editable
@@ -58,4 +79,5 @@ def build_editable(wheel_directory, config_settings=None, metadata_directory=Non
     from .builders.wheel import WheelBuilder
 
     builder = WheelBuilder(os.getcwd())
+    builder.prepared_metadata_directory = metadata_directory
     return os.path.basename(next(builder.build(wheel_directory, ['editable'])))
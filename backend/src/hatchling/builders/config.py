@@ -1,13 +1,16 @@
 import os
+import subprocess
+import sys
 from collections import OrderedDict
 from contextlib import contextmanager
+from fnmatch import fnmatchcase
 from io import open
 
 import pathspec
 
 from ..utils.fs import locate_file
 from .constants import DEFAULT_BUILD_DIRECTORY, BuildEnvVars
-from .utils import normalize_inclusion_map, normalize_relative_directory, normalize_relative_path
+from .utils import CompiledPathSpec, normalize_inclusion_map, normalize_relative_directory, normalize_relative_path
 
 
 class BuilderConfig(object):
@@ -29,18 +32,29 @@ class BuilderConfig(object):
         self.__exclude_spec = None
         self.__artifact_spec = None
 
+        # The compiled forms of the pathspecs above that are used for matching
+        self.__include_matcher = None
+        self.__exclude_matcher = None
+        self.__artifact_matcher = None
+
         # These are used to create the pathspecs and will never be `None` after the first match attempt
         self.__include_patterns = None
         self.__exclude_patterns = None
         self.__artifact_patterns = None
 
+        # Derived from the patterns above, see `path_is_reachable`
+        self.__reachable_prefixes = None
+
         # Modified at build time
         self.build_artifact_spec = None
+        self.build_artifact_matcher = None
+        self.build_artifact_prefixes = []
         self.build_force_include = {}
 
         # Common options
         self.__directory = None
         self.__ignore_vcs = None
+        self.__vcs_file_listing = None
         self.__only_packages = None
         self.__reproducible = None
         self.__dev_mode_dirs = None
@@ -77,29 +91,71 @@ class BuilderConfig(object):
             )
         )
 
+    def include_paths(self, relative_paths, is_package=True):
+        """
+        Equivalent to filtering with `include_path`, but the matchers are only looked up once for the entire batch
+        e.g. every file within a directory.
+        """
+        build_artifact_matcher = self.build_artifact_matcher
+        artifact_matcher = self.__artifact_matcher if self.artifact_spec is not None else None
+        include_matcher = self.__include_matcher if self.include_spec is not None else None
+        exclude_matcher = self.__exclude_matcher if self.exclude_spec is not None else None
+        selectable = not (self.only_packages and not is_package)
+
+        for relative_path in relative_paths:
+            if (
+                (build_artifact_matcher is not None and build_artifact_matcher.match_file(relative_path))
+                or (artifact_matcher is not None and artifact_matcher.match_file(relative_path))
+                or (
+                    selectable
+                    and (include_matcher is None or include_matcher.match_file(relative_path))
+                    and (exclude_matcher is None or not exclude_matcher.match_file(relative_path))
+                )
+            ):
+                yield relative_path
+
     def path_is_included(self, relative_path):
         if self.include_spec is None:
             return True
 
-        return self.include_spec.match_file(relative_path)
+        return self.__include_matcher.match_file(relative_path)
 
     def path_is_excluded(self, relative_path):
         if self.exclude_spec is None:
             return False
 
-        return self.exclude_spec.match_file(relative_path)
+        return self.__exclude_matcher.match_file(relative_path)
 
     def path_is_artifact(self, relative_path):
         if self.artifact_spec is None:
             return False
 
-        return self.artifact_spec.match_file(relative_path)
+        return self.__artifact_matcher.match_file(relative_path)
 
     def path_is_build_artifact(self, relative_path):
-        if self.build_artifact_spec is None:
+        if self.build_artifact_matcher is None:
             return False
 
-        return self.build_artifact_spec.match_file(relative_path)
+        return self.build_artifact_matcher.match_file(relative_path)
+
+    def path_is_reachable(self, relative_path):
+        """
+        Whether or not any file within the directory could possibly be selected by the inclusion or artifact patterns,
+        allowing entire trees to be skipped.
+        """
+        if self.include_spec is None:
+            return True
+
+        if self.__reachable_prefixes is None:
+            # Ensure that the artifact patterns have been loaded
+            _ = self.artifact_spec
+
+            self.__reachable_prefixes = get_pattern_prefixes(self.__include_patterns + self.__artifact_patterns)
+
+        components = relative_path.split(os.sep)
+        return path_matches_prefixes(components, self.__reachable_prefixes) or path_matches_prefixes(
+            components, self.build_artifact_prefixes
+        )
 
     @property
     def include_spec(self):
@@ -134,6 +190,7 @@ class BuilderConfig(object):
                 self.__include_spec = pathspec.PathSpec.from_lines(
                     pathspec.patterns.GitWildMatchPattern, all_include_patterns
                 )
+                self.__include_matcher = CompiledPathSpec(self.__include_spec)
 
             self.__include_patterns = all_include_patterns
 
@@ -170,6 +227,7 @@ class BuilderConfig(object):
                 self.__exclude_spec = pathspec.PathSpec.from_lines(
                     pathspec.patterns.GitWildMatchPattern, all_exclude_patterns
                 )
+                self.__exclude_matcher = CompiledPathSpec(self.__exclude_spec)
 
             self.__exclude_patterns = all_exclude_patterns
 
@@ -203,6 +261,7 @@ class BuilderConfig(object):
                 self.__artifact_spec = pathspec.PathSpec.from_lines(
                     pathspec.patterns.GitWildMatchPattern, all_artifact_patterns
                 )
+                self.__artifact_matcher = CompiledPathSpec(self.__artifact_spec)
 
             self.__artifact_patterns = all_artifact_patterns
 
@@ -288,6 +347,26 @@ class BuilderConfig(object):
 
         return self.__ignore_vcs
 
+    @property
+    def vcs_file_listing(self):
+        if self.__vcs_file_listing is None:
+            if 'vcs-file-listing' in self.target_config:
+                vcs_file_listing = self.target_config['vcs-file-listing']
+                if not isinstance(vcs_file_listing, bool):
+                    raise TypeError(
+                        'Field `tool.hatch.build.targets.{}.vcs-file-listing` must be a boolean'.format(
+                            self.plugin_name
+                        )
+                    )
+            else:
+                vcs_file_listing = self.build_config.get('vcs-file-listing', False)
+                if not isinstance(vcs_file_listing, bool):
+                    raise TypeError('Field `tool.hatch.build.vcs-file-listing` must be a boolean')
+
+            self.__vcs_file_listing = vcs_file_listing
+
+        return self.__vcs_file_listing
+
     @property
     def require_runtime_dependencies(self):
         if self.__require_runtime_dependencies is None:
@@ -637,6 +716,77 @@ class BuilderConfig(object):
         with open(default_exclusion_file, 'r', encoding='utf-8') as f:
             return f.readlines()
 
+    def load_vcs_files(self):
+        """
+        Returns the paths, relative to the project root and separated by forward slashes, of every file that is
+        either tracked or untracked but not ignored, plus ignored files that are selected as artifacts, or `None`
+        if Git is unavailable or the project is not within a repository. Entries that must be walked as directories,
+        like submodules or symbolic links to directories, are listed with a trailing slash.
+        """
+        tracked_entries = self.run_git_ls_files('--cached', '--stage')
+        if tracked_entries is None:
+            return None
+
+        removed_files = self.run_git_ls_files('--deleted')
+        untracked_files = self.run_git_ls_files('--others', '--exclude-standard')
+        if removed_files is None or untracked_files is None:
+            return None
+
+        if self.artifact_spec is not None or self.build_artifact_matcher is not None:
+            ignored_files = self.run_git_ls_files('--others', '--ignored', '--exclude-standard')
+            if ignored_files is None:
+                return None
+
+            untracked_files.extend(
+                path for path in ignored_files if self.path_is_artifact(path) or self.path_is_build_artifact(path)
+            )
+
+        vcs_files = []
+        seen = set(removed_files)
+        for entry in tracked_entries:
+            # <mode> <object> <stage>\t<file>
+            metadata, _, path = entry.partition('\t')
+            if path in seen:
+                continue
+
+            seen.add(path)
+            mode = metadata.split(' ', 1)[0]
+            if mode == '160000' or (mode == '120000' and os.path.isdir(os.path.join(self.root, path))):
+                path += '/'
+
+            vcs_files.append(path)
+
+        for path in untracked_files:
+            # Git lists untracked symbolic links to directories as regular files
+            if not path.endswith('/'):
+                full_path = os.path.join(self.root, path)
+                if os.path.islink(full_path) and os.path.isdir(full_path):
+                    path += '/'
+
+            vcs_files.append(path)
+
+        return vcs_files
+
+    def run_git_ls_files(self, *args):
+        try:
+            process = subprocess.Popen(
+                ['git', 'ls-files', '-z'] + list(args),
+                cwd=self.root,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            )
+        except OSError:
+            return None
+
+        output, _ = process.communicate()
+        if process.returncode:
+            return None
+
+        if sys.version_info[0] >= 3:
+            output = os.fsdecode(output)
+
+        return [path for path in output.split('\0') if path]
+
     def normalize_build_directory(self, build_directory):
         if not os.path.isabs(build_directory):
             build_directory = os.path.join(self.root, build_directory)
@@ -669,15 +819,57 @@ class BuilderConfig(object):
                 self.build_artifact_spec = pathspec.PathSpec.from_lines(
                     pathspec.patterns.GitWildMatchPattern, build_artifacts
                 )
+                self.build_artifact_matcher = CompiledPathSpec(self.build_artifact_spec)
+                self.build_artifact_prefixes = get_pattern_prefixes(build_artifacts)
 
             self.build_force_include.update(normalize_inclusion_map(build_data['force-include'], self.root))
 
             yield
         finally:
             self.build_artifact_spec = None
+            self.build_artifact_matcher = None
+            self.build_artifact_prefixes = []
             self.build_force_include.clear()
 
 
+def get_pattern_prefixes(patterns):
+    """
+    Returns the path components that a directory must match in order for it to possibly contain files matching
+    any of the given `gitignore` style patterns, with `**` matching any number of components.
+    """
+    prefixes = []
+    for pattern in patterns:
+        pattern = pattern.strip()
+
+        # Comments are ignored and negated patterns can only ever remove matches
+        if not pattern or pattern.startswith(('#', '!')):
+            continue
+
+        pattern = pattern.rstrip('/')
+
+        # Patterns without a slash other than at the end match at any level, see
+        # https://git-scm.com/docs/gitignore#_pattern_format
+        if '/' not in pattern or '\\' in pattern:
+            prefixes.append(('**',))
+        else:
+            prefixes.append(tuple(pattern.lstrip('/').replace('[^', '[!').split('/')))
+
+    return prefixes
+
+
+def path_matches_prefixes(components, prefixes):
+    for prefix in prefixes:
+        for component, pattern in zip(components, prefix):
+            if pattern == '**':
+                return True
+            elif not fnmatchcase(component, pattern):
+                break
+        else:
+            return True
+
+    return False
+
+
 def env_var_enabled(env_var, default=False):
     if env_var in os.environ:
         return os.environ[env_var] in ('1', 'true')
@@ -4,17 +4,26 @@ from collections import OrderedDict
 
 from ..config import BuilderConfig, env_var_enabled
 from ..constants import BuildEnvVars
-from ..utils import safe_walk
+from ..utils import FileTree
 
 
 class IncludedFile(object):
-    __slots__ = ('path', 'relative_path', 'distribution_path')
+    __slots__ = ('path', 'relative_path', 'distribution_path', 'stat')
 
-    def __init__(self, path, relative_path, distribution_path):
+    def __init__(self, path, relative_path, distribution_path, stat=None):
         self.path = path
         self.relative_path = relative_path
         self.distribution_path = distribution_path
 
+        # The result of `os.stat` recorded while walking, only for files that are not symbolic links
+        self.stat = stat
+
+    def get_stat(self):
+        if self.stat is None:
+            return os.stat(self.path)
+
+        return self.stat
+
 
 class BuilderInterface(object):
     """
@@ -60,6 +69,7 @@ class BuilderInterface(object):
         self.__build_config = None
         self.__build_targets = None
         self.__target_config = None
+        self.__file_tree = None
 
         # Metadata
         self.__project_id = None
@@ -171,7 +181,12 @@ class BuilderInterface(object):
             yield explicit_file
 
     def recurse_project_files(self):
-        for root, dirs, files in safe_walk(self.root):
+        vcs_files = None
+        if self.config.vcs_file_listing and not self.config.ignore_vcs:
+            vcs_files = self.config.load_vcs_files()
+
+        walker = self.file_tree.walk_entries(self.root) if vcs_files is None else self.walk_vcs_files(vcs_files)
+        for root, dirs, files, entries in walker:
             relative_path = os.path.relpath(root, self.root)
 
             # First iteration
@@ -181,18 +196,75 @@ class BuilderInterface(object):
             dirs[:] = sorted(
                 d
                 for d in dirs
+                if self.config.path_is_reachable(os.path.join(relative_path, d))
                 # The trailing slash is necessary so e.g. `bar/` matches `foo/bar`
-                if not self.config.path_is_excluded('{}/'.format(os.path.join(relative_path, d)))
+                and not self.config.path_is_excluded('{}/'.format(os.path.join(relative_path, d)))
             )
 
-            files = sorted(files)
             is_package = '__init__.py' in files
-            for f in files:
-                relative_file_path = os.path.join(relative_path, f)
-                if self.config.include_path(relative_file_path, is_package=is_package):
-                    yield IncludedFile(
-                        os.path.join(root, f), relative_file_path, self.config.get_distribution_path(relative_file_path)
-                    )
+            for relative_file_path in self.config.include_paths(
+                sorted(os.path.join(relative_path, f) for f in files), is_package=is_package
+            ):
+                file_stat = None
+                if entries is not None:
+                    file_stat = get_entry_stat(entries[os.path.basename(relative_file_path)])
+
+                yield IncludedFile(
+                    os.path.join(self.root, relative_file_path),
+                    relative_file_path,
+                    self.config.get_distribution_path(relative_file_path),
+                    file_stat,
+                )
+
+    def walk_vcs_files(self, vcs_files):
+        """
+        Equivalent to walking the project root but only visiting the given files. Entries with a trailing slash,
+        like submodules or symlinks to directories, are walked in full.
+        """
+        tree = {}
+        physical_directories = set()
+        for vcs_file in vcs_files:
+            parts = vcs_file.rstrip('/').split('/')
+            for i in range(len(parts)):
+                tree.setdefault(os.path.join(self.root, *parts[:i]), ([], []))
+
+            path = os.path.join(self.root, *parts)
+            directory = tree[os.path.dirname(path)]
+            if vcs_file.endswith('/'):
+                physical_directories.add(path)
+                directory[0].append(parts[-1])
+            else:
+                directory[1].append(parts[-1])
+
+        for root in tree:
+            if root != self.root:
+                tree[os.path.dirname(root)][0].append(os.path.basename(root))
+
+        seen = set()
+        stack = [self.root]
+        while stack:
+            root = stack.pop()
+            if root in physical_directories:
+                for entry in self.file_tree.walk_entries(root, seen):
+                    yield entry
+
+                continue
+
+            try:
+                root_stat = os.stat(root)
+            except OSError:
+                continue
+
+            identifier = root_stat.st_dev, root_stat.st_ino
+            if identifier in seen:
+                continue
+
+            seen.add(identifier)
+            dirs, files = tree.get(root, ([], []))
+            dirs = sorted(set(dirs))
+            yield root, dirs, list(files), None
+
+            stack.extend(os.path.join(root, d) for d in reversed(dirs))
 
     def recurse_explicit_files(self, inclusion_map):
         for source, target_path in inclusion_map.items():
@@ -200,7 +272,7 @@ class BuilderInterface(object):
             if os.path.isfile(source):
                 yield IncludedFile(source, '' if external else os.path.relpath(source, self.root), target_path)
             elif os.path.isdir(source):
-                for root, dirs, files in safe_walk(source):
+                for root, dirs, files, entries in self.file_tree.walk_entries(source):
                     relative_path = os.path.relpath(root, source)
 
                     # First iteration
@@ -216,6 +288,7 @@ class BuilderInterface(object):
                             os.path.join(root, f),
                             '' if external else os.path.relpath(relative_file_path, self.root),
                             os.path.join(target_path, relative_file_path),
+                            get_entry_stat(entries[f]) if entries is not None else None,
                         )
 
     @property
@@ -332,6 +405,20 @@ class BuilderInterface(object):
 
         return self.__target_config
 
+    @property
+    def file_tree(self):
+        """
+        The cache of directory listings used to find files, which may be shared with other builders.
+        """
+        if self.__file_tree is None:
+            self.__file_tree = FileTree()
+
+        return self.__file_tree
+
+    @file_tree.setter
+    def file_tree(self, value):
+        self.__file_tree = value
+
     @property
     def project_id(self):
         if self.__project_id is None:
@@ -404,3 +491,14 @@ class BuilderInterface(object):
         https://peps.python.org/pep-0427/#escaping-and-unicode
         """
         return re.sub(r'[^\w\d.]+', '_', file_name, re.UNICODE)
+
+
+def get_entry_stat(entry):
+    # Symbolic links are left to the archives, which may treat them specially
+    try:
+        if not entry.is_symlink():
+            return entry.stat()
+    except OSError:  # no cov
+        pass
+
+    return None
@@ -1,7 +1,11 @@
 import gzip
 import os
+import struct
+import sys
 import tarfile
 import tempfile
+import zlib
+from collections import deque
 from contextlib import closing
 from copy import copy
 from io import BytesIO
@@ -11,11 +15,101 @@ from ..metadata.spec import DEFAULT_METADATA_VERSION, get_core_metadata_construc
 from ..utils.constants import DEFAULT_BUILD_SCRIPT, DEFAULT_CONFIG_FILE
 from .config import BuilderConfig
 from .plugin.interface import BuilderInterface
-from .utils import get_reproducible_timestamp, normalize_archive_path, normalize_file_permissions, replace_file
+from .utils import (
+    LARGE_FILE_CHUNK_SIZE,
+    LARGE_FILE_SIZE,
+    TEMPORARY_FILE_PREFIX,
+    MappedFileReader,
+    exclude_archive,
+    get_reproducible_timestamp,
+    normalize_archive_path,
+    normalize_file_permissions,
+    replace_file,
+)
+
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:  # no cov
+    ThreadPoolExecutor = None
+
+
+class ParallelGzipFile(object):
+    """
+    A write-only gzip stream that compresses fixed-size blocks concurrently, similar to `pigz`. Each block is primed
+    with the end of the previous block and flushed to a byte boundary so that the result is a single standard member
+    that does not depend on the number of workers.
+    """
+
+    BLOCK_SIZE = 1024 * 1024
+    DICTIONARY_SIZE = 32 * 1024
+
+    def __init__(self, fileobj, compresslevel, mtime, workers):
+        self.fileobj = fileobj
+        self.compresslevel = compresslevel
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.max_pending = workers * 2
+        self.pending = deque()
+        self.buffer = bytearray()
+        self.dictionary = b''
+        self.crc = 0
+        self.size = 0
+
+        # https://datatracker.ietf.org/doc/html/rfc1952#section-2.3
+        if compresslevel == 9:
+            extra_flags = 2
+        elif compresslevel == 1:
+            extra_flags = 4
+        else:
+            extra_flags = 0
+
+        mtime = int(get_current_timestamp() if mtime is None else mtime)
+        self.fileobj.write(struct.pack('<BBBBLBB', 0x1F, 0x8B, 8, 0, mtime, extra_flags, 255))
+
+    def write(self, data):
+        self.crc = zlib.crc32(data, self.crc)
+        self.size += len(data)
+        self.buffer += data
+
+        while len(self.buffer) >= self.BLOCK_SIZE:
+            block = bytes(self.buffer[: self.BLOCK_SIZE])
+            del self.buffer[: self.BLOCK_SIZE]
+            self.submit_block(block, False)
+
+        return len(data)
+
+    def tell(self):
+        return self.size
+
+    def submit_block(self, block, last):
+        self.pending.append(self.executor.submit(self.compress_block, block, self.dictionary, self.compresslevel, last))
+        self.dictionary = block[-self.DICTIONARY_SIZE :]
+
+        while len(self.pending) >= self.max_pending:
+            self.fileobj.write(self.pending.popleft().result())
+
+    @staticmethod
+    def compress_block(block, dictionary, compresslevel, last):
+        if dictionary:
+            compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, -zlib.MAX_WBITS, zdict=dictionary)
+        else:
+            compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, -zlib.MAX_WBITS)
+
+        return compressor.compress(block) + compressor.flush(zlib.Z_FINISH if last else zlib.Z_SYNC_FLUSH)
+
+    def close(self):
+        try:
+            # The final block must always be written to terminate the deflate stream
+            self.submit_block(bytes(self.buffer), True)
+            while self.pending:
+                self.fileobj.write(self.pending.popleft().result())
+        finally:
+            self.executor.shutdown()
+
+        self.fileobj.write(struct.pack('<LL', self.crc & 0xFFFFFFFF, self.size & 0xFFFFFFFF))
 
 
 class SdistArchive(object):
-    def __init__(self, name, reproducible):
+    def __init__(self, name, reproducible, compression_level=9, workers=1, directory=None):
         """
         https://peps.python.org/pep-0517/#source-distributions
         """
@@ -27,10 +121,18 @@ class SdistArchive(object):
         else:
             self.timestamp = None
 
-        raw_fd, self.path = tempfile.mkstemp(suffix='.tar.gz')
+        # Creating the file where it will end up allows it to be moved in place rather than copied
+        raw_fd, self.path = tempfile.mkstemp(prefix=TEMPORARY_FILE_PREFIX, suffix='.tar.gz', dir=directory)
         self.fd = os.fdopen(raw_fd, 'w+b')
-        self.gz = gzip.GzipFile(fileobj=self.fd, mode='wb', mtime=self.timestamp)
+        if workers > 1 and ThreadPoolExecutor is not None and sys.version_info[0] >= 3:
+            self.gz = ParallelGzipFile(self.fd, compression_level, self.timestamp, workers)
+        else:
+            self.gz = gzip.GzipFile(fileobj=self.fd, mode='wb', compresslevel=compression_level, mtime=self.timestamp)
         self.tf = tarfile.TarFile(fileobj=self.gz, mode='w', format=tarfile.PAX_FORMAT)
+
+        # Without compression the output depends on how the data is written, so the default chunking is kept
+        if compression_level:
+            self.tf.copybufsize = LARGE_FILE_CHUNK_SIZE
         self.gettarinfo = lambda *args, **kwargs: self.normalize_tar_metadata(self.tf.gettarinfo(*args, **kwargs))
 
     def create_file(self, contents, *relative_paths):
@@ -44,6 +146,14 @@ class SdistArchive(object):
         with closing(BytesIO(contents)) as buffer:
             self.tf.addfile(tar_info, buffer)
 
+    def add_file_data(self, tar_info, path, f):
+        # Large files are read from a memory mapping to avoid copying their contents in small chunks
+        if tar_info.size >= LARGE_FILE_SIZE and sys.version_info[0] >= 3:
+            with MappedFileReader(path) as mapped_file:
+                self.tf.addfile(tar_info, mapped_file)
+        else:
+            self.tf.addfile(tar_info, f)
+
     def normalize_tar_metadata(self, tar_info):
         if not self.reproducible:
             return tar_info
@@ -71,6 +181,9 @@ class SdistArchive(object):
         self.gz.close()
         self.fd.close()
 
+        if exc_type is not None:
+            os.remove(self.path)
+
 
 class SdistBuilderConfig(BuilderConfig):
     def __init__(self, *args, **kwargs):
@@ -78,6 +191,8 @@ class SdistBuilderConfig(BuilderConfig):
 
         self.__core_metadata_constructor = None
         self.__support_legacy = None
+        self.__compression_level = None
+        self.__workers = None
 
     @property
     def core_metadata_constructor(self):
@@ -108,6 +223,44 @@ class SdistBuilderConfig(BuilderConfig):
 
         return self.__support_legacy
 
+    @property
+    def compression_level(self):
+        if self.__compression_level is None:
+            compression_level = self.target_config.get('compression-level', 9)
+            if not isinstance(compression_level, int) or isinstance(compression_level, bool):
+                raise TypeError(
+                    'Field `tool.hatch.build.targets.{}.compression-level` must be an integer'.format(self.plugin_name)
+                )
+            elif not 0 <= compression_level <= 9:
+                raise ValueError(
+                    'Field `tool.hatch.build.targets.{}.compression-level` must be between 0 and 9'.format(
+                        self.plugin_name
+                    )
+                )
+
+            self.__compression_level = compression_level
+
+        return self.__compression_level
+
+    @property
+    def workers(self):
+        if self.__workers is None:
+            workers = self.target_config.get('workers', 1)
+            if not isinstance(workers, int) or isinstance(workers, bool):
+                raise TypeError(
+                    'Field `tool.hatch.build.targets.{}.workers` must be an integer'.format(self.plugin_name)
+                )
+            elif workers < 1:
+                raise ValueError(
+                    'Field `tool.hatch.build.targets.{}.workers` must be greater than or equal to 1'.format(
+                        self.plugin_name
+                    )
+                )
+
+            self.__workers = workers
+
+        return self.__workers
+
 
 class SdistBuilder(BuilderInterface):
     """
@@ -130,21 +283,38 @@ class SdistBuilder(BuilderInterface):
     def build_standard(self, directory, **build_data):
         found_packages = set()
 
-        with SdistArchive(self.project_id, self.config.reproducible) as archive:
-            for included_file in self.recurse_included_files():
+        with SdistArchive(
+            self.project_id,
+            self.config.reproducible,
+            compression_level=self.config.compression_level,
+            workers=self.config.workers,
+            directory=directory,
+        ) as archive:
+            for included_file in exclude_archive(self.recurse_included_files(), archive.path):
                 if self.config.support_legacy:
                     possible_package, file_name = os.path.split(included_file.relative_path)
                     if file_name == '__init__.py':
                         found_packages.add(possible_package)
 
-                tar_info = archive.gettarinfo(
-                    included_file.path,
-                    arcname=normalize_archive_path(os.path.join(self.project_id, included_file.distribution_path)),
-                )
+                arcname = normalize_archive_path(os.path.join(self.project_id, included_file.distribution_path))
+
+                # Files that are known not to be symbolic links may be described using the open file rather than
+                # resolving the path again
+                if included_file.stat is not None:
+                    with open(included_file.path, 'rb') as f:
+                        tar_info = archive.gettarinfo(arcname=arcname, fileobj=f)
+                        if tar_info.isfile():
+                            archive.add_file_data(tar_info, included_file.path, f)
+                        else:  # no cov
+                            archive.addfile(tar_info)
+
+                    continue
+
+                tar_info = archive.gettarinfo(included_file.path, arcname=arcname)
 
                 if tar_info.isfile():
                     with open(included_file.path, 'rb') as f:
-                        archive.addfile(tar_info, f)
+                        archive.add_file_data(tar_info, included_file.path, f)
                 else:  # no cov
                     # TODO: Investigate if this is necessary (for symlinks, etc.)
                     archive.addfile(tar_info)
@@ -1,8 +1,37 @@
+import hashlib
+import json
+import mmap
 import os
+import re
 import shutil
 import sys
+import zipfile
+import zlib
 from base64 import urlsafe_b64encode
+from binascii import hexlify, unhexlify
 from collections import OrderedDict
+from time import time as get_current_timestamp
+
+# Archives are first written to hidden files within the build directory, which glob patterns like `dist/*` ignore
+TEMPORARY_FILE_PREFIX = '.tmp-'
+
+# Files at least this large are memory-mapped and processed in larger chunks rather than read piece by piece
+LARGE_FILE_SIZE = 1024 * 1024
+LARGE_FILE_CHUNK_SIZE = 1024 * 1024
+
+# Internals of `ZipFile` required for writing entries that were already compressed
+ZIP_FILE_INTERNALS = ('fp', 'start_dir', '_didModify', '_writecheck')
+
+# The attribute through which `ZipFile` honors the compression level of an entry, which was added in Python 3.7 and
+# only became public in Python 3.13
+ZIP_INFO_COMPRESSION_LEVEL = next(
+    (attribute for attribute in ('compress_level', '_compresslevel') if hasattr(zipfile.ZipInfo, attribute)), None
+)
+
+try:
+    from os import scandir
+except ImportError:  # no cov
+    scandir = None
 
 if sys.version_info[0] >= 3:
 
@@ -34,6 +63,144 @@ def safe_walk(path):
         yield root, dirs, files
 
 
+class FileTree(object):
+    """
+    A cache of directory listings that may be shared by every builder within a single invocation. Cached listings
+    are only reused if the modification time of the directory is unchanged, so that files created in the meantime,
+    by build hooks for example, are always visible.
+    """
+
+    # Modifications this close to when a directory was listed may not be reflected by its modification time
+    RACY_INTERVAL = 2
+
+    def __init__(self):
+        self.listings = {}
+
+    def walk(self, path, seen=None):
+        """
+        Equivalent to `safe_walk`; directories may be pruned by modifying the yielded list in place. The identifiers
+        of visited directories are recorded in `seen`, which may be shared with other walks.
+        """
+        for root, dirs, files, _ in self.walk_entries(path, seen):
+            yield root, dirs, files
+
+    def walk_entries(self, path, seen=None):
+        """
+        Like `walk` but also yields a mapping of file names to their `os.DirEntry`, which cache the result of
+        `stat` calls, whenever the directory was just listed rather than served from the cache, otherwise `None`.
+        """
+        if seen is None:
+            seen = set()
+
+        stack = [path]
+        while stack:
+            root = stack.pop()
+            listing = self.get_listing(root)
+            if listing is None:
+                continue
+
+            identifier, dirs, files, entries = listing
+            if identifier in seen:
+                continue
+
+            seen.add(identifier)
+            dirs = list(dirs)
+            yield root, dirs, list(files), entries
+
+            stack.extend(os.path.join(root, d) for d in reversed(dirs))
+
+    def get_listing(self, path):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+
+        identifier = stat.st_dev, stat.st_ino
+        cached_listing = self.listings.get(path)
+        if cached_listing is not None:
+            cached_identifier, mtime, listing_time, dirs, files = cached_listing
+            if cached_identifier == identifier and mtime == stat.st_mtime and listing_time - mtime > self.RACY_INTERVAL:
+                return identifier, dirs, files, None
+
+        listing_time = get_current_timestamp()
+        if scandir is None:  # no cov
+            try:
+                _, dirs, files = next(os.walk(path, followlinks=True))
+            except StopIteration:
+                return None
+
+            entries = None
+        else:
+            dirs = []
+            files = []
+            entries = {}
+            try:
+                for entry in scandir(path):
+                    # Treat entries that cannot be inspected as files, like `os.walk`
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:  # no cov
+                        is_dir = False
+
+                    if is_dir:
+                        dirs.append(entry.name)
+                    else:
+                        files.append(entry.name)
+                        entries[entry.name] = entry
+            except OSError:
+                return None
+
+        self.listings[path] = identifier, stat.st_mtime, listing_time, dirs, files
+        return identifier, dirs, files, entries
+
+
+class CompiledPathSpec(object):
+    """
+    Matches paths against the patterns of a `pathspec.PathSpec` with a single regular expression for every run of
+    consecutive patterns sharing the same outcome. The runs are checked from last to first so that, like `git`,
+    the last matching pattern decides whether or not a path matches.
+    """
+
+    # Names would conflict once the expressions of multiple patterns are combined
+    NAMED_GROUP = re.compile(r'\(\?P<\w+>')
+
+    def __init__(self, spec):
+        runs = []
+        for pattern in spec.patterns:
+            # Comments and blank lines
+            if pattern.include is None:
+                continue
+
+            expression = '(?:{})'.format(self.NAMED_GROUP.sub('(?:', pattern.regex.pattern))
+            if runs and runs[-1][1] is pattern.include:
+                runs[-1][0].append(expression)
+            else:
+                runs.append(([expression], pattern.include))
+
+        self.runs = [(re.compile('|'.join(expressions)).match, include) for expressions, include in reversed(runs)]
+
+    def match_file(self, path):
+        if os.sep != '/':  # no cov
+            path = path.replace(os.sep, '/')
+
+        for match, include in self.runs:
+            if match(path) is not None:
+                return include
+
+        return False
+
+
+def exclude_archive(included_files, archive_path):
+    """
+    Skips the temporary file of an archive that is being written, which is selected like any other file whenever the
+    build directory is within the project.
+    """
+    archive_name = os.path.basename(archive_path)
+    for included_file in included_files:
+        if os.path.basename(included_file.path) != archive_name:
+            yield included_file
+
+
 def get_known_python_major_versions():
     return map(str, sorted((2, 3)))
 
@@ -73,6 +240,192 @@ def format_file_hash(digest):
     return urlsafe_b64encode(digest).decode('ascii').rstrip('=')
 
 
+def hash_file(path, file_size=0):
+    hash_obj = hashlib.sha256()
+    for chunk in iter_file_chunks(path, file_size):
+        hash_obj.update(chunk)
+
+    return hash_obj.digest()
+
+
+def iter_file_chunks(path, file_size):
+    """
+    Yields the contents of a file in chunks. Large files are memory-mapped so that the chunks are views of the mapping
+    rather than copies, which are only valid until the next chunk is requested.
+    """
+    if file_size >= LARGE_FILE_SIZE and sys.version_info[0] >= 3:
+        with MappedFileReader(path) as reader:
+            while True:
+                chunk = reader.read(LARGE_FILE_CHUNK_SIZE)
+                if not chunk:
+                    break
+
+                yield chunk
+
+        return
+
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(16384)
+            if not chunk:
+                break
+
+            yield chunk
+
+
+class MappedFileReader(object):
+    """
+    A minimal binary file object for a memory-mapped file whose reads return views rather than copies. Every view is
+    released by the next read so that the mapping can be closed deterministically.
+    """
+
+    def __init__(self, path):
+        self.mapping = None
+        self.view = memoryview(b'')
+        self.chunk = None
+        self.position = 0
+
+        with open(path, 'rb') as f:
+            # Mapping empty files is not allowed
+            if os.fstat(f.fileno()).st_size:
+                self.mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                self.view = memoryview(self.mapping)
+
+    def read(self, size=-1):
+        self.release_chunk()
+
+        start = self.position
+        end = len(self.view) if size is None or size < 0 else min(start + size, len(self.view))
+        self.position = end
+        self.chunk = self.view[start:end]
+        return self.chunk
+
+    def release_chunk(self):
+        if self.chunk is not None:
+            self.chunk.release()
+            self.chunk = None
+
+    def close(self):
+        self.release_chunk()
+        self.view.release()
+        if self.mapping is not None:
+            self.mapping.close()
+            self.mapping = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class FileHashCache(object):
+    """
+    A persistent mapping of file paths to the SHA-256 digests of their contents. Digests are only reused while the
+    size, modification time and inode of a file are unchanged. The compression level of the archives that were
+    built is recorded in the same way.
+    """
+
+    VERSION = 1
+
+    # Files modified this close to when they were hashed could change again without affecting their status
+    RACY_INTERVAL = 2
+
+    def __init__(self, path):
+        self.path = path
+        self.__entries = None
+        self.__archives = None
+
+        # Only what is used by a build is kept so that the cache does not grow indefinitely
+        self.used_entries = {}
+        self.used_archives = {}
+
+    @property
+    def entries(self):
+        if self.__entries is None:
+            self.load()
+
+        return self.__entries
+
+    @property
+    def archives(self):
+        if self.__archives is None:
+            self.load()
+
+        return self.__archives
+
+    def load(self):
+        entries = {}
+        archives = {}
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+            if data.get('version') == self.VERSION:
+                entries = data['files']
+                archives = data.get('archives', {})
+        except (EnvironmentError, KeyError, TypeError, ValueError, AttributeError):
+            pass
+
+        self.__entries = entries
+        self.__archives = archives
+
+    def get_digest(self, path, file_stat):
+        """
+        Returns the digest of the file, only reading it if there is no valid entry.
+        """
+        key = get_file_stat_key(file_stat)
+        entry = self.entries.get(path)
+        if entry is not None and entry[:3] == key:
+            self.used_entries[path] = entry
+            return unhexlify(entry[3])
+
+        digest = hash_file(path, file_stat.st_size)
+        self.set_digest(path, file_stat, digest)
+        return digest
+
+    def set_digest(self, path, file_stat, digest):
+        if get_current_timestamp() - file_stat.st_mtime > self.RACY_INTERVAL:
+            entry = get_file_stat_key(file_stat)
+            entry.append(hexlify(digest).decode('ascii'))
+            self.used_entries[path] = entry
+
+    def get_compression_level(self, path):
+        """
+        Returns the compression level of an archive if it is unchanged since it was recorded, otherwise `None`.
+        """
+        try:
+            key = get_file_stat_key(os.stat(path))
+        except OSError:
+            return None
+
+        entry = self.archives.get(path)
+        if entry is not None and entry[:3] == key:
+            return entry[3]
+
+    def set_compression_level(self, path, compression_level):
+        entry = get_file_stat_key(os.stat(path))
+        entry.append(compression_level)
+        self.used_archives[path] = entry
+
+    def save(self):
+        if self.used_entries == self.entries and self.used_archives == self.archives:
+            return
+
+        temp_path = '{}.tmp'.format(self.path)
+        with open(temp_path, 'w') as f:
+            json.dump({'version': self.VERSION, 'files': self.used_entries, 'archives': self.used_archives}, f)
+
+        replace_file(temp_path, self.path)
+
+
+def get_file_stat_key(file_stat):
+    mtime_ns = getattr(file_stat, 'st_mtime_ns', None)
+    if mtime_ns is None:  # no cov
+        mtime_ns = int(file_stat.st_mtime * 1000000000)
+
+    return [file_stat.st_size, mtime_ns, file_stat.st_ino]
+
+
 def get_reproducible_timestamp():
     """
     Returns an `int` derived from the `SOURCE_DATE_EPOCH` environment variable; see
@@ -105,3 +458,29 @@ def set_zip_info_mode(zip_info, mode=0o644):
     https://github.com/takluyver/flit/commit/3889583719888aef9f28baaa010e698cb7884904
     """
     zip_info.external_attr = mode << 16
+
+
+def write_compressed_zip_entry(zf, zip_info, compressed_data, zip64=False):
+    """
+    Write an entry whose data was already compressed as `zip_info` describes, exactly as `ZipFile.open` would for
+    a seekable file. If the internals of `ZipFile` this relies on are unavailable, the data is decompressed and
+    written with `ZipFile.writestr` instead.
+    """
+    if not all(hasattr(zf, attribute) for attribute in ZIP_FILE_INTERNALS):
+        if zip_info.compress_type == zipfile.ZIP_DEFLATED:
+            compressed_data = zlib.decompress(compressed_data, -15)
+
+        zf.writestr(zip_info, compressed_data)
+        return
+
+    zf.fp.seek(zf.start_dir)
+    zip_info.header_offset = zf.fp.tell()
+    zf._writecheck(zip_info)
+    zf._didModify = True
+
+    zf.fp.write(zip_info.FileHeader(zip64))
+    zf.fp.write(compressed_data)
+    zf.start_dir = zf.fp.tell()
+
+    zf.filelist.append(zip_info)
+    zf.NameToInfo[zip_info.filename] = zip_info
@@ -1,24 +1,36 @@
 import hashlib
 import os
 import stat
+import struct
 import sys
 import tempfile
+import time
 import zipfile
+import zlib
+from collections import deque
 from contextlib import closing
+from threading import Lock
 
 from ..__about__ import __version__
 from ..metadata.spec import DEFAULT_METADATA_VERSION, get_core_metadata_constructors
 from .config import BuilderConfig
 from .plugin.interface import BuilderInterface
 from .utils import (
+    TEMPORARY_FILE_PREFIX,
+    ZIP_INFO_COMPRESSION_LEVEL,
+    FileHashCache,
+    exclude_archive,
     format_file_hash,
     get_known_python_major_versions,
     get_reproducible_timestamp,
+    hash_file,
+    iter_file_chunks,
     normalize_archive_path,
     normalize_file_permissions,
     normalize_inclusion_map,
     replace_file,
     set_zip_info_mode,
+    write_compressed_zip_entry,
 )
 
 try:
@@ -31,11 +43,101 @@ try:
 except ImportError:  # no cov
     EditableProject = None
 
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:  # no cov
+    ThreadPoolExecutor = None
+
 EDITABLES_MINIMUM_VERSION = '0.3'
 
+# Stored in the build directory when building incrementally
+HASH_CACHE_FILE_NAME = '.hatchling-hashes.json'
+
+
+class PreviousWheelArchive(object):
+    def __init__(self, path, metadata_directory, compression):
+        """
+        A previously built wheel from which the compressed data of unchanged files may be reused.
+        """
+        self.compression = compression
+        self.fd = open(path, 'rb')
+        self.zf = zipfile.ZipFile(self.fd, 'r')
+        self.records = {}
+
+        for line in self.zf.read('{}/RECORD'.format(metadata_directory)).decode('utf-8').splitlines():
+            relative_path, hash_digest, file_size = line.rsplit(',', 2)
+            if hash_digest.startswith('sha256='):
+                self.records[relative_path] = hash_digest[7:], int(file_size)
+
+        # Workers may read concurrently from the same file descriptor
+        self.lock = Lock()
+
+    @classmethod
+    def load(cls, path, metadata_directory, compression):
+        if not os.path.isfile(path):
+            return None
+
+        try:
+            return cls(path, metadata_directory, compression)
+        except (KeyError, ValueError, zipfile.BadZipFile):
+            return None
+
+    def get_entry(self, path, relative_path, file_stat, hash_cache=None):
+        """
+        Returns the hash digest, CRC, size and compressed data of a file if it has not changed, otherwise `None`.
+        """
+        file_size = file_stat.st_size
+        record = self.records.get(relative_path)
+        if record is None or record[1] != file_size:
+            return None
+
+        zip_info = self.zf.NameToInfo.get(relative_path)
+        if (
+            zip_info is None
+            or zip_info.file_size != file_size
+            or zip_info.compress_type != self.compression
+            or zip_info.flag_bits & 0x01
+        ):
+            return None
+
+        if hash_cache is None:
+            digest = hash_file(path, file_size)
+        else:
+            digest = hash_cache.get_digest(path, file_stat)
+
+        if format_file_hash(digest) != record[0]:
+            return None
+
+        return digest, zip_info.CRC, zip_info.file_size, self.read_compressed_data(zip_info)
+
+    def read_compressed_data(self, zip_info):
+        with self.lock:
+            self.fd.seek(zip_info.header_offset)
+            header = self.fd.read(zipfile.sizeFileHeader)
+            if header[:4] != zipfile.stringFileHeader:  # no cov
+                raise zipfile.BadZipFile('Bad magic number for file header: {}'.format(zip_info.filename))
+
+            # https://pkware.cachefly.net/webdocs/casestudies/APPNOTE.TXT section 4.3.7
+            file_name_length, extra_field_length = struct.unpack('<HH', header[26:30])
+            self.fd.seek(file_name_length + extra_field_length, os.SEEK_CUR)
+            return self.fd.read(zip_info.compress_size)
+
+    def close(self):
+        self.zf.close()
+        self.fd.close()
+
 
 class WheelArchive(object):
-    def __init__(self, project_id, reproducible):
+    def __init__(
+        self,
+        project_id,
+        reproducible,
+        workers=1,
+        previous_path=None,
+        compression_level=6,
+        hash_cache=None,
+        directory=None,
+    ):
         """
         https://peps.python.org/pep-0427/#abstract
         """
@@ -43,14 +145,31 @@ class WheelArchive(object):
         self.shared_data_directory = '{}.data'.format(project_id)
 
         self.reproducible = reproducible
+        self.workers = workers
+        self.hash_cache = hash_cache
+
+        # Level 0 means that files are stored without compression
+        self.compression_level = compression_level
+        self.compression = zipfile.ZIP_DEFLATED if compression_level else zipfile.ZIP_STORED
         if self.reproducible:
             self.time_tuple = self.get_reproducible_time_tuple()
         else:
             self.time_tuple = None
 
-        raw_fd, self.path = tempfile.mkstemp(suffix='.whl')
+        # Compressed data may only be reused if it was compressed the same way, which the archive does not record
+        if (
+            previous_path is not None
+            and hash_cache is not None
+            and hash_cache.get_compression_level(previous_path) == compression_level
+        ):
+            self.previous_archive = PreviousWheelArchive.load(previous_path, self.metadata_directory, self.compression)
+        else:
+            self.previous_archive = None
+
+        # Creating the file where it will end up allows it to be moved in place rather than copied
+        raw_fd, self.path = tempfile.mkstemp(prefix=TEMPORARY_FILE_PREFIX, suffix='.whl', dir=directory)
         self.fd = os.fdopen(raw_fd, 'w+b')
-        self.zf = zipfile.ZipFile(self.fd, 'w', compression=zipfile.ZIP_DEFLATED)
+        self.zf = zipfile.ZipFile(self.fd, 'w', compression=self.compression)
 
     if sys.version_info >= (3, 6):
 
@@ -63,8 +182,60 @@ class WheelArchive(object):
 
         def add_file(self, included_file):
             relative_path = normalize_archive_path(included_file.distribution_path)
-            file_stat = os.stat(included_file.path)
+            file_stat = included_file.get_stat()
+            zip_info = self.create_zip_info(relative_path, file_stat)
 
+            # Entries written through `ZipFile` would be compressed at the default level
+            if self.compression == zipfile.ZIP_DEFLATED and ZIP_INFO_COMPRESSION_LEVEL is None:
+                entry = self.process_file(included_file.path, relative_path, file_stat)
+                return self.write_compressed_entry(relative_path, file_stat, zip_info, *entry)
+
+            if self.previous_archive is not None:
+                entry = self.previous_archive.get_entry(included_file.path, relative_path, file_stat, self.hash_cache)
+                if entry is not None:
+                    return self.write_compressed_entry(relative_path, file_stat, zip_info, *entry)
+
+            hash_obj = hashlib.sha256()
+            with self.zf.open(zip_info, 'w') as out_file:
+                for chunk in iter_file_chunks(included_file.path, file_stat.st_size):
+                    hash_obj.update(chunk)
+                    out_file.write(chunk)
+
+            if self.hash_cache is not None:
+                self.hash_cache.set_digest(included_file.path, file_stat, hash_obj.digest())
+
+            hash_digest = format_file_hash(hash_obj.digest())
+            return relative_path, hash_digest, file_stat.st_size
+
+        def add_files(self, included_files):
+            """
+            Add every file in order, yielding records. When multiple workers are configured, the reading, hashing
+            and compression happens concurrently while entries are still written in the order given.
+            """
+            if self.workers < 2 or ThreadPoolExecutor is None:
+                for included_file in included_files:
+                    yield self.add_file(included_file)
+
+                return
+
+            # Bound the number of compressed files held in memory at any given time
+            max_pending = self.workers * 4
+            pending = deque()
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                for included_file in included_files:
+                    relative_path = normalize_archive_path(included_file.distribution_path)
+                    file_stat = included_file.get_stat()
+                    zip_info = self.create_zip_info(relative_path, file_stat)
+
+                    future = executor.submit(self.process_file, included_file.path, relative_path, file_stat)
+                    pending.append((relative_path, file_stat, zip_info, future))
+                    if len(pending) >= max_pending:
+                        yield self.write_pending_entry(*pending.popleft())
+
+                while pending:
+                    yield self.write_pending_entry(*pending.popleft())
+
+        def create_zip_info(self, relative_path, file_stat):
             if self.reproducible:
                 zip_info = zipfile.ZipInfo(relative_path, self.time_tuple)
 
@@ -74,22 +245,91 @@ class WheelArchive(object):
                 if stat.S_ISDIR(file_stat.st_mode):  # no cov
                     zip_info.external_attr |= 0x10
             else:
-                zip_info = zipfile.ZipInfo.from_file(included_file.path, relative_path)
+                # Equivalent to `ZipInfo.from_file` but using the existing status rather than querying it again
+                zip_info = zipfile.ZipInfo(relative_path, time.localtime(file_stat.st_mtime)[:6])
+                zip_info.external_attr = (file_stat.st_mode & 0xFFFF) << 16
+                zip_info.file_size = file_stat.st_size
 
-            zip_info.compress_type = zipfile.ZIP_DEFLATED
+            self.set_zip_info_compression(zip_info)
+            return zip_info
 
-            hash_obj = hashlib.sha256()
-            with open(included_file.path, 'rb') as in_file, self.zf.open(zip_info, 'w') as out_file:
-                while True:
-                    chunk = in_file.read(16384)
-                    if not chunk:
-                        break
+        def set_zip_info_compression(self, zip_info):
+            zip_info.compress_type = self.compression
+            if self.compression == zipfile.ZIP_DEFLATED and ZIP_INFO_COMPRESSION_LEVEL is not None:
+                setattr(zip_info, ZIP_INFO_COMPRESSION_LEVEL, self.compression_level)
 
-                    hash_obj.update(chunk)
-                    out_file.write(chunk)
+        def process_file(self, path, relative_path, file_stat):
+            if self.previous_archive is not None:
+                entry = self.previous_archive.get_entry(path, relative_path, file_stat, self.hash_cache)
+                if entry is not None:
+                    return entry
 
-            hash_digest = format_file_hash(hash_obj.digest())
-            return relative_path, hash_digest, file_stat.st_size
+            entry = self.compress_file(path, file_stat.st_size)
+            if self.hash_cache is not None:
+                self.hash_cache.set_digest(path, file_stat, entry[0])
+
+            return entry
+
+        def compress_file(self, path, file_size=0):
+            return self.compress_chunks(iter_file_chunks(path, file_size))
+
+        def compress_chunks(self, chunks):
+            # The deflate stream does not depend on how the data is split so this is identical to the serial path
+            hash_obj = hashlib.sha256()
+            if self.compression == zipfile.ZIP_DEFLATED:
+                compressor = zlib.compressobj(self.compression_level, zlib.DEFLATED, -15)
+            else:
+                compressor = None
+
+            compressed_chunks = []
+            crc = 0
+            data_size = 0
+            for chunk in chunks:
+                hash_obj.update(chunk)
+                crc = zlib.crc32(chunk, crc)
+                data_size += len(chunk)
+                # Chunks may be views that are released once the next one is read
+                compressed_chunks.append(compressor.compress(chunk) if compressor is not None else bytes(chunk))
+
+            if compressor is not None:
+                compressed_chunks.append(compressor.flush())
+
+            return hash_obj.digest(), crc, data_size, b''.join(compressed_chunks)
+
+        def write_pending_entry(self, relative_path, file_stat, zip_info, future):
+            return self.write_compressed_entry(relative_path, file_stat, zip_info, *future.result())
+
+        def write_compressed_entry(self, relative_path, file_stat, zip_info, digest, crc, file_size, compressed_data):
+            """
+            Write an entry whose data was already compressed by a worker or reused from the previous archive.
+            """
+            self.write_compressed_data(zip_info, crc, file_size, compressed_data)
+            return relative_path, format_file_hash(digest), file_stat.st_size
+
+        def write_compressed_data(self, zip_info, crc, file_size, compressed_data):
+            # Must be determined before the sizes are known, like `ZipFile.open` does
+            zip64 = zip_info.file_size * 1.05 > zipfile.ZIP64_LIMIT
+
+            zip_info.flag_bits = 0x00
+            if not zip_info.external_attr:  # no cov
+                zip_info.external_attr = 0o600 << 16
+
+            zip_info.CRC = crc
+            zip_info.file_size = file_size
+            zip_info.compress_size = len(compressed_data)
+            if not zip64 and (file_size > zipfile.ZIP64_LIMIT or len(compressed_data) > zipfile.ZIP64_LIMIT):  # no cov
+                raise RuntimeError('File size too large, try using force_zip64')
+
+            write_compressed_zip_entry(self.zf, zip_info, compressed_data, zip64)
+
+        def write_contents(self, zip_info, contents):
+            # Entries written through `ZipFile` would be compressed at the default level
+            if self.compression == zipfile.ZIP_DEFLATED and ZIP_INFO_COMPRESSION_LEVEL is None:
+                _, crc, file_size, compressed_data = self.compress_chunks([contents])
+                zip_info.file_size = file_size
+                self.write_compressed_data(zip_info, crc, file_size, compressed_data)
+            else:
+                self.zf.writestr(zip_info, contents)
 
     else:  # no cov
 
@@ -116,6 +356,16 @@ class WheelArchive(object):
             hash_digest = format_file_hash(hash_obj.digest())
             return relative_path, hash_digest, os.stat(included_file.path).st_size
 
+        def add_files(self, included_files):
+            for included_file in included_files:
+                yield self.add_file(included_file)
+
+        def set_zip_info_compression(self, zip_info):
+            zip_info.compress_type = self.compression
+
+        def write_contents(self, zip_info, contents):
+            self.zf.writestr(zip_info, contents)
+
     def write_metadata(self, relative_path, contents):
         relative_path = '{}/{}'.format(self.metadata_directory, normalize_archive_path(relative_path))
         return self.write_file(relative_path, contents)
@@ -140,7 +390,8 @@ class WheelArchive(object):
 
         hash_obj = hashlib.sha256(contents)
         hash_digest = format_file_hash(hash_obj.digest())
-        self.zf.writestr(zip_info, contents, compress_type=zipfile.ZIP_DEFLATED)
+        self.set_zip_info_compression(zip_info)
+        self.write_contents(zip_info, contents)
 
         return relative_path, hash_digest, len(contents)
 
@@ -151,6 +402,45 @@ class WheelArchive(object):
         self.zf.close()
         self.fd.close()
 
+        if self.previous_archive is not None:
+            self.previous_archive.close()
+
+        if exc_type is not None:
+            os.remove(self.path)
+
+
+class MetadataDirectory(object):
+    def __init__(self, directory, project_id):
+        """
+        Receives the metadata of a wheel like `WheelArchive` but writes it to a `.dist-info` directory on disk, see
+        https://peps.python.org/pep-0517/#prepare-metadata-for-build-wheel
+        """
+        self.metadata_directory = '{}.dist-info'.format(project_id)
+        self.path = os.path.join(directory, self.metadata_directory)
+
+    def write_metadata(self, relative_path, contents):
+        if not isinstance(contents, bytes):
+            contents = contents.encode('utf-8')
+
+        path = os.path.join(self.path, relative_path)
+        ensure_parent_directory(path)
+        with open(path, 'wb') as f:
+            f.write(contents)
+
+        hash_digest = format_file_hash(hashlib.sha256(contents).digest())
+        relative_path = '{}/{}'.format(self.metadata_directory, normalize_archive_path(relative_path))
+        return relative_path, hash_digest, len(contents)
+
+    def add_extra_metadata_file(self, extra_metadata_file):
+        with open(extra_metadata_file.path, 'rb') as f:
+            return self.write_metadata(os.path.join('extra_metadata', extra_metadata_file.distribution_path), f.read())
+
+
+def ensure_parent_directory(path):
+    directory = os.path.dirname(path)
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+
 
 class WheelBuilderConfig(BuilderConfig):
     def __init__(self, *args, **kwargs):
@@ -167,6 +457,9 @@ class WheelBuilderConfig(BuilderConfig):
         self.__core_metadata_constructor = None
         self.__shared_data = None
         self.__extra_metadata = None
+        self.__workers = None
+        self.__incremental = None
+        self.__compression_level = None
 
     def set_default_file_selection(self):
         if self.__include or self.__exclude or self.__packages:
@@ -289,6 +582,57 @@ class WheelBuilderConfig(BuilderConfig):
 
         return self.__extra_metadata
 
+    @property
+    def workers(self):
+        if self.__workers is None:
+            workers = self.target_config.get('workers', 1)
+            if not isinstance(workers, int) or isinstance(workers, bool):
+                raise TypeError(
+                    'Field `tool.hatch.build.targets.{}.workers` must be an integer'.format(self.plugin_name)
+                )
+            elif workers < 1:
+                raise ValueError(
+                    'Field `tool.hatch.build.targets.{}.workers` must be greater than or equal to 1'.format(
+                        self.plugin_name
+                    )
+                )
+
+            self.__workers = workers
+
+        return self.__workers
+
+    @property
+    def incremental(self):
+        if self.__incremental is None:
+            incremental = self.target_config.get('incremental', False)
+            if not isinstance(incremental, bool):
+                raise TypeError(
+                    'Field `tool.hatch.build.targets.{}.incremental` must be a boolean'.format(self.plugin_name)
+                )
+
+            self.__incremental = incremental
+
+        return self.__incremental
+
+    @property
+    def compression_level(self):
+        if self.__compression_level is None:
+            compression_level = self.target_config.get('compression-level', 6)
+            if not isinstance(compression_level, int) or isinstance(compression_level, bool):
+                raise TypeError(
+                    'Field `tool.hatch.build.targets.{}.compression-level` must be an integer'.format(self.plugin_name)
+                )
+            elif not 0 <= compression_level <= 9:
+                raise ValueError(
+                    'Field `tool.hatch.build.targets.{}.compression-level` must be between 0 and 9'.format(
+                        self.plugin_name
+                    )
+                )
+
+            self.__compression_level = compression_level
+
+        return self.__compression_level
+
 
 class WheelBuilder(BuilderInterface):
     """
@@ -297,6 +641,12 @@ class WheelBuilder(BuilderInterface):
 
     PLUGIN_NAME = 'wheel'
 
+    def __init__(self, *args, **kwargs):
+        super(WheelBuilder, self).__init__(*args, **kwargs)
+
+        # A directory created by `prepare_metadata` from which the core metadata will be reused
+        self.prepared_metadata_directory = None
+
     def get_version_api(self):
         return {'standard': self.build_standard, 'editable': self.build_editable}
 
@@ -305,7 +655,7 @@ class WheelBuilder(BuilderInterface):
 
     def clean(self, directory, versions):
         for filename in os.listdir(directory):
-            if filename.endswith('.whl'):
+            if filename.endswith('.whl') or filename == HASH_CACHE_FILE_NAME:
                 os.remove(os.path.join(directory, filename))
 
     def build_standard(self, directory, **build_data):
@@ -319,9 +669,25 @@ class WheelBuilder(BuilderInterface):
             else:
                 build_data['tag'] = self.get_default_tag()
 
-        with WheelArchive(self.project_id, self.config.reproducible) as archive, closing(StringIO()) as records:
-            for included_file in self.recurse_included_files():
-                record = archive.add_file(included_file)
+        target = os.path.join(directory, '{}-{}.whl'.format(self.project_id, build_data['tag']))
+
+        if self.config.incremental:
+            previous_path = target
+            hash_cache = FileHashCache(os.path.join(directory, HASH_CACHE_FILE_NAME))
+        else:
+            previous_path = None
+            hash_cache = None
+
+        with WheelArchive(
+            self.project_id,
+            self.config.reproducible,
+            workers=self.config.workers,
+            previous_path=previous_path,
+            compression_level=self.config.compression_level,
+            hash_cache=hash_cache,
+            directory=directory,
+        ) as archive, closing(StringIO()) as records:
+            for record in archive.add_files(exclude_archive(self.recurse_included_files(), archive.path)):
                 records.write(self.format_record(record))
 
             self.write_data(archive, records, build_data)
@@ -329,9 +695,11 @@ class WheelBuilder(BuilderInterface):
             records.write(u'{}/RECORD,,\n'.format(archive.metadata_directory))
             archive.write_metadata('RECORD', records.getvalue())
 
-        target = os.path.join(directory, '{}-{}.whl'.format(self.project_id, build_data['tag']))
-
         replace_file(archive.path, target)
+        if hash_cache is not None:
+            hash_cache.set_compression_level(target, self.config.compression_level)
+            hash_cache.save()
+
         return target
 
     def build_editable(self, directory, **build_data):
@@ -343,57 +711,19 @@ class WheelBuilder(BuilderInterface):
     def build_editable_detection(self, directory, **build_data):
         build_data['tag'] = self.get_default_tag()
 
-        with WheelArchive(self.project_id, self.config.reproducible) as archive, closing(StringIO()) as records:
-            exposed_packages = {}
-            for included_file in self.recurse_included_files():
-                if not included_file.path.endswith('.py'):
-                    continue
-
-                relative_path = included_file.relative_path
-                if not relative_path:
-                    continue
-
-                distribution_path = included_file.distribution_path
-                path_parts = relative_path.split(os.sep)
-
-                # Root file
-                if len(path_parts) == 1:  # no cov
-                    exposed_packages[os.path.splitext(relative_path)[0]] = os.path.join(self.root, relative_path)
-                    continue
-
-                # Root package
-                root_module = path_parts[0]
-                if distribution_path == relative_path:
-                    exposed_packages[root_module] = os.path.join(self.root, root_module)
-                else:
-                    distribution_module = distribution_path.split(os.sep)[0]
-                    exposed_packages[distribution_module] = os.path.join(
-                        self.root,
-                        '{}{}'.format(relative_path[: relative_path.index(distribution_path)], distribution_module),
-                    )
-
-            editable_project = EditableProject(self.metadata.core.name, self.root)
-
-            if self.config.dev_mode_exact:
-                for module, relative_path in exposed_packages.items():
-                    editable_project.map(module, relative_path)
-            else:
-                for relative_path in exposed_packages.values():
-                    editable_project.add_to_path(os.path.dirname(relative_path))
+        with WheelArchive(
+            self.project_id,
+            self.config.reproducible,
+            compression_level=self.config.compression_level,
+            directory=directory,
+        ) as archive, closing(StringIO()) as records:
+            editable_project = self.get_editable_project()
 
             for filename, content in sorted(editable_project.files()):
                 record = archive.write_file(filename, content)
                 records.write(self.format_record(record))
 
-            extra_dependencies = []
-            for dependency in editable_project.dependencies():
-                if dependency == 'editables':
-                    dependency += '~={}'.format(EDITABLES_MINIMUM_VERSION)
-                else:  # no cov
-                    pass
-
-                extra_dependencies.append(dependency)
-
+            extra_dependencies = self.get_editable_dependencies(editable_project)
             self.write_data(archive, records, build_data, extra_dependencies=extra_dependencies)
 
             records.write(u'{}/RECORD,,\n'.format(archive.metadata_directory))
@@ -404,10 +734,68 @@ class WheelBuilder(BuilderInterface):
         replace_file(archive.path, target)
         return target
 
+    def get_editable_project(self):
+        exposed_packages = {}
+        for included_file in self.recurse_included_files():
+            if not included_file.path.endswith('.py'):
+                continue
+
+            relative_path = included_file.relative_path
+            if not relative_path:
+                continue
+
+            distribution_path = included_file.distribution_path
+            path_parts = relative_path.split(os.sep)
+
+            # Root file
+            if len(path_parts) == 1:  # no cov
+                exposed_packages[os.path.splitext(relative_path)[0]] = os.path.join(self.root, relative_path)
+                continue
+
+            # Root package
+            root_module = path_parts[0]
+            if distribution_path == relative_path:
+                exposed_packages[root_module] = os.path.join(self.root, root_module)
+            else:
+                distribution_module = distribution_path.split(os.sep)[0]
+                exposed_packages[distribution_module] = os.path.join(
+                    self.root,
+                    '{}{}'.format(relative_path[: relative_path.index(distribution_path)], distribution_module),
+                )
+
+        editable_project = EditableProject(self.metadata.core.name, self.root)
+
+        if self.config.dev_mode_exact:
+            for module, relative_path in exposed_packages.items():
+                editable_project.map(module, relative_path)
+        else:
+            for relative_path in exposed_packages.values():
+                editable_project.add_to_path(os.path.dirname(relative_path))
+
+        return editable_project
+
+    @staticmethod
+    def get_editable_dependencies(editable_project):
+        extra_dependencies = []
+        for dependency in editable_project.dependencies():
+            if dependency == 'editables':
+                dependency += '~={}'.format(EDITABLES_MINIMUM_VERSION)
+            else:  # no cov
+                pass
+
+            extra_dependencies.append(dependency)
+
+        return extra_dependencies
+
     def build_editable_explicit(self, directory, **build_data):
         build_data['tag'] = self.get_default_tag()
 
-        with WheelArchive(self.project_id, self.config.reproducible) as archive, closing(StringIO()) as records:
+        with WheelArchive(
+            self.project_id,
+            self.config.reproducible,
+            compression_level=self.config.compression_level,
+            directory=directory,
+        ) as archive, closing(StringIO()) as records:
             directories = sorted(
                 os.path.normpath(os.path.join(self.root, relative_directory))
                 for relative_directory in self.config.dev_mode_dirs
@@ -428,6 +816,27 @@ class WheelBuilder(BuilderInterface):
         replace_file(archive.path, target)
         return target
 
+    def prepare_metadata(self, directory, version='standard'):
+        """
+        Writes only the `.dist-info` directory of the wheel that would be built for the given version and returns its
+        path. Build hooks are not run, so the `WHEEL` file reflects the default build data.
+        """
+        # Fail early for invalid project metadata
+        self.metadata.core.validate_fields()
+
+        extra_dependencies = ()
+        if version == 'editable' and sys.version_info[0] >= 3 and not self.config.dev_mode_dirs:
+            extra_dependencies = self.get_editable_dependencies(self.get_editable_project())
+
+        build_data = self.get_default_build_data()
+        build_data['tag'] = self.get_default_tag()
+
+        metadata_directory = MetadataDirectory(directory, self.project_id)
+        with closing(StringIO()) as records:
+            self.write_metadata(metadata_directory, records, build_data, extra_dependencies=extra_dependencies)
+
+        return metadata_directory.path
+
     def write_data(self, archive, records, build_data, extra_dependencies=()):
         self.add_shared_data(archive, records)
 
@@ -476,9 +885,20 @@ class WheelBuilder(BuilderInterface):
         records.write(self.format_record(record))
 
     def write_project_metadata(self, archive, records, extra_dependencies=()):
-        record = archive.write_metadata(
-            'METADATA', self.config.core_metadata_constructor(self.metadata, extra_dependencies=extra_dependencies)
-        )
+        prepared_metadata_file = None
+        if self.prepared_metadata_directory is not None:
+            prepared_metadata_file = os.path.join(self.prepared_metadata_directory, 'METADATA')
+
+        # Wheels must have metadata identical to what was prepared, see
+        # https://peps.python.org/pep-0517/#build-wheel
+        if prepared_metadata_file is not None and os.path.isfile(prepared_metadata_file):
+            with open(prepared_metadata_file, 'rb') as f:
+                record = archive.write_metadata('METADATA', f.read())
+        else:
+            record = archive.write_metadata(
+                'METADATA', self.config.core_metadata_constructor(self.metadata, extra_dependencies=extra_dependencies)
+            )
+
         records.write(self.format_record(record))
 
     def add_licenses(self, archive, records):
@@ -3,6 +3,7 @@ import sys
 
 from .build import build_command
 from .dep import dep_command
+from .serve import serve_command
 from .version import version_command
 
 
@@ -19,6 +20,7 @@ def hatchling():
 
     build_command(subparsers, defaults)
     dep_command(subparsers, defaults)
+    serve_command(subparsers, defaults)
     version_command(subparsers, defaults)
 
     kwargs = vars(parser.parse_args())
@@ -3,22 +3,52 @@ import argparse
 
 def build_impl(called_by_app, directory, targets, hooks_only, no_hooks, clean, clean_hooks_after, clean_only):
     import os
-    from collections import OrderedDict
 
     from ...bridge.app import get_application
-    from ...builders.constants import BuildEnvVars
     from ...metadata.core import ProjectMetadata
     from ...plugin.manager import PluginManager
 
     app = get_application(called_by_app)
 
-    if hooks_only and no_hooks:
-        app.abort('Cannot use both --hooks-only and --no-hooks together')
-
     root = os.getcwd()
     plugin_manager = PluginManager()
     metadata = ProjectMetadata(root, plugin_manager)
 
+    build_project(
+        app,
+        metadata,
+        directory=directory,
+        targets=targets,
+        hooks_only=hooks_only,
+        no_hooks=no_hooks,
+        clean=clean,
+        clean_hooks_after=clean_hooks_after,
+        clean_only=clean_only,
+    )
+
+
+def build_project(
+    app,
+    metadata,
+    directory=None,
+    targets=None,
+    hooks_only=None,
+    no_hooks=None,
+    clean=None,
+    clean_hooks_after=None,
+    clean_only=False,
+):
+    import os
+    from collections import OrderedDict
+
+    from ...builders.constants import BuildEnvVars
+    from ...builders.utils import FileTree
+
+    if hooks_only and no_hooks:
+        app.abort('Cannot use both --hooks-only and --no-hooks together')
+
+    plugin_manager = metadata.plugin_manager
+
     target_data = OrderedDict()
     if targets:
         for data in targets:
@@ -48,6 +78,9 @@ def build_impl(called_by_app, directory, targets, hooks_only, no_hooks, clean, c
     if no_hooks:
         os.environ[BuildEnvVars.NO_HOOKS] = 'true'
 
+    # Every target walks the same project tree
+    file_tree = FileTree()
+
     for i, (target_name, versions) in enumerate(target_data.items()):
         # Separate targets with a blank line
         if not clean_only and i != 0:  # no cov
@@ -60,6 +93,7 @@ def build_impl(called_by_app, directory, targets, hooks_only, no_hooks, clean, c
             app.display_mini_header(target_name)
 
         builder = builder_class(root, plugin_manager=plugin_manager, metadata=metadata, app=app.get_safe_application())
+        builder.file_tree = file_tree
 
         for artifact in builder.build(
             directory=directory,
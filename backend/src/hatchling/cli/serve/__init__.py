@@ -0,0 +1,55 @@
+import argparse
+import os
+
+
+def serve_impl(called_by_app):
+    import json
+    import sys
+    import traceback
+
+    from ...bridge.app import get_application, send_build_result
+    from ...metadata.core import ProjectMetadata
+    from ...plugin.manager import PluginManager
+    from ..build import build_project
+
+    app = get_application(called_by_app)
+
+    root = os.getcwd()
+    # Plugins are only discovered once for all builds
+    plugin_manager = PluginManager()
+
+    # To avoid blocking never use a pipe's file descriptor iterator. See https://bugs.python.org/issue3907
+    for line in iter(sys.stdin.readline, ''):
+        line = line.strip()
+        if not line:
+            continue
+
+        original_environ = dict(os.environ)
+        code = 0
+        try:
+            build_kwargs = json.loads(line)
+            if not isinstance(build_kwargs, dict):
+                raise TypeError('Build requests must be JSON objects')
+
+            # We guarantee that builds occur within the project directory
+            os.chdir(build_kwargs.pop('root', None) or root)
+
+            build_project(app, ProjectMetadata(os.getcwd(), plugin_manager), **build_kwargs)
+        except SystemExit as e:
+            code = e.code if isinstance(e.code, int) else 1
+        except Exception:
+            traceback.print_exc()
+            code = 1
+        finally:
+            # Builders set process-wide environment variables
+            os.environ.clear()
+            os.environ.update(original_environ)
+            os.chdir(root)
+
+        send_build_result(code)
+
+
+def serve_command(subparsers, defaults):
+    parser = subparsers.add_parser('serve')
+    parser.add_argument('--app', dest='called_by_app', action='store_true', help=argparse.SUPPRESS)
+    parser.set_defaults(func=serve_impl)
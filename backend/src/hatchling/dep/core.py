@@ -1,3 +1,4 @@
+import os
 import re
 import sys
 
@@ -12,10 +13,13 @@ except ImportError:  # no cov
 
 class DistributionCache:
     def __init__(self, sys_path):
+        self._sys_path = sys_path
         self._resolver = Distribution.discover(context=DistributionFinder.Context(path=sys_path))
         self._distributions = {}
         self._search_exhausted = False
         self._canonical_regex = re.compile(r'[-_.]+')
+        self._index = None
+        self._index_complete = True
 
     def __getitem__(self, item):
         item = self._canonical_regex.sub('-', item).lower()
@@ -27,6 +31,19 @@ class DistributionCache:
         elif self._search_exhausted:  # no cov
             return
 
+        if self._index is None:
+            self._index = self._build_index()
+
+        distribution_path = self._index.get(item)
+        if distribution_path is not None:
+            distribution = Distribution.at(distribution_path)
+            name = distribution.metadata.get('Name')
+            if name is not None and self._canonical_regex.sub('-', name).lower() == item:
+                self._distributions[item] = distribution
+                return distribution
+        elif self._index_complete:
+            return
+
         for distribution in self._resolver:
             name = self._canonical_regex.sub('-', distribution.metadata.get('Name')).lower()
             self._distributions[name] = distribution
@@ -35,6 +52,32 @@ class DistributionCache:
 
         self._search_exhausted = True
 
+    def _build_index(self):
+        # Metadata directories are named after the project, so only the metadata of requested distributions is read
+        index = {}
+        for path in self._sys_path:
+            # Eggs and archives store their metadata in ways that directory names do not reveal
+            if path.endswith('.egg') or (os.path.exists(path) and not os.path.isdir(path)):
+                self._index_complete = False
+                continue
+
+            try:
+                entries = os.listdir(path or '.')
+            except OSError:
+                continue
+
+            for entry in entries:
+                project_name, extension = os.path.splitext(entry)
+                if extension.lower() not in ('.dist-info', '.egg-info'):
+                    continue
+
+                # Legacy installations may write `.egg-info` files rather than directories, which are read the same way
+                distribution_path = os.path.join(path, entry)
+                project_name = self._canonical_regex.sub('-', project_name.split('-', 1)[0]).lower()
+                index.setdefault(project_name, distribution_path)
+
+        return index
+
 
 def dependency_in_sync(requirement, environment, installed_distributions):
     if requirement.marker and not requirement.marker.evaluate(environment):
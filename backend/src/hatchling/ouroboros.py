@@ -69,6 +69,7 @@ def build_wheel(wheel_directory, config_settings=None, metadata_directory=None):
     from .builders.wheel import WheelBuilder
 
     builder = WheelBuilder(os.getcwd(), config=CONFIG)
+    builder.prepared_metadata_directory = metadata_directory
     return os.path.basename(next(builder.build(wheel_directory, ['standard'])))
 
 
@@ -79,9 +80,30 @@ def build_editable(wheel_directory, config_settings=None, metadata_directory=Non
     from .builders.wheel import WheelBuilder
 
     builder = WheelBuilder(os.getcwd(), config=CONFIG)
+    builder.prepared_metadata_directory = metadata_directory
     return os.path.basename(next(builder.build(wheel_directory, ['editable'])))
 
 
+def prepare_metadata_for_build_wheel(metadata_directory, config_settings=None):
+    """
+    https://peps.python.org/pep-0517/#prepare-metadata-for-build-wheel
+    """
+    from .builders.wheel import WheelBuilder
+
+    builder = WheelBuilder(os.getcwd(), config=CONFIG)
+    return os.path.basename(builder.prepare_metadata(metadata_directory, 'standard'))
+
+
+def prepare_metadata_for_build_editable(metadata_directory, config_settings=None):
+    """
+    https://peps.python.org/pep-0660/#prepare-metadata-for-build-editable
+    """
+    from .builders.wheel import WheelBuilder
+
+    builder = WheelBuilder(os.getcwd(), config=CONFIG)
+    return os.path.basename(builder.prepare_metadata(metadata_directory, 'editable'))
+
+
 def get_requires_for_build_sdist(config_settings=None):
     """
     https://peps.python.org/pep-0517/#get-requires-for-build-sdist
@@ -8,20 +8,18 @@ from ..project.core import Project
 from ..utils.ci import running_in_ci
 from ..utils.fs import Path
 from .application import Application
-from .build import build
-from .clean import clean
-from .config import config
-from .dep import dep
-from .env import env
-from .new import new
-from .publish import publish
-from .run import run
-from .shell import shell
-from .status import status
-from .version import version
-
-
-@click.group(context_settings={'help_option_names': ['-h', '--help']}, invoke_without_command=True)
+from .lazy import LazyGroup
+
+
+@click.group(
+    cls=LazyGroup,
+    context_settings={'help_option_names': ['-h', '--help']},
+    invoke_without_command=True,
+    lazy_subcommands={
+        name: f'hatch.cli.{name}:{name}'
+        for name in ('build', 'clean', 'config', 'dep', 'env', 'new', 'publish', 'run', 'shell', 'status', 'version')
+    },
+)
 @click.option(
     '--env',
     '-e',
@@ -139,22 +137,20 @@ def hatch(ctx: click.Context, env_name, project, color, interactive, verbose, qu
         app.abort(f'Error loading configuration: {e}')
 
     app.config.terminal.styles.parse_fields()
-    errors = app.initialize_styles(app.config.terminal.styles.raw_data)
-    if errors and color is not False and not app.quiet:  # no cov
-        for error in errors:
-            app.display_warning(error)
+    app.initialize_styles(app.config.terminal.styles.raw_data)
 
     app.data_dir = Path(data_dir or app.config.dirs.data)
     app.cache_dir = Path(cache_dir or app.config.dirs.cache)
+    project_cache_dir = app.cache_dir / 'project'
 
     if project:
-        app.project = Project.from_config(app.config, project)
+        app.project = Project.from_config(app.config, project, project_cache_dir)
         if app.project is None or app.project.root is None:
             app.abort(f'Unable to locate project {project}')
 
         return
 
-    app.project = Project(Path.cwd())
+    app.project = Project(Path.cwd(), cache_directory=project_cache_dir)
 
     if app.config.mode == 'local':
         return
@@ -164,7 +160,7 @@ def hatch(ctx: click.Context, env_name, project, color, interactive, verbose, qu
             app.display_warning('Mode is set to `project` but no project is set, defaulting to the current directory')
             return
 
-        possible_project = Project.from_config(app.config, app.config.project)
+        possible_project = Project.from_config(app.config, app.config.project, project_cache_dir)
         if possible_project is None:
             app.display_warning(f'Unable to locate project {app.config.project}, defaulting to the current directory')
         else:
@@ -176,7 +172,7 @@ def hatch(ctx: click.Context, env_name, project, color, interactive, verbose, qu
             app.display_warning('Mode is set to `aware` but no project is set, defaulting to the current directory')
             return
 
-        possible_project = Project.from_config(app.config, app.config.project)
+        possible_project = Project.from_config(app.config, app.config.project, project_cache_dir)
         if possible_project is None:
             app.display_warning(f'Unable to locate project {app.config.project}, defaulting to the current directory')
         else:
@@ -185,18 +181,5 @@ def hatch(ctx: click.Context, env_name, project, color, interactive, verbose, qu
         return
 
 
-hatch.add_command(build)
-hatch.add_command(clean)
-hatch.add_command(config)
-hatch.add_command(dep)
-hatch.add_command(env)
-hatch.add_command(new)
-hatch.add_command(publish)
-hatch.add_command(run)
-hatch.add_command(shell)
-hatch.add_command(status)
-hatch.add_command(version)
-
-
 def main():  # no cov
     return hatch(windows_expand_args=False)
@@ -36,22 +36,28 @@ class Application(Terminal):
         return self.config_file.model
 
     def get_environment(self, env_name=None):
+        from ..env.utils import accepts_cache_directory
+
         if env_name is None:
             env_name = self.env
 
-        if env_name not in self.project.config.envs:
+        config = self.project.config.get_env(env_name)
+        if config is None:
             self.abort(f'Unknown environment: {env_name}')
 
-        config = self.project.config.envs[env_name]
         environment_type = config['type']
         environment_class = self.plugins.environment.get(environment_type)
         if environment_class is None:
             self.abort(f'Environment `{env_name}` has unknown type: {environment_type}')
 
-        self.project.config.finalize_env_overrides(environment_class.get_option_types())
+        self.project.config.finalize_env_overrides(environment_class.get_option_types(), env_name)
 
         data_dir = self.get_env_directory(environment_type)
 
+        env_kwargs = {}
+        if accepts_cache_directory(environment_class):
+            env_kwargs['cache_directory'] = self.cache_dir / 'env' / environment_type
+
         return environment_class(
             self.project.location,
             self.project.metadata,
@@ -61,6 +67,7 @@ class Application(Terminal):
             self.platform,
             self.verbosity,
             self.get_safe_application(),
+            **env_kwargs,
         )
 
     # Ensure that this method is clearly written since it is
@@ -113,6 +120,38 @@ class Application(Terminal):
                     else:
                         self.abort(code=process.returncode)
 
+    def run_hatch_processes(self, commands: dict[str, list[str]], workers: int | None = None):
+        """
+        Run every Hatch command in a separate process, up to `workers` at a time, and yield the name,
+        exit code and output of each in the given order as soon as it and all that precede it finish.
+        """
+        import os
+        import sys
+        from concurrent.futures import ThreadPoolExecutor
+
+        base_command = [sys.executable, '-m', 'hatch', '--no-interactive']
+        base_command.append('--color' if self.console.color_system is not None else '--no-color')
+        if self.verbosity:
+            base_command.append(f'-{("v" if self.verbosity > 0 else "q") * abs(self.verbosity)}')
+
+        base_command.extend(('--data-dir', str(self.data_dir), '--cache-dir', str(self.cache_dir)))
+        base_command.extend(('--config', str(self.config_file.path)))
+        if self.project.chosen_name:
+            base_command.extend(('--project', self.project.chosen_name))
+
+        def run_process(command):
+            with self.platform.capture_process(command, stdin=self.platform.modules.subprocess.DEVNULL) as process:
+                output, _ = process.communicate()
+
+            return process.returncode, output.decode('utf-8', 'replace').rstrip('\n')
+
+        with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+            futures = {
+                name: executor.submit(run_process, [*base_command, *command]) for name, command in commands.items()
+            }
+            for name, future in futures.items():
+                yield (name, *future.result())
+
     def get_env_directory(self, environment_type):
         directories = self.config.dirs.env
 
@@ -1,3 +1,5 @@
+from contextlib import ExitStack, contextmanager
+
 import click
 
 
@@ -41,12 +43,18 @@ import click
         '[env var: `HATCH_BUILD_CLEAN_HOOKS_AFTER`]'
     ),
 )
+@click.option(
+    '--batch',
+    is_flag=True,
+    help=(
+        'Whether or not to send the builds of consecutive targets that share a build environment '
+        'to a single backend process, which lasts until the command finishes'
+    ),
+)
 @click.option('--clean-only', is_flag=True, hidden=True)
 @click.pass_obj
-def build(app, location, targets, hooks_only, no_hooks, ext, clean, clean_hooks_after, clean_only):
+def build(app, location, targets, hooks_only, no_hooks, ext, clean, clean_hooks_after, batch, clean_only):
     """Build a project."""
-    import pickle
-
     from hatchling.builders.constants import BuildEnvVars
     from hatchling.builders.plugin.interface import BuilderInterface
 
@@ -77,8 +85,19 @@ def build(app, location, targets, hooks_only, no_hooks, ext, clean, clean_hooks_
     if no_hooks:
         env_vars[BuildEnvVars.NO_HOOKS] = 'true'
 
-    with app.project.location.as_cwd(env_vars):
+    build_options = {
+        'directory': path,
+        'hooks_only': hooks_only,
+        'no_hooks': no_hooks,
+        'clean': clean,
+        'clean_hooks_after': clean_hooks_after,
+        'clean_only': clean_only,
+    }
+
+    with app.project.location.as_cwd(env_vars), ExitStack() as build_server_stack:
         environment = app.get_environment()
+        build_server = None
+        build_server_dependencies = None
 
         for i, target in enumerate(targets):
             # Separate targets with a blank line
@@ -93,33 +112,82 @@ def build(app, location, targets, hooks_only, no_hooks, ext, clean, clean_hooks_
             with environment.get_env_vars(), EnvVars(env_vars):
                 dependencies.extend(builder.config.dependencies)
 
+            if batch:
+                if build_server is None or dependencies != build_server_dependencies:
+                    build_server_stack.close()
+                    build_server = build_server_stack.enter_context(start_build_server(app, environment, dependencies))
+                    build_server_dependencies = dependencies
+
+                returncode = send_build_request(
+                    app, build_server, environment.construct_build_request(targets=(target,), **build_options)
+                )
+                if returncode:
+                    app.abort(code=returncode)
+
+                continue
+
             with app.status_waiting('Setting up build environment') as status:
                 with environment.build_environment(dependencies) as build_environment:
                     status.stop()
 
-                    build_process = environment.get_build_process(
-                        build_environment,
-                        directory=path,
-                        targets=(target,),
-                        hooks_only=hooks_only,
-                        no_hooks=no_hooks,
-                        clean=clean,
-                        clean_hooks_after=clean_hooks_after,
-                        clean_only=clean_only,
-                    )
+                    build_process = environment.get_build_process(build_environment, targets=(target,), **build_options)
 
                     with build_process:
-                        for line in app.platform.stream_process_output(build_process):
-                            indicator, _, procedure = line.partition(':')
-                            if indicator != '__HATCH__':  # no cov
-                                app.display_info(line, end='')
-                                continue
-
-                            method, args, kwargs = pickle.loads(bytes.fromhex(procedure.rstrip()))
-                            if method == 'abort':
-                                build_process.communicate()
-
-                            getattr(app, method)(*args, **kwargs)
+                        process_build_output(app, build_process, app.platform.stream_process_output(build_process))
 
                     if build_process.returncode:
                         app.abort(code=build_process.returncode)
+
+
+def process_build_output(app, build_process, lines):
+    import pickle
+
+    for line in lines:
+        indicator, _, procedure = line.partition(':')
+        if indicator != '__HATCH__':  # no cov
+            app.display_info(line, end='')
+            continue
+
+        method, args, kwargs = pickle.loads(bytes.fromhex(procedure.rstrip()))
+        if method == 'abort':
+            build_process.communicate()
+
+        getattr(app, method)(*args, **kwargs)
+
+
+@contextmanager
+def start_build_server(app, environment, dependencies):
+    with app.status_waiting('Setting up build environment') as status:
+        with environment.build_environment(dependencies) as build_environment:
+            status.stop()
+
+            # Exiting closes the server's input, which makes it stop after any ongoing build
+            with environment.get_build_server_process(build_environment) as build_server:
+                yield build_server
+
+
+def send_build_request(app, build_server, request):
+    build_server.stdin.write(request)
+    build_server.stdin.flush()
+
+    returncode = None
+    build_output = app.platform.stream_process_output(build_server)
+
+    def iter_request_output():
+        nonlocal returncode
+
+        for line in build_output:
+            indicator, _, result = line.partition(':')
+            if indicator == '__HATCH_SERVER__':
+                returncode = int(result)
+                return
+
+            yield line
+
+    process_build_output(app, build_server, iter_request_output())
+
+    # The server stopped before reporting the result of the build
+    if returncode is None:
+        returncode = build_server.wait() or 1
+
+    return returncode
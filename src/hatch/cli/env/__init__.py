@@ -1,21 +1,14 @@
 import click
 
-from .create import create
-from .find import find
-from .prune import prune
-from .remove import remove
-from .run import run
-from .show import show
+from ..lazy import LazyGroup
 
 
-@click.group(short_help='Manage project environments')
+@click.group(
+    cls=LazyGroup,
+    short_help='Manage project environments',
+    lazy_subcommands={
+        name: f'hatch.cli.env.{name}:{name}' for name in ('create', 'find', 'prune', 'remove', 'run', 'show')
+    },
+)
 def env():
     pass
-
-
-env.add_command(create)
-env.add_command(find)
-env.add_command(prune)
-env.add_command(remove)
-env.add_command(run)
-env.add_command(show)
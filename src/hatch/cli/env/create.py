@@ -3,12 +3,24 @@ import click
 
 @click.command(short_help='Create environments')
 @click.argument('env_name', default='default')
+@click.option(
+    '--parallel',
+    '-j',
+    'workers',
+    type=click.IntRange(min=0),
+    help='The number of environments to create concurrently, with 0 meaning the number of CPUs',
+)
 @click.pass_obj
-def create(app, env_name):
-    """Create environments."""
+def create(app, env_name, workers):
+    """
+    Create environments.
+
+    The `-j`/`--parallel` option creates up to the given number of environments at once, each in a separate
+    process. All environments are created even if some fail, in which case the first non-zero exit code is used.
+    """
     root_env_name = env_name
     project_config = app.project.config
-    if root_env_name not in project_config.envs and root_env_name not in project_config.matrices:
+    if project_config.get_env(root_env_name) is None and root_env_name not in project_config.matrices:
         app.abort(f'Environment `{root_env_name}` is not defined by project config')
 
     if root_env_name in project_config.matrices:
@@ -17,6 +29,7 @@ def create(app, env_name):
         environments = [root_env_name]
 
     incompatible = {}
+    parallel_environments = []
     for env_name in environments:
         environment = app.get_environment(env_name)
 
@@ -33,8 +46,24 @@ def create(app, env_name):
             app.display_warning(f'Environment `{env_name}` already exists')
             continue
 
+        if workers is not None:
+            parallel_environments.append(env_name)
+            continue
+
         app.prepare_environment(environment)
 
+    failed = {}
+    if parallel_environments:
+        num_parallel = len(parallel_environments)
+        commands = {env_name: ['env', 'create', env_name] for env_name in parallel_environments}
+        with app.status_waiting(f'Creating {num_parallel} environment{"s" if num_parallel > 1 else ""}'):
+            for env_name, returncode, output in app.run_hatch_processes(commands, workers):
+                if output:
+                    app.display_raw(output)
+
+                if returncode:
+                    failed[env_name] = returncode
+
     if incompatible:
         num_incompatible = len(incompatible)
         app.display_warning(
@@ -42,3 +71,11 @@ def create(app, env_name):
         )
         for env_name, reason in incompatible.items():
             app.display_warning(f'{env_name} -> {reason}')
+
+    if failed:
+        num_failed = len(failed)
+        app.display_error(f'Failed to create {num_failed} environment{"s" if num_failed > 1 else ""}:')
+        for env_name, returncode in failed.items():
+            app.display_error(f'{env_name} -> exit code {returncode}')
+
+        app.abort(code=next(iter(failed.values())))
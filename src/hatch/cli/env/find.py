@@ -8,7 +8,7 @@ def find(app, env_name):
     """Locate environments."""
     root_env_name = env_name
     project_config = app.project.config
-    if root_env_name not in project_config.envs and root_env_name not in project_config.matrices:
+    if project_config.get_env(root_env_name) is None and root_env_name not in project_config.matrices:
         app.abort(f'Environment `{root_env_name}` is not defined by project config')
 
     if root_env_name in project_config.matrices:
@@ -5,6 +5,10 @@ import click
 @click.pass_obj
 def prune(app):
     """Remove all environments."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from ...env.utils import accepts_cache_directory
+
     environment_types = app.plugins.environment.collect()
 
     environments = app.project.config.envs
@@ -12,6 +16,7 @@ def prune(app):
         if env_name == app.env_active:
             app.abort(f'Cannot remove active environment: {env_name}')
 
+    removable_environments = []
     for env_name, config in environments.items():
         environment_type = config['type']
         if environment_type not in environment_types:
@@ -19,8 +24,20 @@ def prune(app):
 
         data_dir = app.get_env_directory(environment_type)
 
+        env_kwargs = {}
+        if accepts_cache_directory(environment_types[environment_type]):
+            env_kwargs['cache_directory'] = app.cache_dir / 'env' / environment_type
+
         environment = environment_types[environment_type](
-            app.project.location, app.project.metadata, env_name, config, data_dir, app.platform, app.verbosity
+            app.project.location,
+            app.project.metadata,
+            env_name,
+            config,
+            data_dir,
+            app.platform,
+            app.verbosity,
+            app.get_safe_application(),
+            **env_kwargs,
         )
 
         try:
@@ -29,4 +46,16 @@ def prune(app):
             continue
 
         if environment.exists():
-            environment.remove()
+            removable_environments.append(environment)
+
+    # Plugins must opt in to having their environments removed at the same time
+    with ThreadPoolExecutor() as executor:
+        futures = []
+        for environment in removable_environments:
+            if environment.CONCURRENT_REMOVAL:
+                futures.append(executor.submit(environment.remove))
+            else:
+                environment.remove()
+
+        for future in futures:
+            future.result()
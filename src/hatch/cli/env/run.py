@@ -50,8 +50,15 @@ def filter_environments(environments, filter_data):
 @click.option('--include', '-i', 'included_variable_specs', multiple=True, help='The matrix variables to include')
 @click.option('--exclude', '-x', 'excluded_variable_specs', multiple=True, help='The matrix variables to exclude')
 @click.option('--filter', '-f', 'filter_json', help='The JSON data used to select environments')
+@click.option(
+    '--parallel',
+    '-j',
+    'workers',
+    type=click.IntRange(min=0),
+    help='The number of environments to run in concurrently, with 0 meaning the number of CPUs',
+)
 @click.pass_obj
-def run(app, args, env_names, included_variable_specs, excluded_variable_specs, filter_json):
+def run(app, args, env_names, included_variable_specs, excluded_variable_specs, filter_json, workers):
     """
     Run commands within project environments.
 
@@ -88,6 +95,10 @@ def run(app, args, env_names, included_variable_specs, excluded_variable_specs,
 
     would execute `pytest` in the environments `test.py310-42` and `test.py310-3.14`.
     Note that `py` may be used as an alias for `python`.
+
+    The `-j`/`--parallel` option prepares and runs up to the given number of environments at once, each in
+    a separate process. The output of every environment is displayed once its commands finish and all
+    environments run even if some fail, in which case the first non-zero exit code is used.
     """
     project = app.project
 
@@ -148,6 +159,7 @@ def run(app, args, env_names, included_variable_specs, excluded_variable_specs,
 
     any_compatible = False
     incompatible = {}
+    parallel_environments = []
     with project.location.as_cwd():
         for env_name in environments:
             environment = app.get_environment(env_name)
@@ -162,6 +174,10 @@ def run(app, args, env_names, included_variable_specs, excluded_variable_specs,
                     app.abort(f'Environment `{env_name}` is incompatible: {e}')
 
             any_compatible = True
+            if workers is not None:
+                parallel_environments.append(environment.name)
+                continue
+
             if should_display_header:
                 app.display_header(environment.name)
 
@@ -171,6 +187,19 @@ def run(app, args, env_names, included_variable_specs, excluded_variable_specs,
             app.prepare_environment(environment)
             app.run_shell_commands(environment, [environment.join_command_args(args)], show_code_on_error=False)
 
+        failed = {}
+        if parallel_environments:
+            commands = {env_name: ['env', 'run', '--env', env_name, '--', *args] for env_name in parallel_environments}
+            for env_name, returncode, output in app.run_hatch_processes(commands, workers):
+                if should_display_header:
+                    app.display_header(env_name)
+
+                if output:
+                    app.display_raw(output)
+
+                if returncode:
+                    failed[env_name] = returncode
+
     if incompatible:
         num_incompatible = len(incompatible)
         padding = '\n' if any_compatible else ''
@@ -179,3 +208,11 @@ def run(app, args, env_names, included_variable_specs, excluded_variable_specs,
         )
         for env_name, reason in incompatible.items():
             app.display_warning(f'{env_name} -> {reason}')
+
+    if failed:
+        num_failed = len(failed)
+        app.display_error(f'\nFailed in {num_failed} environment{"s" if num_failed > 1 else ""}:')
+        for env_name, returncode in failed.items():
+            app.display_error(f'{env_name} -> exit code {returncode}')
+
+        app.abort(code=next(iter(failed.values())))
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import click
+
+
+class LazyGroup(click.Group):
+    """
+    A command group that only imports the modules of subcommands when they are used, given as a mapping of
+    command names to import paths of the form `module:attribute`.
+    """
+
+    def __init__(self, *args, lazy_subcommands: dict[str, str] | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.lazy_subcommands = lazy_subcommands or {}
+
+        # Loaded commands are not added to `commands` so that the group is never partially populated
+        self.__loaded_subcommands: dict[str, click.Command] = {}
+
+    def list_commands(self, ctx):
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_subcommands:
+            return self.load_command(cmd_name)
+
+        return super().get_command(ctx, cmd_name)
+
+    def load_command(self, cmd_name):
+        if cmd_name not in self.__loaded_subcommands:
+            from importlib import import_module
+
+            module_name, _, attribute = self.lazy_subcommands[cmd_name].partition(':')
+            self.__loaded_subcommands[cmd_name] = getattr(import_module(module_name), attribute)
+
+        return self.__loaded_subcommands[cmd_name]
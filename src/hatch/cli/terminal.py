@@ -3,90 +3,127 @@ from __future__ import annotations
 import os
 from contextlib import contextmanager
 from textwrap import indent as indent_text
+from typing import TYPE_CHECKING
 
 import click
-from rich.console import Console
-from rich.errors import StyleSyntaxError
-from rich.style import Style
-from rich.text import Text
+
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.style import Style
 
 
 class Terminal:
     def __init__(self, verbosity, enable_color, interactive):
         self.verbosity = verbosity
         self.interactive = interactive
-        self.console = Console(
-            force_terminal=enable_color,
-            no_color=enable_color is False,
-            markup=False,
-            emoji=False,
-            highlight=False,
-            # Force consistent output for test assertions
-            legacy_windows=False if 'HATCH_SELF_TESTING' in os.environ else None,
-        )
+        self.enable_color = enable_color
+
+        # Importing Rich is comparatively expensive so wait until there is output
+        self.__console: Console | None = None
 
         # Set defaults so we can pretty print before loading user config
-        self._style_level_success: Style | str = 'bold cyan'
-        self._style_level_error: Style | str = 'bold red'
-        self._style_level_warning: Style | str = 'bold yellow'
-        self._style_level_waiting: Style | str = 'bold magenta'
-        # Default is simply bold rather than bold white for shells that have been configured with a white background
-        self._style_level_info: Style | str = 'bold'
-        self._style_level_debug: Style | str = 'bold'
+        self.__level_styles: dict[str, Style | str] = {
+            'success': 'bold cyan',
+            'error': 'bold red',
+            'warning': 'bold yellow',
+            'waiting': 'bold magenta',
+            # Default is simply bold rather than bold white for shells that have been configured with a white background
+            'info': 'bold',
+            'debug': 'bold',
+        }
+
+        # User-defined level styles are only parsed once there is output because that requires Rich
+        self.__pending_level_styles: dict | None = None
 
         # Chosen as the default since it's compatible everywhere and looks nice
         self._style_spinner = 'simpleDotsScrolling'
 
+    @property
+    def console(self) -> Console:
+        if self.__console is None:
+            from rich.console import Console
+
+            self.__console = Console(
+                force_terminal=self.enable_color,
+                no_color=self.enable_color is False,
+                markup=False,
+                emoji=False,
+                highlight=False,
+                # Force consistent output for test assertions
+                legacy_windows=False if 'HATCH_SELF_TESTING' in os.environ else None,
+            )
+
+        return self.__console
+
     def initialize_styles(self, styles: dict):  # no cov
+        pending_level_styles = {}
+        for option, style in styles.items():
+            if option in self.__level_styles:
+                pending_level_styles[option] = style
+            else:
+                setattr(self, f'_style_{option}', style)
+
+        self.__pending_level_styles = pending_level_styles
+
+    def _get_level_style(self, level: str) -> Style | str:
+        if self.__pending_level_styles is not None:
+            self.__parse_level_styles()
+
+        return self.__level_styles[level]
+
+    def __parse_level_styles(self):  # no cov
+        from rich.errors import StyleSyntaxError
+        from rich.style import Style
+
+        pending_level_styles = self.__pending_level_styles
+        self.__pending_level_styles = None
+
         # Lazily display errors so that they use the correct style
         errors = []
 
-        for option, style in styles.items():
-            attribute = f'_style_level_{option}'
-
-            default_level = getattr(self, attribute, None)
-            if default_level:
-                try:
-                    style = Style.parse(style)
-                except StyleSyntaxError as e:  # no cov
-                    errors.append(f'Invalid style definition for `{option}`, defaulting to `{default_level}`: {e}')
-                    style = Style.parse(default_level)
-            else:
-                attribute = f'_style_{option}'
+        for level, default_level in self.__level_styles.items():
+            style = pending_level_styles.get(level, default_level)
+            try:
+                style = Style.parse(style)
+            except StyleSyntaxError as e:  # no cov
+                errors.append(f'Invalid style definition for `{level}`, defaulting to `{default_level}`: {e}')
+                style = Style.parse(default_level)
 
-            setattr(self, attribute, style)
+            self.__level_styles[level] = style
 
-        return errors
+        if self.enable_color is not False and self.verbosity >= 0:
+            for error in errors:
+                self.display_warning(error)
 
     def display_error(self, text='', stderr=True, indent=None, link=None, **kwargs):
         if self.verbosity < -2:
             return
 
-        self.display(text, self._style_level_error, stderr=stderr, indent=indent, link=link, **kwargs)
+        self.display(text, self._get_level_style('error'), stderr=stderr, indent=indent, link=link, **kwargs)
 
     def display_warning(self, text='', stderr=False, indent=None, link=None, **kwargs):
         if self.verbosity < -1:
             return
 
-        self.display(text, self._style_level_warning, stderr=stderr, indent=indent, link=link, **kwargs)
+        self.display(text, self._get_level_style('warning'), stderr=stderr, indent=indent, link=link, **kwargs)
 
     def display_info(self, text='', stderr=False, indent=None, link=None, **kwargs):
         if self.verbosity < 0:
             return
 
-        self.display(text, self._style_level_info, stderr=stderr, indent=indent, link=link, **kwargs)
+        self.display(text, self._get_level_style('info'), stderr=stderr, indent=indent, link=link, **kwargs)
 
     def display_success(self, text='', stderr=False, indent=None, link=None, **kwargs):
         if self.verbosity < 0:
             return
 
-        self.display(text, self._style_level_success, stderr=stderr, indent=indent, link=link, **kwargs)
+        self.display(text, self._get_level_style('success'), stderr=stderr, indent=indent, link=link, **kwargs)
 
     def display_waiting(self, text='', stderr=False, indent=None, link=None, **kwargs):
         if self.verbosity < 0:
             return
 
-        self.display(text, self._style_level_waiting, stderr=stderr, indent=indent, link=link, **kwargs)
+        self.display(text, self._get_level_style('waiting'), stderr=stderr, indent=indent, link=link, **kwargs)
 
     def display_debug(self, text='', level=1, stderr=False, indent=None, link=None, **kwargs):
         if not 1 <= level <= 3:
@@ -94,7 +131,7 @@ class Terminal:
         elif self.verbosity < level:
             return
 
-        self.display(text, self._style_level_debug, stderr=stderr, indent=indent, link=link, **kwargs)
+        self.display(text, self._get_level_style('debug'), stderr=stderr, indent=indent, link=link, **kwargs)
 
     def display_mini_header(self, text, *, stderr=False, indent=None, link=None):
         if self.verbosity < 0:
@@ -105,7 +142,9 @@ class Terminal:
         self.display_info(']', stderr=stderr)
 
     def display_header(self, title='', *, stderr=False):
-        self.console.rule(Text(title, self._style_level_success))
+        from rich.text import Text
+
+        self.console.rule(Text(title, self._get_level_style('success')))
 
     def display_table(self, title, columns, show_lines=False, column_options=None, force_ascii=False, num_rows=0):
         from rich.table import Table
@@ -149,7 +188,11 @@ class Terminal:
             with MockStatus() as status:
                 yield status
         else:
-            with self.console.status(Text(text, self._style_level_waiting), spinner=self._style_spinner) as status:
+            from rich.text import Text
+
+            with self.console.status(
+                Text(text, self._get_level_style('waiting')), spinner=self._style_spinner
+            ) as status:
                 try:
                     self.platform.displaying_status = True
                     yield status
@@ -186,7 +229,9 @@ class Terminal:
         self.console.print(text, overflow='ignore', no_wrap=True, crop=False, **kwargs)
 
     def display_always(self, text='', **kwargs):
-        self.console.print(text, style=self._style_level_info, overflow='ignore', no_wrap=True, crop=False, **kwargs)
+        self.console.print(
+            text, style=self._get_level_style('info'), overflow='ignore', no_wrap=True, crop=False, **kwargs
+        )
 
     @staticmethod
     def prompt(text, **kwargs):
@@ -42,12 +42,22 @@ class EnvironmentInterface(ABC):
     PLUGIN_NAME = ''
     """The name used for selection."""
 
-    def __init__(self, root, metadata, name, config, data_directory, platform, verbosity, app=None):
+    CONCURRENT_REMOVAL = False
+    """
+    Whether [remove](#hatch.env.plugin.interface.EnvironmentInterface.remove) is safe to call for different
+    environments of the same project at the same time, allowing the
+    [`env prune`](../cli/reference.md#hatch-env-prune) command to remove them concurrently.
+    """
+
+    def __init__(
+        self, root, metadata, name, config, data_directory, platform, verbosity, app=None, cache_directory=None
+    ):
         self.__root = root
         self.metadata = metadata
         self.__name = name
         self.__config = config
         self.__data_directory = data_directory
+        self.__cache_directory = cache_directory
         self.__platform = platform
         self.verbosity = verbosity
         self.__app = app
@@ -111,6 +121,17 @@ class EnvironmentInterface(ABC):
         """
         return self.__data_directory
 
+    @property
+    def cache_directory(self):
+        """
+        The directory reserved exclusively for this plugin's data that may be removed at any time, such as reusable
+        environments, as a path-like object. This is shared by all projects.
+        """
+        if self.__cache_directory is None:
+            self.__cache_directory = self.data_directory / '.cache'
+
+        return self.__cache_directory
+
     @property
     def config(self) -> dict:
         """
@@ -654,6 +675,30 @@ class EnvironmentInterface(ABC):
         """
         return self.platform.capture_process(self.construct_build_command(**kwargs))
 
+    def get_build_server_process(self, build_environment):
+        """
+        This will be called when the
+        [build environment](environment.md#hatch.env.plugin.interface.EnvironmentInterface.build_environment)
+        is active and [`build`](../cli/reference.md#hatch-build) is run with the `--batch` flag:
+
+        ```python
+        with environment.build_environment([...]) as build_environment:
+            build_server = environment.get_build_server_process(build_environment)
+        ```
+
+        This should return the standard library's
+        [subprocess.Popen](https://docs.python.org/3/library/subprocess.html#subprocess.Popen)
+        accepting build requests from `stdin` and with all output captured by `stdout`. The command is constructed by
+        [construct_build_server_command](environment.md#hatch.env.plugin.interface.EnvironmentInterface.construct_build_server_command).
+        The process is stopped by closing its `stdin` before the build environment exits, so it never outlives
+        the command.
+
+        For an example, open the default implementation below:
+        """
+        return self.platform.capture_process(
+            self.construct_build_server_command(), stdin=self.platform.modules.subprocess.PIPE
+        )
+
     def enter_shell(self, name, path):
         """
         Spawn a [shell](../config/hatch.md#shell) within the environment.
@@ -750,6 +795,51 @@ class EnvironmentInterface(ABC):
 
         return command
 
+    def construct_build_server_command(self):
+        """
+        This is the command that starts a backend process which builds the project once for every
+        [build request](environment.md#hatch.env.plugin.interface.EnvironmentInterface.construct_build_request)
+        it receives, reusing plugins and project configuration between builds.
+        """
+        return ['python', '-u', '-m', 'hatchling', 'serve', '--app']
+
+    def construct_build_request(
+        self,
+        *,
+        directory=None,
+        targets=(),
+        hooks_only=False,
+        no_hooks=False,
+        clean=False,
+        clean_hooks_after=False,
+        clean_only=False,
+    ):
+        """
+        This is the canonical way [`build`](../cli/reference.md#hatch-build) command options are translated to
+        a request sent to the process returned by
+        [get_build_server_process](environment.md#hatch.env.plugin.interface.EnvironmentInterface.get_build_server_process).
+        """
+        import json
+
+        request = {'targets': list(targets), 'clean_only': clean_only}
+
+        if directory:
+            request['directory'] = directory
+
+        if hooks_only:
+            request['hooks_only'] = True
+
+        if no_hooks:
+            request['no_hooks'] = True
+
+        if clean:
+            request['clean'] = True
+
+        if clean_hooks_after:
+            request['clean_hooks_after'] = True
+
+        return f'{json.dumps(request)}\n'.encode('utf-8')
+
     def construct_pip_install_command(self, args: list[str], verbosity=None):
         """
         A convenience method for constructing a [`pip install`](https://pip.pypa.io/en/stable/cli/pip_install/)
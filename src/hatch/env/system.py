@@ -10,8 +10,10 @@ class SystemEnvironment(EnvironmentInterface):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-        self.python_info = PythonInfo(self.platform)
         self.install_indicator = self.data_directory / str(self.root).encode('utf-8').hex()
+        self.python_info = PythonInfo(
+            self.platform, cache_file=self.cache_directory / 'python-info' / f'{self.install_indicator.name}.json'
+        )
 
     def find(self):
         return os.path.dirname(os.path.dirname(self.system_python))
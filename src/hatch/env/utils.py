@@ -1,2 +1,12 @@
 def ensure_valid_environment(env_config: dict):
     env_config.setdefault('type', 'virtual')
+
+
+def accepts_cache_directory(environment_class) -> bool:
+    # Third-party plugins may override the constructor without supporting this later addition
+    from inspect import Parameter, signature
+
+    parameters = signature(environment_class).parameters.values()
+    return any(
+        parameter.name == 'cache_directory' or parameter.kind is Parameter.VAR_KEYWORD for parameter in parameters
+    )
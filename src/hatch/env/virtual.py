@@ -1,16 +1,37 @@
+import os
+import re
+import shutil
+import sys
 from base64 import urlsafe_b64encode
 from contextlib import contextmanager
 from hashlib import sha256
 from os.path import isabs
 
+from ..utils.env import PythonInfo
 from ..utils.fs import Path
 from ..utils.shells import ShellManager
 from ..venv.core import TempVirtualEnv, VirtualEnv
+from ..venv.utils import get_random_venv_name
 from .plugin.interface import EnvironmentInterface
 
+if sys.platform == 'linux':
+    import fcntl
+
+    # https://man7.org/linux/man-pages/man2/ioctl_ficlone.2.html
+    FICLONE = 0x40049409
+else:
+    FICLONE = None
+
 
 class VirtualEnvironment(EnvironmentInterface):
     PLUGIN_NAME = 'virtual'
+    CONCURRENT_REMOVAL = True
+
+    # The maximum number of cached build environments, the least recently used of which are removed first
+    BUILD_ENVIRONMENT_CACHE_SIZE = 8
+
+    # Modifications within the resolution of timestamps would go unnoticed by the sync stamp
+    RACY_INTERVAL = 2
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -20,6 +41,7 @@ class VirtualEnvironment(EnvironmentInterface):
         hashed_root = sha256(str(self.root).encode('utf-8')).digest()
         checksum = urlsafe_b64encode(hashed_root).decode('utf-8')[:8]
         self.storage_path = self.data_directory / f'{project_name}-{checksum}'
+        self.trash_directory = self.data_directory / '.trash'
 
         chosen_directory = self.get_env_var_option('path')
         if chosen_directory:
@@ -29,13 +51,16 @@ class VirtualEnvironment(EnvironmentInterface):
             self.virtual_env_path = self.storage_path / directory
 
         self.virtual_env = VirtualEnv(self.virtual_env_path, self.platform, self.verbosity)
+        env_checksum = get_checksum(str(self.virtual_env_path), 16)
+        self.virtual_env.python_info.cache_file = self.cache_directory / 'python-info' / f'{env_checksum}.json'
+        self.sync_stamp_file = self.cache_directory / 'sync-stamps' / f'{env_checksum}.json'
         self.shells = ShellManager(self)
 
         self._parent_python = None
 
     @staticmethod
     def get_option_types() -> dict:
-        return {'system-packages': bool}
+        return {'system-packages': bool, 'build-cache': bool, 'link-template-files': bool}
 
     def activate(self):
         self.virtual_env.activate()
@@ -47,14 +72,54 @@ class VirtualEnvironment(EnvironmentInterface):
         return self.virtual_env_path
 
     def create(self):
-        self.virtual_env.create(self.parent_python, allow_system_packages=self.config.get('system-packages', False))
+        allow_system_packages = self.config.get('system-packages', False)
+        template = self.get_template(allow_system_packages)
+        if not template.clone(self.virtual_env_path, link_files=self.config.get('link-template-files', False)):
+            self.virtual_env.create(self.parent_python, allow_system_packages=allow_system_packages)
 
     def remove(self):
-        self.virtual_env.remove()
+        # Moving the environment aside first is atomic so that it never appears to exist while partially deleted
+        trash_path = self.trash_directory / f'{self.virtual_env_path.name}-{get_random_venv_name()}'
+        try:
+            self.trash_directory.ensure_dir_exists()
+            os.replace(self.virtual_env_path, trash_path)
+        except OSError:
+            # Environments using the `path` option may reside on another file system
+            self.virtual_env.remove()
+        else:
+            # Errors are ignored because another process may have claimed the entry, see `empty_trash`
+            shutil.rmtree(trash_path, ignore_errors=True)
+
+        self.virtual_env.python_info.cache_file.remove()
+        self.sync_stamp_file.remove()
+        self.empty_trash()
+
+        # Clean up root directories that are empty, which is only possible atomically so that
+        # environments of the same project may be removed concurrently
+        for directory in (self.trash_directory, self.storage_path):
+            try:
+                directory.rmdir()
+            except OSError:
+                pass
+
+    def empty_trash(self):
+        """
+        Delete environments left in the trash by removals that were interrupted.
+        """
+        try:
+            trash_paths = list(self.trash_directory.iterdir())
+        except OSError:
+            return
+
+        for trash_path in trash_paths:
+            # Renaming is atomic so every entry is claimed by a single process, even if it is still being deleted
+            claimed_path = self.trash_directory / get_random_venv_name()
+            try:
+                os.replace(trash_path, claimed_path)
+            except OSError:
+                continue
 
-        # Clean up root directory of all virtual environments belonging to the project
-        if self.storage_path.is_dir() and not any(self.storage_path.iterdir()):
-            self.storage_path.remove()
+            shutil.rmtree(claimed_path, ignore_errors=True)
 
     def exists(self):
         return self.virtual_env.exists()
@@ -76,20 +141,176 @@ class VirtualEnvironment(EnvironmentInterface):
         from hatchling.dep.core import dependencies_in_sync
 
         with self.safe_activation():
-            return dependencies_in_sync(
+            # Avoid inspecting the environment when nothing changed since dependencies were last found to be in sync
+            if self.sync_stamp_matches():
+                return True
+
+            in_sync = dependencies_in_sync(
                 self.dependencies_complex, sys_path=self.virtual_env.sys_path, environment=self.virtual_env.environment
             )
+            if in_sync:
+                self.write_sync_stamp()
+
+            return in_sync
 
     def sync_dependencies(self):
         with self.safe_activation():
             self.platform.check_command(self.construct_pip_install_command(self.dependencies))
+            self.write_sync_stamp()
+
+    def sync_stamp_matches(self):
+        """
+        Must be called with the environment active so that environment variables are compared as they were recorded.
+        """
+        if not self.sync_stamp_file.is_file():
+            return False
+
+        import json
+
+        try:
+            sync_stamp = json.loads(self.sync_stamp_file.read_text())
+            if sync_stamp['dependencies'] != self.get_dependency_checksum():
+                return False
+            elif sync_stamp['env_vars'] != get_sys_path_env_vars():
+                return False
+
+            path_modification_times = sync_stamp['paths']
+            return path_modification_times == get_path_modification_times(path for path, _ in path_modification_times)
+        except (ValueError, KeyError, TypeError):
+            return False
+
+    def write_sync_stamp(self):
+        """
+        Must be called with the environment active. Every directory on `sys.path` is recorded because installing or
+        removing anything modifies at least one of them, as are the environment variables that change `sys.path`.
+        """
+        import json
+        import time
+
+        from atomicwrites import atomic_write
+
+        path_modification_times = get_path_modification_times(self.virtual_env.sys_path)
+        latest_modification = max(
+            (mtime_ns for _, mtime_ns in path_modification_times if mtime_ns is not None), default=0
+        )
+        # The stamp is only an optimization so e.g. a read-only cache directory is not an error
+        try:
+            if time.time() - latest_modification / 1e9 <= self.RACY_INTERVAL:
+                self.sync_stamp_file.remove()
+                return
+
+            self.sync_stamp_file.ensure_parent_dir_exists()
+            with atomic_write(str(self.sync_stamp_file), mode='w', encoding='utf-8', overwrite=True) as f:
+                f.write(
+                    json.dumps(
+                        {
+                            'dependencies': self.get_dependency_checksum(),
+                            'env_vars': get_sys_path_env_vars(),
+                            'paths': path_modification_times,
+                        }
+                    )
+                )
+        except OSError:
+            pass
+
+    def get_dependency_checksum(self):
+        import json
+
+        return get_checksum(json.dumps([self.dependencies, self.features]), 32)
 
     @contextmanager
     def build_environment(self, dependencies):
-        with self.get_env_vars(), TempVirtualEnv(self.parent_python, self.platform, self.verbosity):
-            self.platform.check_command(self.construct_pip_install_command(dependencies))
+        if not self.config.get('build-cache', True):
+            with self.get_env_vars(), TempVirtualEnv(self.parent_python, self.platform, self.verbosity):
+                self.platform.check_command(self.construct_pip_install_command(dependencies))
 
-            yield
+                yield
+
+            return
+
+        build_env = VirtualEnv(self.get_build_environment_path(dependencies), self.platform, self.verbosity)
+
+        try:
+            with self.get_env_vars():
+                if not build_env.exists():
+                    try:
+                        if not self.get_template().clone(build_env.directory):
+                            build_env.create(self.parent_python)
+                    except BaseException:
+                        build_env.remove()
+                        raise
+
+                with build_env:
+                    if not self.build_dependencies_in_sync(build_env, dependencies):
+                        self.platform.check_command(self.construct_pip_install_command(dependencies))
+
+                    # Mark as recently used
+                    os.utime(build_env.directory)
+
+                    yield
+        finally:
+            self.prune_build_environments()
+
+    def get_build_environment_path(self, dependencies):
+        from packaging.requirements import Requirement
+
+        from hatchling.metadata.utils import get_normalized_dependency
+
+        normalized_dependencies = sorted(
+            {get_normalized_dependency(Requirement(dependency)) for dependency in dependencies}
+        )
+        key = '\n'.join([str(Path(self.parent_python).resolve()), *normalized_dependencies])
+
+        checksum = get_checksum(key, 16)
+        return self.build_cache_path / checksum
+
+    def get_template(self, allow_system_packages=False):
+        try:
+            from importlib.metadata import version
+        except ImportError:  # no cov
+            from importlib_metadata import version
+
+        python_path = Path(self.parent_python).resolve()
+        python_stat = python_path.stat()
+        key = '\n'.join(
+            map(
+                str,
+                (python_path, python_stat.st_size, python_stat.st_mtime, version('virtualenv'), allow_system_packages),
+            )
+        )
+
+        checksum = get_checksum(key, 16)
+        return VirtualEnvTemplate(
+            self.cache_directory / 'templates' / checksum,
+            self.parent_python,
+            self.platform,
+            allow_system_packages=allow_system_packages,
+            verbosity=self.verbosity,
+        )
+
+    @staticmethod
+    def build_dependencies_in_sync(build_env, dependencies):
+        from packaging.requirements import Requirement
+
+        from hatchling.dep.core import dependencies_in_sync
+
+        return dependencies_in_sync(
+            [Requirement(dependency) for dependency in dependencies],
+            sys_path=build_env.sys_path,
+            environment=build_env.environment,
+        )
+
+    def prune_build_environments(self):
+        if not self.build_cache_path.is_dir():
+            return
+
+        build_env_paths = sorted(self.build_cache_path.iterdir(), key=lambda path: path.stat().st_mtime, reverse=True)
+        for build_env_path in build_env_paths[self.BUILD_ENVIRONMENT_CACHE_SIZE :]:
+            build_env_path.remove()
+
+    @property
+    def build_cache_path(self):
+        return self.cache_directory / 'build'
 
     @contextmanager
     def command_context(self):
@@ -141,3 +362,133 @@ class VirtualEnvironment(EnvironmentInterface):
         # Set user-defined environment variables first so ours take precedence
         with self.get_env_vars(), self:
             yield
+
+
+class VirtualEnvTemplate(VirtualEnv):
+    """
+    A pristine virtual environment that is created once and then copied, rather than invoking `virtualenv` for every
+    new environment. Files are copied, or optionally hard linked for installed packages, and any absolute paths in the
+    scripts and configuration are rewritten.
+    """
+
+    # Installers write scripts for interpreters with longer paths as shell wrappers instead
+    MAX_SHEBANG_LENGTH = 127
+    CLONABLE_PATH = re.compile(r'[\w/.+@~-]+')
+
+    def __init__(self, directory, python, platform, allow_system_packages=False, verbosity=0):
+        super().__init__(directory, platform, verbosity)
+
+        self.python = python
+        self.allow_system_packages = allow_system_packages
+
+    def clone(self, directory, link_files=False):
+        # Windows launchers embed the path to the interpreter
+        if self.platform.windows or directory.exists():
+            return False
+
+        temp_directory = self.directory.with_name(f'{self.directory.name}-{get_random_venv_name()}')
+        if not all(self.is_clonable(path) for path in (temp_directory, directory)):
+            return False
+
+        try:
+            if not self.exists():
+                self.create_template(temp_directory)
+
+            copy_virtual_env(self.directory, directory, link_files=link_files)
+            rewrite_virtual_env_paths(directory, self.directory)
+        except Exception:
+            directory.remove()
+            return False
+
+        return True
+
+    def create_template(self, temp_directory):
+        try:
+            VirtualEnv(temp_directory, self.platform, self.verbosity).create(
+                self.python, allow_system_packages=self.allow_system_packages
+            )
+            rewrite_virtual_env_paths(temp_directory, temp_directory, self.directory)
+
+            try:
+                temp_directory.rename(self.directory)
+            # Created concurrently by another process
+            except OSError:
+                if not self.exists():
+                    raise
+        finally:
+            temp_directory.remove()
+
+    def is_clonable(self, directory):
+        if self.CLONABLE_PATH.fullmatch(str(directory)) is None:
+            return False
+
+        return len(f'#!{directory / "bin" / "python"}\n') <= self.MAX_SHEBANG_LENGTH
+
+
+def copy_virtual_env(source, destination, link_files=False):
+    def copy_file(src, dst):
+        # Installers replace rather than modify files, except for path configuration files. Anything else modifying
+        # a linked file in place would affect every environment sharing it, which is why linking is opt-in.
+        if link_files and f'{os.sep}site-packages{os.sep}' in src and not src.endswith('.pth'):
+            try:
+                os.link(src, dst)
+                return dst
+            except OSError:
+                pass
+
+        return clone_file(src, dst)
+
+    shutil.copytree(source, destination, symlinks=True, copy_function=copy_file)
+
+
+def clone_file(src, dst):
+    # Copy-on-write file systems like Btrfs and XFS can share the data of copies until either is modified
+    if FICLONE is not None:
+        try:
+            with open(src, 'rb') as source_file, open(dst, 'wb') as destination_file:
+                fcntl.ioctl(destination_file.fileno(), FICLONE, source_file.fileno())
+        except OSError:
+            pass
+        else:
+            shutil.copystat(src, dst)
+            return dst
+
+    return shutil.copy2(src, dst)
+
+
+def rewrite_virtual_env_paths(directory, old_directory, new_directory=None):
+    if new_directory is None:
+        new_directory = directory
+
+    old_path = str(old_directory).encode('utf-8')
+    new_path = str(new_directory).encode('utf-8')
+
+    paths = [directory / 'pyvenv.cfg']
+    paths.extend(path for path in (directory / 'bin').iterdir() if not path.is_symlink())
+    for path in paths:
+        if not path.is_file():
+            continue
+
+        contents = path.read_bytes()
+        if old_path in contents:
+            path.write_bytes(contents.replace(old_path, new_path))
+
+
+def get_checksum(value, length):
+    hashed_value = sha256(value.encode('utf-8')).digest()
+    return urlsafe_b64encode(hashed_value).decode('utf-8')[:length]
+
+
+def get_sys_path_env_vars():
+    return [os.environ.get(env_var) for env_var in PythonInfo.ENV_VARS]
+
+
+def get_path_modification_times(paths):
+    path_modification_times = []
+    for path in paths:
+        try:
+            path_modification_times.append([path, os.stat(path).st_mtime_ns])
+        except OSError:
+            path_modification_times.append([path, None])
+
+    return path_modification_times
@@ -7,10 +7,11 @@ from .env import apply_overrides
 
 
 class ProjectConfig:
-    def __init__(self, root, config, plugin_manager=None):
+    def __init__(self, root, config, plugin_manager=None, cache_file=None):
         self.root = root
         self.config = config
         self.plugin_manager = plugin_manager
+        self.cache_file = cache_file
 
         self._matrices = None
         self._env = None
@@ -20,6 +21,12 @@ class ProjectConfig:
         self._scripts = None
         self._cached_env_overrides = {}
 
+        # Lazily resolved environment data, see `get_env`
+        self._environment_collectors = None
+        self._env_index = None
+        self._root_env_configs = None
+        self._env_configs = {}
+
     @property
     def env(self):
         if self._env is None:
@@ -52,15 +59,55 @@ class ProjectConfig:
     @property
     def matrices(self):
         if self._matrices is None:
-            _ = self.envs
+            self._resolve_env_index()
 
         return self._matrices
 
     @property
     def envs(self):
+        if self._envs is None:
+            self._resolve_env_index()
+
+            final_config = {env_name: self._materialize_env(env_name) for env_name in self._env_index}
+            for environment_collector in self._environment_collectors:
+                environment_collector.finalize_environments(final_config)
+
+            self._envs = final_config
+
+        return self._envs
+
+    def get_env(self, env_name):
+        """
+        Returns the configuration of a single environment, or `None` if it is not defined. Unlike
+        accessing `envs`, this only generates and applies overrides for the selected environment
+        unless an environment collector needs to see all environments at once.
+        """
+        if self._envs is not None:
+            return self._envs.get(env_name)
+
+        self._resolve_env_index()
+        if env_name not in self._env_index:
+            return None
+
+        from ..env.collectors.plugin.interface import EnvironmentCollectorInterface
+
+        for environment_collector in self._environment_collectors:
+            if (
+                type(environment_collector).finalize_environments
+                is not EnvironmentCollectorInterface.finalize_environments
+            ):
+                return self.envs.get(env_name)
+
+        return self._materialize_env(env_name)
+
+    def _resolve_env_index(self):
+        """
+        Validates the configuration of all environments and determines the names of every generated
+        environment, without constructing their configuration.
+        """
         from ..utils.platform import get_platform_name
 
-        if self._envs is None:
+        if self._env_index is None:
             env_config = self.config.get('envs', {})
             if not isinstance(env_config, dict):
                 raise TypeError('Field `tool.hatch.envs` must be a table')
@@ -87,6 +134,11 @@ class ProjectConfig:
 
                 config.setdefault(env_name, {}).update(data)
 
+            cache_key = self.get_env_cache_key(env_config, environment_collectors)
+            if cache_key is not None and self.load_cached_envs(cache_key):
+                self._environment_collectors = environment_collectors
+                return
+
             for environment_collector in environment_collectors:
                 environment_collector.finalize_config(config)
 
@@ -100,10 +152,11 @@ class ProjectConfig:
 
             current_platform = get_platform_name()
             all_matrices = {}
-            final_config = {}
-            cached_overrides = {}
+            env_index = {}
+            root_env_configs = {}
+            cacheable_env_configs = {}
             for env_name, initial_config in config.items():
-                current_cached_overrides = cached_overrides[env_name] = {'platform': [], 'env': [], 'matrix': []}
+                current_cached_overrides = {'platform': [], 'env': []}
 
                 # Only shallow copying is necessary since we just want to modify keys
                 initial_config = initial_config.copy()
@@ -145,17 +198,30 @@ class ProjectConfig:
                 for env_var, options in env_var_overrides.items():
                     if not isinstance(options, dict):
                         raise TypeError(f'Field `tool.hatch.envs.{env_name}.overrides.env.{env_var}` must be a table')
-                    elif env_var not in environ:
-                        continue
 
-                    apply_overrides(env_name, 'env', env_var, environ[env_var], options, initial_config)
-                    current_cached_overrides['env'].append((env_var, environ[env_var], options))
+                # Environment variables may hold secrets so the cache only stores the configuration preceding them
+                if cache_key is not None:
+                    cacheable_config = initial_config
+                    if any(env_var in environ for env_var in env_var_overrides):
+                        cacheable_config = deepcopy(initial_config)
+
+                    cacheable_env_configs[env_name] = (
+                        cacheable_config,
+                        current_cached_overrides['platform'],
+                        env_var_overrides,
+                    )
+
+                current_cached_overrides['env'] = _apply_env_var_overrides(env_name, env_var_overrides, initial_config)
 
                 if 'matrix' not in initial_config:
-                    final_config[env_name] = initial_config
+                    env_index[env_name] = env_name, None
+                    root_env_configs[env_name] = initial_config, {}, current_cached_overrides
                     continue
 
                 matrices = initial_config.pop('matrix')
+                if cache_key is not None:
+                    cacheable_env_configs[env_name][0].pop('matrix', None)
+
                 if not isinstance(matrices, list):
                     raise TypeError(f'Field `tool.hatch.envs.{env_name}.matrix` must be an array')
 
@@ -163,6 +229,23 @@ class ProjectConfig:
                 if not isinstance(matrix_overrides, dict):
                     raise TypeError(f'Field `tool.hatch.envs.{env_name}.overrides.matrix` must be a table')
 
+                for variable, options in matrix_overrides.items():
+                    if not isinstance(options, dict):
+                        raise TypeError(
+                            f'Field `tool.hatch.envs.{env_name}.overrides.matrix.{variable}` must be a table'
+                        )
+
+                # Matrix overrides may change how the names of generated environments are constructed
+                name_format_overrides = {
+                    variable: {
+                        option: data
+                        for option, data in options.items()
+                        if option.rpartition('set-')[2] == 'matrix-name-format'
+                    }
+                    for variable, options in matrix_overrides.items()
+                }
+
+                root_env_configs[env_name] = initial_config, matrix_overrides, current_cached_overrides
                 matrix_data = all_matrices[env_name] = {'config': deepcopy(initial_config)}
                 all_envs = matrix_data['envs'] = {}
                 for i, matrix in enumerate(matrices, 1):
@@ -230,31 +313,21 @@ class ProjectConfig:
                         # Make a value mapping for easy referencing
                         variable_values = dict(zip(variables, result))
 
-                        # Create the environment's initial configuration
-                        new_config = deepcopy(initial_config)
-
-                        cached_matrix_overrides = []
-
-                        # Apply any configuration based on matrix variables
-                        for variable, options in matrix_overrides.items():
-                            if not isinstance(options, dict):
-                                raise TypeError(
-                                    f'Field `tool.hatch.envs.{env_name}.overrides.matrix.{variable}` must be a table'
+                        # Only resolve the name format, the configuration is constructed on demand
+                        name_config = {
+                            option: value for option, value in initial_config.items() if option == 'matrix-name-format'
+                        }
+                        for variable, options in name_format_overrides.items():
+                            if options and variable in variables:
+                                apply_overrides(
+                                    env_name, 'matrix', variable, variable_values[variable], options, name_config
                                 )
-                            elif variable not in variables:
-                                continue
-
-                            apply_overrides(
-                                env_name, 'matrix', variable, variable_values[variable], options, new_config
-                            )
-                            cached_matrix_overrides.append((variable, variable_values[variable], options))
 
                         # Construct the environment name
-                        final_matrix_name_format = new_config.pop('matrix-name-format', matrix_name_format)
+                        final_matrix_name_format = name_config.pop('matrix-name-format', matrix_name_format)
                         env_name_parts = []
                         for j, (variable, value) in enumerate(variable_values.items()):
                             if j == 0 and python_selected:
-                                new_config['python'] = value
                                 env_name_parts.append(value if value.startswith('py') else f'py{value}')
                             else:
                                 env_name_parts.append(final_matrix_name_format.format(variable=variable, value=value))
@@ -264,27 +337,154 @@ class ProjectConfig:
                             new_env_name = f'{env_name}.{new_env_name}'
 
                         # Save the generated environment
-                        final_config[new_env_name] = new_config
-                        cached_overrides[new_env_name] = {
-                            'platform': current_cached_overrides['platform'],
-                            'env': current_cached_overrides['env'],
-                            'matrix': cached_matrix_overrides,
-                        }
+                        env_index[new_env_name] = env_name, dict(variable_values)
                         all_envs[new_env_name] = variable_values
                         if 'py' in variable_values:
                             all_envs[new_env_name] = {'python': variable_values.pop('py'), **variable_values}
 
-                # Remove the root matrix generator
-                del cached_overrides[env_name]
+            self._environment_collectors = environment_collectors
+            self._matrices = all_matrices
+            self._root_env_configs = root_env_configs
+            self._env_index = env_index
+
+            if cache_key is not None:
+                self.save_cached_envs(cache_key, cacheable_env_configs)
+
+    def get_env_cache_key(self, env_config, environment_collectors):
+        """
+        Resolved environments depend only on the configuration, the current platform and the environment
+        variables that overrides refer to, unless environment collectors other than the default are used.
+        """
+        from ..env.collectors.default import DefaultEnvironmentCollector
+
+        if self.cache_file is None or any(
+            type(environment_collector) is not DefaultEnvironmentCollector
+            for environment_collector in environment_collectors
+        ):
+            return
 
-            for environment_collector in environment_collectors:
-                environment_collector.finalize_environments(final_config)
+        import json
+        from hashlib import sha256
 
-            self._matrices = all_matrices
-            self._envs = final_config
-            self._cached_env_overrides.update(cached_overrides)
+        from ..__about__ import __version__
+        from ..utils.platform import get_platform_name
 
-        return self._envs
+        env_vars = set()
+        for data in env_config.values():
+            overrides = data.get('overrides')
+            if isinstance(overrides, dict) and isinstance(overrides.get('env'), dict):
+                env_vars.update(overrides['env'])
+
+        key_data = {
+            'version': __version__,
+            'platform': get_platform_name(),
+            'env': {env_var: environ.get(env_var) for env_var in sorted(env_vars)},
+            'config': self.config,
+        }
+        try:
+            # The order of environments is significant so keys are not sorted
+            return sha256(json.dumps(key_data).encode('utf-8')).hexdigest()
+        except (TypeError, ValueError):
+            # Values like dates that have no JSON equivalent
+            return
+
+    def load_cached_envs(self, cache_key):
+        if not self.cache_file.is_file():
+            return False
+
+        import json
+
+        try:
+            cached_data = json.loads(self.cache_file.read_text())
+            if cached_data['key'] != cache_key:
+                return False
+
+            matrices = {}
+            root_env_configs = {}
+            for env_name, cached_config in cached_data['root_env_configs'].items():
+                initial_config, matrix_overrides, platform_overrides, env_var_overrides = cached_config
+                env_overrides = _apply_env_var_overrides(env_name, env_var_overrides, initial_config)
+                initial_config.pop('matrix', None)
+                root_env_configs[env_name] = (
+                    initial_config,
+                    matrix_overrides,
+                    {'platform': platform_overrides, 'env': env_overrides},
+                )
+
+                if env_name in cached_data['matrix_envs']:
+                    matrices[env_name] = {
+                        'config': deepcopy(initial_config),
+                        'envs': cached_data['matrix_envs'][env_name],
+                    }
+
+            env_index = cached_data['env_index']
+        except (ValueError, KeyError, TypeError):
+            return False
+
+        self._matrices = matrices
+        self._root_env_configs = root_env_configs
+        self._env_index = env_index
+
+        return True
+
+    def save_cached_envs(self, cache_key, cacheable_env_configs):
+        import json
+
+        from atomicwrites import atomic_write
+
+        cached_data = {
+            'key': cache_key,
+            'matrix_envs': {env_name: matrix_data['envs'] for env_name, matrix_data in self._matrices.items()},
+            'root_env_configs': {
+                env_name: (initial_config, self._root_env_configs[env_name][1], platform_overrides, env_var_overrides)
+                for env_name, (initial_config, platform_overrides, env_var_overrides) in cacheable_env_configs.items()
+            },
+            'env_index': self._env_index,
+        }
+        # Caching is only an optimization so e.g. a read-only cache directory is not an error
+        try:
+            self.cache_file.ensure_parent_dir_exists()
+            with atomic_write(str(self.cache_file), mode='w', encoding='utf-8', overwrite=True) as f:
+                f.write(json.dumps(cached_data))
+        except OSError:
+            pass
+
+    def _materialize_env(self, env_name):
+        if env_name in self._env_configs:
+            return self._env_configs[env_name]
+
+        root_env_name, variable_values = self._env_index[env_name]
+        initial_config, matrix_overrides, root_cached_overrides = self._root_env_configs[root_env_name]
+        cached_overrides = {'platform': root_cached_overrides['platform'], 'env': root_cached_overrides['env']}
+
+        if variable_values is None:
+            new_config = initial_config
+            cached_overrides['matrix'] = []
+        else:
+            # Create the environment's initial configuration
+            new_config = deepcopy(initial_config)
+
+            cached_matrix_overrides = cached_overrides['matrix'] = []
+
+            # Apply any configuration based on matrix variables
+            for variable, options in matrix_overrides.items():
+                if variable not in variable_values:
+                    continue
+
+                apply_overrides(root_env_name, 'matrix', variable, variable_values[variable], options, new_config)
+                cached_matrix_overrides.append((variable, variable_values[variable], options))
+
+            new_config.pop('matrix-name-format', None)
+
+            # Any Python variable comes first
+            variable, value = next(iter(variable_values.items()))
+            if variable in ('py', 'python'):
+                new_config['python'] = value
+
+        self._env_configs[env_name] = new_config
+        self._cached_env_overrides[env_name] = cached_overrides
+
+        return new_config
 
     @property
     def publish(self):
@@ -338,18 +538,23 @@ class ProjectConfig:
 
         return self._scripts
 
-    def finalize_env_overrides(self, option_types):
+    def finalize_env_overrides(self, option_types, env_name=None):
         # We lazily apply overrides because we need type information potentially defined by
         # environment plugins for their options
-        if not self._cached_env_overrides:
+        if env_name is not None:
+            config = self.get_env(env_name)
+            cached_overrides = self._cached_env_overrides.pop(env_name, None)
+            if cached_overrides is not None:
+                _apply_cached_overrides(env_name, cached_overrides, config, option_types)
+
+            return
+        elif not self._cached_env_overrides:
             return
 
         for env_name, config in self.envs.items():
-            for override_name, data in self._cached_env_overrides[env_name].items():
-                for condition, condition_value, options in data:
-                    apply_overrides(env_name, override_name, condition, condition_value, options, config, option_types)
-
-        self._cached_env_overrides.clear()
+            cached_overrides = self._cached_env_overrides.pop(env_name, None)
+            if cached_overrides is not None:
+                _apply_cached_overrides(env_name, cached_overrides, config, option_types)
 
 
 def expand_script_commands(script_name, commands, config, seen, active):
@@ -381,6 +586,22 @@ def expand_script_commands(script_name, commands, config, seen, active):
     return expanded_commands
 
 
+def _apply_env_var_overrides(env_name, env_var_overrides, config):
+    cached_overrides = []
+    for env_var, options in env_var_overrides.items():
+        if env_var in environ:
+            apply_overrides(env_name, 'env', env_var, environ[env_var], options, config)
+            cached_overrides.append((env_var, environ[env_var], options))
+
+    return cached_overrides
+
+
+def _apply_cached_overrides(env_name, cached_overrides, config, option_types):
+    for override_name, data in cached_overrides.items():
+        for condition, condition_value, options in data:
+            apply_overrides(env_name, override_name, condition, condition_value, options, config, option_types)
+
+
 def _populate_default_env_values(env_name, data, config, seen, active):
     if env_name in seen:
         return
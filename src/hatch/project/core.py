@@ -7,11 +7,12 @@ from ..utils.fs import Path
 
 
 class Project:
-    def __init__(self, path: Path, *, name: str = None, config=None):
+    def __init__(self, path: Path, *, name: str = None, config=None, cache_directory: Path | None = None):
         self._path = path
 
         # From app config
         self.chosen_name = name
+        self.cache_directory = cache_directory
 
         # Location of pyproject.toml
         self._project_file_path: Path | None = None
@@ -37,7 +38,18 @@ class Project:
         if self._config is None:
             from .config import ProjectConfig
 
-            self._config = ProjectConfig(self.location, self.metadata.hatch.config, self.plugin_manager)
+            cache_file = None
+            if self.cache_directory is not None:
+                from base64 import urlsafe_b64encode
+                from hashlib import sha256
+
+                hashed_location = sha256(str(self.location).encode('utf-8')).digest()
+                checksum = urlsafe_b64encode(hashed_location).decode('utf-8')[:16]
+                cache_file = self.cache_directory / 'config' / f'{checksum}.json'
+
+            self._config = ProjectConfig(
+                self.location, self.metadata.hatch.config, self.plugin_manager, cache_file=cache_file
+            )
 
         return self._config
 
@@ -54,7 +66,7 @@ class Project:
         return self.root or self._path
 
     @classmethod
-    def from_config(cls, config: RootConfig, project: str) -> Project | None:
+    def from_config(cls, config: RootConfig, project: str, cache_directory: Path | None = None) -> Project | None:
         # Disallow empty strings
         if not project:
             return None
@@ -62,7 +74,7 @@ class Project:
         if project in config.projects:
             location = config.projects[project].location
             if location:
-                return cls(Path(location).resolve(), name=project)
+                return cls(Path(location).resolve(), name=project, cache_directory=cache_directory)
         else:
             for project_dir in config.dirs.project:
                 if not project_dir:
@@ -70,7 +82,7 @@ class Project:
 
                 location = Path(project_dir, project)
                 if location.is_dir():
-                    return cls(Path(location).resolve(), name=project)
+                    return cls(Path(location).resolve(), name=project, cache_directory=cache_directory)
 
     def find_project_root(self) -> Path | None:
         path = self._path
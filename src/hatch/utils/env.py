@@ -2,9 +2,16 @@ from ast import literal_eval
 
 
 class PythonInfo:
-    def __init__(self, platform, executable='python'):
+    # Modifications within the resolution of timestamps would go unnoticed
+    RACY_INTERVAL = 2
+
+    # Environment variables that affect `sys.path` independently of the interpreter and what is installed
+    ENV_VARS = ('PYTHONPATH', 'PYTHONHOME', 'PYTHONNOUSERSITE', 'PYTHONUSERBASE', 'PYTHONSAFEPATH', 'VIRTUAL_ENV')
+
+    def __init__(self, platform, executable='python', cache_file=None):
         self.platform = platform
         self.executable = executable
+        self.cache_file = cache_file
 
         self.__dep_check_data = None
         self.__environment = None
@@ -13,11 +20,21 @@ class PythonInfo:
     @property
     def dep_check_data(self):
         if self.__dep_check_data is None:
-            process = self.platform.check_command(
-                [self.executable, '-W', 'ignore', '-'], capture_output=True, input=DEP_CHECK_DATA_SCRIPT
-            )
+            # The interpreter that is probed must be the one the cache key is derived from
+            executable = self.platform.modules.shutil.which(self.executable)
+
+            dep_check_data = self.load_cached_data(executable)
+            if dep_check_data is None:
+                process = self.platform.check_command(
+                    [executable or self.executable, '-W', 'ignore', '-'],
+                    capture_output=True,
+                    input=DEP_CHECK_DATA_SCRIPT,
+                )
 
-            self.__dep_check_data = literal_eval(process.stdout.strip().decode('utf-8'))
+                dep_check_data = literal_eval(process.stdout.strip().decode('utf-8'))
+                self.save_cached_data(executable, dep_check_data)
+
+            self.__dep_check_data = dep_check_data
 
         return self.__dep_check_data
 
@@ -35,6 +52,72 @@ class PythonInfo:
 
         return self.__sys_path
 
+    def load_cached_data(self, executable):
+        if self.cache_file is None or not self.cache_file.is_file():
+            return
+
+        import json
+
+        try:
+            cached_data = json.loads(self.cache_file.read_text())
+            dep_check_data = cached_data['data']
+            if cached_data['key'] == self.get_cache_key(executable, dep_check_data['sys_path']):
+                return dep_check_data
+        except (ValueError, KeyError, TypeError):
+            pass
+
+    def save_cached_data(self, executable, dep_check_data):
+        if self.cache_file is None:
+            return
+
+        cache_key = self.get_cache_key(executable, dep_check_data['sys_path'])
+        if cache_key is None:
+            return
+
+        import json
+        import time
+
+        latest_modification = max((path_data[2] for path_data in cache_key['paths'] if len(path_data) == 3), default=0)
+        if time.time() - latest_modification / 1e9 <= self.RACY_INTERVAL:
+            return
+
+        from atomicwrites import atomic_write
+
+        # Caching is only an optimization so e.g. a read-only cache directory is not an error
+        try:
+            self.cache_file.ensure_parent_dir_exists()
+            with atomic_write(str(self.cache_file), mode='w', encoding='utf-8', overwrite=True) as f:
+                f.write(json.dumps({'key': cache_key, 'data': dep_check_data}))
+        except OSError:
+            pass
+
+    def get_cache_key(self, executable, sys_path):
+        """
+        The data becomes stale when the interpreter changes, when anything is installed, the latter being reflected
+        by the modification times of the directories on `sys.path`, or when environment variables that influence
+        `sys.path` change.
+        """
+        import os
+        import platform
+
+        if executable is None:
+            return
+
+        paths = []
+        for path in (executable, *sys_path):
+            try:
+                path_stat = os.stat(path)
+            except OSError:
+                paths.append([path])
+            else:
+                paths.append([path, path_stat.st_size, path_stat.st_mtime_ns])
+
+        return {
+            'platform': [platform.release(), platform.version()],
+            'env_vars': [os.environ.get(env_var) for env_var in self.ENV_VARS],
+            'paths': paths,
+        }
+
 
 # Keep support for Python 2 for a while:
 # https://github.com/pypa/packaging/blob/20.9/packaging/markers.py#L267-L300
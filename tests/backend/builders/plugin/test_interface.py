@@ -1,3 +1,4 @@
+import subprocess
 from os.path import sep as path_sep
 
 import pytest
@@ -173,6 +174,115 @@ class TestDirectoryRecursion:
                 str(project_dir / 'foo' / 'bar.txt'),
             ]
 
+    def test_prune_unreachable_directories(self, temp_dir, mocker):
+        project_dir = temp_dir / 'project'
+        project_dir.ensure_dir_exists()
+
+        with project_dir.as_cwd():
+            config = {'tool': {'hatch': {'build': {'include': ['/foo/*.txt']}}}}
+            builder = BuilderInterface(str(project_dir), config=config)
+
+            foo = project_dir / 'foo'
+            foo.ensure_dir_exists()
+            (foo / 'bar.txt').touch()
+            (foo / 'sub').ensure_dir_exists()
+            (foo / 'sub' / 'baz.txt').touch()
+            (project_dir / 'node_modules' / 'pkg').ensure_dir_exists()
+            (project_dir / 'node_modules' / 'pkg' / 'index.txt').touch()
+
+            get_listing = mocker.spy(builder.file_tree, 'get_listing')
+
+            assert [f.path for f in builder.recurse_included_files()] == [str(project_dir / 'foo' / 'bar.txt')]
+            assert sorted(call.args[0] for call in get_listing.call_args_list) == [str(project_dir), str(foo)]
+
+    @pytest.mark.requires_unix
+    def test_file_status(self, temp_dir):
+        project_dir = temp_dir / 'project'
+        project_dir.ensure_dir_exists()
+
+        with project_dir.as_cwd():
+            builder = BuilderInterface(str(project_dir))
+
+            (project_dir / 'foo.txt').write_text('foo')
+            (project_dir / 'bar.txt').symlink_to(project_dir / 'foo.txt')
+
+            bar, foo = builder.recurse_included_files()
+
+            assert foo.stat.st_size == foo.get_stat().st_size == 3
+            assert bar.stat is None
+            assert bar.get_stat().st_size == 3
+
+    @pytest.mark.requires_unix
+    def test_vcs_file_listing(self, temp_dir):
+        project_dir = temp_dir / 'project'
+        project_dir.ensure_dir_exists()
+
+        with project_dir.as_cwd():
+            (project_dir / '.gitignore').write_text('build/\n*.log\n')
+            (project_dir / 'README.md').touch()
+            (project_dir / 'debug.log').touch()
+            package = project_dir / 'src' / 'foo'
+            package.ensure_dir_exists()
+            (package / '__init__.py').touch()
+            (package / 'removed.py').touch()
+            (project_dir / 'build' / 'lib').ensure_dir_exists()
+            (project_dir / 'build' / 'lib' / 'bar.py').touch()
+            (project_dir / 'docs').ensure_dir_exists()
+            (project_dir / 'docs' / 'index.md').touch()
+            (package / 'docs').symlink_to(project_dir / 'docs')
+
+            subprocess.check_output(['git', 'init'])
+            subprocess.check_output(['git', 'add', 'src'])
+            (package / 'removed.py').remove()
+
+            builder = BuilderInterface(str(project_dir))
+            expected = [(f.path, f.distribution_path) for f in builder.recurse_included_files()]
+
+            config = {'tool': {'hatch': {'build': {'vcs-file-listing': True}}}}
+            builder = BuilderInterface(str(project_dir), config=config)
+
+            assert builder.config.load_vcs_files() is not None
+            assert [(f.path, f.distribution_path) for f in builder.recurse_included_files()] == expected
+            assert str(project_dir / 'build' / 'lib' / 'bar.py') not in [path for path, _ in expected]
+
+    @pytest.mark.requires_unix
+    def test_vcs_file_listing_ignored_artifacts(self, temp_dir):
+        project_dir = temp_dir / 'project'
+        project_dir.ensure_dir_exists()
+
+        with project_dir.as_cwd():
+            (project_dir / '.gitignore').write_text('*.so\n*.log\n')
+            package = project_dir / 'foo'
+            package.ensure_dir_exists()
+            (package / '__init__.py').touch()
+            (package / 'ext.so').touch()
+            (package / 'debug.log').touch()
+
+            subprocess.check_output(['git', 'init'])
+            subprocess.check_output(['git', 'add', 'foo'])
+
+            config = {'tool': {'hatch': {'build': {'vcs-file-listing': True, 'artifacts': ['*.so']}}}}
+            builder = BuilderInterface(str(project_dir), config=config)
+
+            assert [f.path for f in builder.recurse_included_files()] == [
+                str(project_dir / '.gitignore'),
+                str(package / '__init__.py'),
+                str(package / 'ext.so'),
+            ]
+
+    def test_vcs_file_listing_fallback(self, temp_dir):
+        project_dir = temp_dir / 'project'
+        project_dir.ensure_dir_exists()
+
+        with project_dir.as_cwd():
+            (project_dir / 'README.md').touch()
+
+            config = {'tool': {'hatch': {'build': {'vcs-file-listing': True}}}}
+            builder = BuilderInterface(str(project_dir), config=config)
+
+            assert builder.config.load_vcs_files() is None
+            assert [f.path for f in builder.recurse_included_files()] == [str(project_dir / 'README.md')]
+
     def test_order(self, temp_dir):
         project_dir = temp_dir / 'project'
         project_dir.ensure_dir_exists()
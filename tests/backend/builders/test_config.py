@@ -105,6 +105,52 @@ class TestIgnoreVCS:
         assert builder.config.ignore_vcs is False
 
 
+class TestVCSFileListing:
+    def test_default(self, isolation):
+        builder = BuilderInterface(str(isolation))
+
+        assert builder.config.vcs_file_listing is builder.config.vcs_file_listing is False
+
+    def test_target(self, isolation):
+        config = {'tool': {'hatch': {'build': {'targets': {'foo': {'vcs-file-listing': True}}}}}}
+        builder = BuilderInterface(str(isolation), config=config)
+        builder.PLUGIN_NAME = 'foo'
+
+        assert builder.config.vcs_file_listing is True
+
+    def test_target_not_boolean(self, isolation):
+        config = {'tool': {'hatch': {'build': {'targets': {'foo': {'vcs-file-listing': 9000}}}}}}
+        builder = BuilderInterface(str(isolation), config=config)
+        builder.PLUGIN_NAME = 'foo'
+
+        with pytest.raises(TypeError, match='Field `tool.hatch.build.targets.foo.vcs-file-listing` must be a boolean'):
+            _ = builder.config.vcs_file_listing
+
+    def test_global(self, isolation):
+        config = {'tool': {'hatch': {'build': {'vcs-file-listing': True}}}}
+        builder = BuilderInterface(str(isolation), config=config)
+        builder.PLUGIN_NAME = 'foo'
+
+        assert builder.config.vcs_file_listing is True
+
+    def test_global_not_boolean(self, isolation):
+        config = {'tool': {'hatch': {'build': {'vcs-file-listing': 9000}}}}
+        builder = BuilderInterface(str(isolation), config=config)
+        builder.PLUGIN_NAME = 'foo'
+
+        with pytest.raises(TypeError, match='Field `tool.hatch.build.vcs-file-listing` must be a boolean'):
+            _ = builder.config.vcs_file_listing
+
+    def test_target_overrides_global(self, isolation):
+        config = {
+            'tool': {'hatch': {'build': {'vcs-file-listing': True, 'targets': {'foo': {'vcs-file-listing': False}}}}}
+        }
+        builder = BuilderInterface(str(isolation), config=config)
+        builder.PLUGIN_NAME = 'foo'
+
+        assert builder.config.vcs_file_listing is False
+
+
 class TestRequireRuntimeDependencies:
     def test_default(self, isolation):
         builder = BuilderInterface(str(isolation))
@@ -1558,3 +1604,98 @@ class TestPatternMatching:
 
         assert builder.config.include_path('foo/file.py')
         assert not builder.config.include_path('bar/file.py')
+
+    def test_batch(self, isolation):
+        config = {
+            'tool': {'hatch': {'build': {'include': ['foo', 'bar'], 'exclude': ['*.pyc'], 'artifacts': ['bar/*.pyc']}}}
+        }
+        builder = BuilderInterface(str(isolation), config=config)
+        paths = ['foo/a.py', 'foo/a.pyc', 'bar/b.py', 'bar/b.pyc', 'baz/c.py']
+
+        assert list(builder.config.include_paths(paths)) == ['foo/a.py', 'bar/b.py', 'bar/b.pyc']
+        assert list(builder.config.include_paths(paths)) == [p for p in paths if builder.config.include_path(p)]
+
+    def test_batch_only_packages(self, isolation):
+        config = {'tool': {'hatch': {'build': {'include': ['foo'], 'artifacts': ['*.so'], 'only-packages': True}}}}
+        builder = BuilderInterface(str(isolation), config=config)
+
+        assert list(builder.config.include_paths(['foo/a.py', 'foo/b.so'], is_package=False)) == ['foo/b.so']
+        assert list(builder.config.include_paths(['foo/a.py', 'foo/b.so'])) == ['foo/a.py', 'foo/b.so']
+
+
+class TestPatternReachable:
+    def test_no_include(self, isolation):
+        builder = BuilderInterface(str(isolation))
+
+        assert builder.config.path_is_reachable('foo')
+        assert builder.config.path_is_reachable(pjoin('foo', 'bar'))
+
+    def test_anchored(self, isolation):
+        config = {'tool': {'hatch': {'build': {'include': ['/foo/bar/*.py']}}}}
+        builder = BuilderInterface(str(isolation), config=config)
+
+        assert builder.config.path_is_reachable('foo')
+        assert builder.config.path_is_reachable(pjoin('foo', 'bar'))
+        assert not builder.config.path_is_reachable(pjoin('foo', 'baz'))
+        assert not builder.config.path_is_reachable(pjoin('foo', 'bar', 'baz'))
+        assert not builder.config.path_is_reachable('bar')
+
+    def test_directory(self, isolation):
+        config = {'tool': {'hatch': {'build': {'include': ['foo/bar/']}}}}
+        builder = BuilderInterface(str(isolation), config=config)
+
+        assert builder.config.path_is_reachable('foo')
+        assert builder.config.path_is_reachable(pjoin('foo', 'bar', 'baz'))
+        assert not builder.config.path_is_reachable(pjoin('foo', 'baz'))
+
+    def test_wildcard_component(self, isolation):
+        config = {'tool': {'hatch': {'build': {'include': ['foo/*/baz.py']}}}}
+        builder = BuilderInterface(str(isolation), config=config)
+
+        assert builder.config.path_is_reachable(pjoin('foo', 'bar'))
+        assert not builder.config.path_is_reachable('bar')
+
+    def test_recursive_wildcard(self, isolation):
+        config = {'tool': {'hatch': {'build': {'include': ['foo/**/baz.py']}}}}
+        builder = BuilderInterface(str(isolation), config=config)
+
+        assert builder.config.path_is_reachable(pjoin('foo', 'bar', 'baz'))
+        assert not builder.config.path_is_reachable('bar')
+
+    def test_unanchored(self, isolation):
+        config = {'tool': {'hatch': {'build': {'include': ['/foo', '*.py']}}}}
+        builder = BuilderInterface(str(isolation), config=config)
+
+        assert builder.config.path_is_reachable(pjoin('bar', 'baz'))
+
+    def test_negation_ignored(self, isolation):
+        config = {'tool': {'hatch': {'build': {'include': ['foo', '!bar']}}}}
+        builder = BuilderInterface(str(isolation), config=config)
+
+        assert builder.config.path_is_reachable('bar')
+
+    def test_packages(self, isolation):
+        config = {'tool': {'hatch': {'build': {'packages': ['src/foo']}}}}
+        builder = BuilderInterface(str(isolation), config=config)
+
+        assert builder.config.path_is_reachable(pjoin('src', 'foo', 'bar'))
+        assert not builder.config.path_is_reachable(pjoin('src', 'bar'))
+        assert not builder.config.path_is_reachable('tests')
+
+    def test_artifacts(self, isolation):
+        config = {'tool': {'hatch': {'build': {'include': ['/foo'], 'artifacts': ['/bar/*.so']}}}}
+        builder = BuilderInterface(str(isolation), config=config)
+
+        assert builder.config.path_is_reachable('bar')
+        assert not builder.config.path_is_reachable('baz')
+
+    def test_build_artifacts(self, isolation):
+        config = {'tool': {'hatch': {'build': {'include': ['/foo']}}}}
+        builder = BuilderInterface(str(isolation), config=config)
+
+        assert not builder.config.path_is_reachable('bar')
+
+        with builder.config.set_build_data({'artifacts': ['/bar/*.so'], 'force-include': {}}):
+            assert builder.config.path_is_reachable('bar')
+
+        assert not builder.config.path_is_reachable('bar')
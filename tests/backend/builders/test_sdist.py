@@ -1,10 +1,13 @@
+import gzip
 import os
 import tarfile
+import tempfile
+from io import BytesIO
 
 import pytest
 
 from hatchling.builders.plugin.interface import BuilderInterface
-from hatchling.builders.sdist import SdistBuilder
+from hatchling.builders.sdist import ParallelGzipFile, SdistArchive, SdistBuilder
 from hatchling.builders.utils import get_reproducible_timestamp
 from hatchling.metadata.spec import DEFAULT_METADATA_VERSION, get_core_metadata_constructors
 from hatchling.utils.constants import DEFAULT_BUILD_SCRIPT, DEFAULT_CONFIG_FILE
@@ -63,6 +66,94 @@ class TestCoreMetadataConstructor:
             _ = builder.config.core_metadata_constructor
 
 
+class TestCompressionLevel:
+    def test_default(self, isolation):
+        builder = SdistBuilder(str(isolation))
+
+        assert builder.config.compression_level == builder.config.compression_level == 9
+
+    def test_correct(self, isolation):
+        config = {'tool': {'hatch': {'build': {'targets': {'sdist': {'compression-level': 0}}}}}}
+        builder = SdistBuilder(str(isolation), config=config)
+
+        assert builder.config.compression_level == 0
+
+    def test_not_integer(self, isolation):
+        config = {'tool': {'hatch': {'build': {'targets': {'sdist': {'compression-level': '9'}}}}}}
+        builder = SdistBuilder(str(isolation), config=config)
+
+        with pytest.raises(
+            TypeError, match='Field `tool.hatch.build.targets.sdist.compression-level` must be an integer'
+        ):
+            _ = builder.config.compression_level
+
+    def test_out_of_range(self, isolation):
+        config = {'tool': {'hatch': {'build': {'targets': {'sdist': {'compression-level': 10}}}}}}
+        builder = SdistBuilder(str(isolation), config=config)
+
+        with pytest.raises(
+            ValueError, match='Field `tool.hatch.build.targets.sdist.compression-level` must be between 0 and 9'
+        ):
+            _ = builder.config.compression_level
+
+
+class TestWorkers:
+    def test_default(self, isolation):
+        builder = SdistBuilder(str(isolation))
+
+        assert builder.config.workers == builder.config.workers == 1
+
+    def test_correct(self, isolation):
+        config = {'tool': {'hatch': {'build': {'targets': {'sdist': {'workers': 4}}}}}}
+        builder = SdistBuilder(str(isolation), config=config)
+
+        assert builder.config.workers == 4
+
+    def test_not_integer(self, isolation):
+        config = {'tool': {'hatch': {'build': {'targets': {'sdist': {'workers': '4'}}}}}}
+        builder = SdistBuilder(str(isolation), config=config)
+
+        with pytest.raises(TypeError, match='Field `tool.hatch.build.targets.sdist.workers` must be an integer'):
+            _ = builder.config.workers
+
+    def test_less_than_one(self, isolation):
+        config = {'tool': {'hatch': {'build': {'targets': {'sdist': {'workers': 0}}}}}}
+        builder = SdistBuilder(str(isolation), config=config)
+
+        with pytest.raises(
+            ValueError, match='Field `tool.hatch.build.targets.sdist.workers` must be greater than or equal to 1'
+        ):
+            _ = builder.config.workers
+
+
+class TestParallelGzipFile:
+    @pytest.mark.parametrize('compression_level', [0, 1, 6, 9])
+    def test_round_trip(self, compression_level):
+        data = os.urandom(1024) * 3000
+
+        outputs = []
+        for workers in (2, 4):
+            buffer = BytesIO()
+            gz = ParallelGzipFile(buffer, compression_level, get_reproducible_timestamp(), workers)
+            for i in range(0, len(data), 10240):
+                gz.write(data[i : i + 10240])
+
+            assert gz.tell() == len(data)
+
+            gz.close()
+            outputs.append(buffer.getvalue())
+
+        assert outputs[0] == outputs[1]
+        assert gzip.decompress(outputs[0]) == data
+
+    def test_empty(self):
+        buffer = BytesIO()
+        gz = ParallelGzipFile(buffer, 9, None, 2)
+        gz.close()
+
+        assert gzip.decompress(buffer.getvalue()) == b''
+
+
 class TestConstructSetupPyFile:
     def test_default(self, helpers, isolation):
         config = {'project': {'name': 'my__app', 'version': '0.1.0'}}
@@ -631,6 +722,98 @@ class TestBuildStandard:
         stat = os.stat(str(extraction_directory / builder.project_id / 'PKG-INFO'))
         assert stat.st_mtime == get_reproducible_timestamp()
 
+    def test_default_compression_level(self, hatch, helpers, temp_dir):
+        project_name = 'My App'
+
+        with temp_dir.as_cwd():
+            result = hatch('new', project_name)
+
+        assert result.exit_code == 0, result.output
+
+        project_path = temp_dir / 'my-app'
+
+        artifacts = []
+        for compression_level in (0, 9):
+            config = {
+                'project': {'name': 'my__app', 'dynamic': ['version']},
+                'tool': {
+                    'hatch': {
+                        'version': {'path': 'my_app/__about__.py'},
+                        'build': {
+                            'targets': {'sdist': {'versions': ['standard'], 'compression-level': compression_level}}
+                        },
+                    },
+                },
+            }
+            builder = SdistBuilder(str(project_path), config=config)
+
+            build_path = temp_dir / f'dist{compression_level}'
+            build_path.mkdir()
+
+            with project_path.as_cwd():
+                artifacts.extend(builder.build(str(build_path)))
+
+        assert len(artifacts) == 2
+        assert os.path.getsize(artifacts[0]) > os.path.getsize(artifacts[1])
+
+        extraction_directory = temp_dir / '_archive'
+        extraction_directory.mkdir()
+
+        with tarfile.open(str(artifacts[0]), 'r:gz') as tar_archive:
+            tar_archive.extractall(str(extraction_directory))
+
+        expected_files = helpers.get_template_files(
+            'sdist.standard_default', project_name, relative_root=builder.project_id
+        )
+        helpers.assert_files(extraction_directory, expected_files, check_contents=True)
+
+    def test_default_workers(self, hatch, helpers, temp_dir):
+        project_name = 'My App'
+
+        with temp_dir.as_cwd():
+            result = hatch('new', project_name)
+
+        assert result.exit_code == 0, result.output
+
+        project_path = temp_dir / 'my-app'
+        (project_path / 'data.bin').write_bytes(os.urandom(1024) * 3000)
+
+        artifacts = []
+        for workers in (2, 4):
+            config = {
+                'project': {'name': 'my__app', 'dynamic': ['version']},
+                'tool': {
+                    'hatch': {
+                        'version': {'path': 'my_app/__about__.py'},
+                        'build': {'targets': {'sdist': {'versions': ['standard'], 'workers': workers}}},
+                    },
+                },
+            }
+            builder = SdistBuilder(str(project_path), config=config)
+
+            build_path = temp_dir / f'dist{workers}'
+            build_path.mkdir()
+
+            with project_path.as_cwd():
+                artifacts.extend(builder.build(str(build_path)))
+
+        assert len(artifacts) == 2
+
+        with open(artifacts[0], 'rb') as f1, open(artifacts[1], 'rb') as f2:
+            assert f1.read() == f2.read()
+
+        extraction_directory = temp_dir / '_archive'
+        extraction_directory.mkdir()
+
+        with tarfile.open(str(artifacts[0]), 'r:gz') as tar_archive:
+            tar_archive.extractall(str(extraction_directory))
+
+        (extraction_directory / builder.project_id / 'data.bin').remove()
+        expected_files = helpers.get_template_files(
+            'sdist.standard_default', project_name, relative_root=builder.project_id
+        )
+        helpers.assert_files(extraction_directory, expected_files, check_contents=True)
+
     def test_default_no_reproducible(self, hatch, helpers, temp_dir):
         project_name = 'My App'
 
@@ -1159,3 +1342,44 @@ class TestBuildStandard:
 
         stat = os.stat(str(extraction_directory / builder.project_id / 'PKG-INFO'))
         assert stat.st_mtime == get_reproducible_timestamp()
+
+    def test_default_build_directory_temporary_file(self, hatch, temp_dir, mocker):
+        project_name = 'My App'
+
+        with temp_dir.as_cwd():
+            result = hatch('new', project_name)
+
+        assert result.exit_code == 0, result.output
+
+        project_path = temp_dir / 'my-app'
+        config = {
+            'project': {'name': 'my__app', 'dynamic': ['version']},
+            'tool': {
+                'hatch': {
+                    'version': {'path': 'my_app/__about__.py'},
+                    'build': {'targets': {'sdist': {'versions': ['standard']}}},
+                },
+            },
+        }
+        builder = SdistBuilder(str(project_path), config=config)
+
+        build_path = project_path / 'dist'
+        build_path.mkdir()
+
+        mkstemp = mocker.spy(tempfile, 'mkstemp')
+        with project_path.as_cwd():
+            artifacts = list(builder.build(str(build_path)))
+
+        assert len(artifacts) == 1
+        assert mkstemp.call_args.kwargs['dir'] == str(build_path)
+        assert os.listdir(str(build_path)) == [os.path.basename(artifacts[0])]
+
+
+class TestSdistArchive:
+    def test_removed_on_error(self, temp_dir):
+        with pytest.raises(RuntimeError):
+            with SdistArchive('my_app-0.0.1', True, directory=str(temp_dir)) as archive:
+                assert os.path.dirname(archive.path) == str(temp_dir)
+                raise RuntimeError
+
+        assert not os.listdir(str(temp_dir))
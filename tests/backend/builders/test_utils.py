@@ -0,0 +1,352 @@
+import os
+import zipfile
+import zlib
+
+import pathspec
+import pytest
+
+from hatchling.builders import utils
+from hatchling.builders.utils import (
+    LARGE_FILE_SIZE,
+    CompiledPathSpec,
+    FileHashCache,
+    FileTree,
+    MappedFileReader,
+    hash_file,
+    iter_file_chunks,
+    safe_walk,
+    write_compressed_zip_entry,
+)
+
+
+class TestFileTree:
+    def test_walk(self, temp_dir):
+        (temp_dir / 'foo' / 'bar').ensure_dir_exists()
+        (temp_dir / 'foo' / 'bar' / 'baz.txt').touch()
+        (temp_dir / 'foo' / 'bar.txt').touch()
+        (temp_dir / 'foo.txt').touch()
+
+        def collect(walker):
+            results = []
+            for root, dirs, files in walker:
+                dirs.sort()
+                results.append((root, sorted(dirs), sorted(files)))
+
+            return results
+
+        assert collect(FileTree().walk(str(temp_dir))) == collect(safe_walk(str(temp_dir)))
+
+    def test_pruning(self, temp_dir):
+        (temp_dir / 'foo' / 'bar').ensure_dir_exists()
+        (temp_dir / 'baz').ensure_dir_exists()
+
+        roots = []
+        for root, dirs, _ in FileTree().walk(str(temp_dir)):
+            roots.append(os.path.relpath(root, str(temp_dir)))
+            dirs[:] = [d for d in dirs if d != 'foo']
+
+        assert roots == ['.', 'baz']
+
+    def test_missing(self, temp_dir):
+        assert list(FileTree().walk(str(temp_dir / 'foo'))) == []
+
+    def test_cached_listing(self, temp_dir, mocker):
+        (temp_dir / 'foo.txt').touch()
+
+        file_tree = FileTree()
+        list(file_tree.walk(str(temp_dir)))
+
+        # Pretend the directory was listed long after it was last modified
+        identifier, mtime, _, dirs, files = file_tree.listings[str(temp_dir)]
+        file_tree.listings[str(temp_dir)] = identifier, mtime, mtime + 60, dirs, files
+
+        scandir = mocker.spy(utils, 'scandir')
+        assert list(file_tree.walk(str(temp_dir))) == [(str(temp_dir), [], ['foo.txt'])]
+        assert not scandir.called
+
+    def test_entries(self, temp_dir):
+        (temp_dir / 'foo').ensure_dir_exists()
+        (temp_dir / 'foo.txt').write_text('bar')
+
+        file_tree = FileTree()
+        ((root, dirs, files, entries), _) = file_tree.walk_entries(str(temp_dir))
+
+        assert root == str(temp_dir)
+        assert dirs == ['foo']
+        assert files == ['foo.txt']
+        assert list(entries) == ['foo.txt']
+        assert entries['foo.txt'].stat().st_size == 3
+
+        # Cached listings do not provide entries as the status of files may have changed
+        identifier, mtime, _, dirs, files = file_tree.listings[str(temp_dir)]
+        file_tree.listings[str(temp_dir)] = identifier, mtime, mtime + 60, dirs, files
+
+        ((_, _, _, entries), _) = file_tree.walk_entries(str(temp_dir))
+        assert entries is None
+
+    def test_racy_listing(self, temp_dir):
+        (temp_dir / 'foo.txt').touch()
+
+        file_tree = FileTree()
+        list(file_tree.walk(str(temp_dir)))
+
+        # A modification in the same instant would not change the modification time of the directory
+        (temp_dir / 'bar.txt').touch()
+        identifier, _, listing_time, dirs, files = file_tree.listings[str(temp_dir)]
+        file_tree.listings[str(temp_dir)] = identifier, os.stat(str(temp_dir)).st_mtime, listing_time, dirs, files
+
+        ((_, _, files),) = file_tree.walk(str(temp_dir))
+        assert sorted(files) == ['bar.txt', 'foo.txt']
+
+    def test_modified(self, temp_dir):
+        (temp_dir / 'foo.txt').touch()
+
+        file_tree = FileTree()
+        list(file_tree.walk(str(temp_dir)))
+
+        (temp_dir / 'bar.txt').touch()
+        os.utime(str(temp_dir), (0, 0))
+
+        ((_, _, files),) = file_tree.walk(str(temp_dir))
+        assert sorted(files) == ['bar.txt', 'foo.txt']
+
+
+class TestCompiledPathSpec:
+    @pytest.mark.parametrize(
+        'patterns',
+        [
+            pytest.param(['foo', '/bar/*.py', '**/baz/'], id='positive'),
+            pytest.param(['*.pyc', '!keep.pyc', 'foo/', '!foo/bar/'], id='negated'),
+            pytest.param(['# comment', '', '[^a]*.txt', 'a/**/b'], id='special'),
+        ],
+    )
+    def test_equivalent(self, patterns):
+        spec = pathspec.PathSpec.from_lines(pathspec.patterns.GitWildMatchPattern, patterns)
+        matcher = CompiledPathSpec(spec)
+
+        for path in (
+            'foo',
+            'foo/',
+            'x/foo/y.txt',
+            'bar/a.py',
+            'bar/sub/a.py',
+            'x/baz/y.txt',
+            'x/baz',
+            'a.pyc',
+            'x/keep.pyc',
+            'foo/bar/keep.pyc',
+            'foo/bar/a.txt',
+            'b.txt',
+            'a.txt',
+            'a/x/y/b',
+        ):
+            assert matcher.match_file(path) is bool(spec.match_file(path)), path
+
+    def test_runs(self):
+        spec = pathspec.PathSpec.from_lines(pathspec.patterns.GitWildMatchPattern, ['a', 'b', '!c', 'd', 'e'])
+        matcher = CompiledPathSpec(spec)
+
+        assert [include for _, include in matcher.runs] == [True, False, True]
+
+    def test_last_match_wins(self):
+        spec = pathspec.PathSpec.from_lines(pathspec.patterns.GitWildMatchPattern, ['*.txt', '!foo.txt', 'foo*'])
+        matcher = CompiledPathSpec(spec)
+
+        assert matcher.match_file('foo.txt')
+        assert not matcher.match_file(os.path.join('bar', 'x.py'))
+        assert matcher.match_file(os.path.join('bar', 'foo.py'))
+
+
+class TestFileHashCache:
+    def test_reuse(self, temp_dir, mocker):
+        path = temp_dir / 'foo.txt'
+        path.write_text('foo')
+        os.utime(str(path), (0, 0))
+        cache_path = str(temp_dir / 'cache.json')
+
+        hash_cache = FileHashCache(cache_path)
+        digest = hash_cache.get_digest(str(path), os.stat(str(path)))
+        assert digest == hash_file(str(path))
+        hash_cache.save()
+
+        spy = mocker.spy(utils, 'hash_file')
+        hash_cache = FileHashCache(cache_path)
+        assert hash_cache.get_digest(str(path), os.stat(str(path))) == digest
+        assert not spy.called
+
+    def test_modified(self, temp_dir):
+        path = temp_dir / 'foo.txt'
+        path.write_text('foo')
+        os.utime(str(path), (0, 0))
+        cache_path = str(temp_dir / 'cache.json')
+
+        hash_cache = FileHashCache(cache_path)
+        hash_cache.get_digest(str(path), os.stat(str(path)))
+        hash_cache.save()
+
+        path.write_text('bar')
+        os.utime(str(path), (1, 1))
+
+        hash_cache = FileHashCache(cache_path)
+        assert hash_cache.get_digest(str(path), os.stat(str(path))) == hash_file(str(path))
+
+    def test_racy(self, temp_dir):
+        path = temp_dir / 'foo.txt'
+        path.write_text('foo')
+
+        hash_cache = FileHashCache(str(temp_dir / 'cache.json'))
+        hash_cache.get_digest(str(path), os.stat(str(path)))
+
+        assert not hash_cache.used_entries
+
+    def test_unused_entries_removed(self, temp_dir):
+        foo = temp_dir / 'foo.txt'
+        foo.write_text('foo')
+        bar = temp_dir / 'bar.txt'
+        bar.write_text('bar')
+        os.utime(str(foo), (0, 0))
+        os.utime(str(bar), (0, 0))
+        cache_path = str(temp_dir / 'cache.json')
+
+        hash_cache = FileHashCache(cache_path)
+        hash_cache.get_digest(str(foo), os.stat(str(foo)))
+        hash_cache.get_digest(str(bar), os.stat(str(bar)))
+        hash_cache.save()
+
+        hash_cache = FileHashCache(cache_path)
+        hash_cache.get_digest(str(foo), os.stat(str(foo)))
+        hash_cache.save()
+
+        assert list(FileHashCache(cache_path).entries) == [str(foo)]
+
+    def test_compression_level(self, temp_dir):
+        path = temp_dir / 'foo.whl'
+        path.write_bytes(b'foo')
+        cache_path = str(temp_dir / 'cache.json')
+
+        hash_cache = FileHashCache(cache_path)
+        assert hash_cache.get_compression_level(str(path)) is None
+        hash_cache.set_compression_level(str(path), 9)
+        hash_cache.save()
+
+        assert FileHashCache(cache_path).get_compression_level(str(path)) == 9
+
+        path.unlink()
+        path.write_bytes(b'bar')
+        os.utime(str(path), (0, 0))
+
+        assert FileHashCache(cache_path).get_compression_level(str(path)) is None
+
+    def test_invalid(self, temp_dir):
+        cache_path = temp_dir / 'cache.json'
+        cache_path.write_text('{')
+
+        assert FileHashCache(str(cache_path)).entries == {}
+
+
+class TestFileChunks:
+    def test_small(self, temp_dir):
+        path = temp_dir / 'foo.bin'
+        path.write_bytes(b'foo' * 10000)
+
+        chunks = list(iter_file_chunks(str(path), 30000))
+        assert all(isinstance(chunk, bytes) for chunk in chunks)
+        assert b''.join(chunks) == b'foo' * 10000
+
+    def test_large(self, temp_dir):
+        contents = os.urandom(1024) * (LARGE_FILE_SIZE // 1024 * 2 + 1)
+        path = temp_dir / 'foo.bin'
+        path.write_bytes(contents)
+
+        chunks = []
+        for chunk in iter_file_chunks(str(path), len(contents)):
+            assert isinstance(chunk, memoryview)
+            chunks.append(bytes(chunk))
+
+        assert len(chunks) == 3
+        assert b''.join(chunks) == contents
+        assert hash_file(str(path), len(contents)) == hash_file(str(path))
+
+    def test_large_empty(self, temp_dir):
+        path = temp_dir / 'foo.bin'
+        path.touch()
+
+        assert list(iter_file_chunks(str(path), LARGE_FILE_SIZE)) == []
+
+
+class TestMappedFileReader:
+    def test_read(self, temp_dir):
+        path = temp_dir / 'foo.txt'
+        path.write_bytes(b'foobarbaz')
+
+        with MappedFileReader(str(path)) as reader:
+            assert reader.read(3) == b'foo'
+            assert reader.read(4) == b'barb'
+            assert reader.read() == b'az'
+            assert reader.read(3) == b''
+
+    def test_close(self, temp_dir):
+        path = temp_dir / 'foo.txt'
+        path.write_bytes(b'foobarbaz')
+
+        with MappedFileReader(str(path)) as reader:
+            mapping = reader.mapping
+            chunk = reader.read(3)
+            assert chunk == b'foo'
+
+        assert mapping.closed
+        with pytest.raises(ValueError):
+            bytes(chunk)
+
+    def test_chunk_released_by_next_read(self, temp_dir):
+        path = temp_dir / 'foo.txt'
+        path.write_bytes(b'foobarbaz')
+
+        with MappedFileReader(str(path)) as reader:
+            chunk = reader.read(3)
+            assert reader.read(3) == b'bar'
+
+            with pytest.raises(ValueError):
+                bytes(chunk)
+
+    def test_empty(self, temp_dir):
+        path = temp_dir / 'foo.txt'
+        path.touch()
+
+        with MappedFileReader(str(path)) as reader:
+            assert reader.mapping is None
+            assert reader.read() == b''
+
+
+class TestWriteCompressedZipEntry:
+    @pytest.mark.parametrize('internals_available', [True, False])
+    @pytest.mark.parametrize('compression', [zipfile.ZIP_DEFLATED, zipfile.ZIP_STORED])
+    def test_write(self, temp_dir, monkeypatch, internals_available, compression):
+        if not internals_available:
+            monkeypatch.setattr(utils, 'ZIP_FILE_INTERNALS', ('_missing',))
+
+        data = b'foo' * 1000
+        if compression == zipfile.ZIP_DEFLATED:
+            compressor = zlib.compressobj(9, zlib.DEFLATED, -15)
+            compressed_data = compressor.compress(data) + compressor.flush()
+        else:
+            compressed_data = data
+
+        path = str(temp_dir / 'foo.zip')
+        with zipfile.ZipFile(path, 'w') as zf:
+            zf.writestr('bar.txt', b'bar')
+
+            zip_info = zipfile.ZipInfo('foo.txt')
+            zip_info.compress_type = compression
+            zip_info.CRC = zlib.crc32(data)
+            zip_info.file_size = len(data)
+            zip_info.compress_size = len(compressed_data)
+            write_compressed_zip_entry(zf, zip_info, compressed_data)
+
+            zf.writestr('baz.txt', b'baz')
+
+        with zipfile.ZipFile(path) as zf:
+            assert zf.testzip() is None
+            assert zf.namelist() == ['bar.txt', 'foo.txt', 'baz.txt']
+            assert zf.getinfo('foo.txt').compress_type == compression
+            assert zf.read('foo.txt') == data
@@ -1,14 +1,16 @@
 import os
 import platform
 import sys
+import tempfile
 import zipfile
 
 import pytest
 from packaging.tags import sys_tags
 
+from hatchling.builders import utils, wheel
 from hatchling.builders.plugin.interface import BuilderInterface
 from hatchling.builders.utils import get_known_python_major_versions
-from hatchling.builders.wheel import WheelBuilder
+from hatchling.builders.wheel import HASH_CACHE_FILE_NAME, PreviousWheelArchive, WheelArchive, WheelBuilder
 from hatchling.metadata.spec import DEFAULT_METADATA_VERSION, get_core_metadata_constructors
 from hatchling.utils.constants import DEFAULT_BUILD_SCRIPT
 
@@ -241,6 +243,93 @@ class TestExtraMetadata:
         }
 
 
+class TestWorkers:
+    def test_default(self, isolation):
+        builder = WheelBuilder(str(isolation))
+
+        assert builder.config.workers == builder.config.workers == 1
+
+    def test_correct(self, isolation):
+        config = {'tool': {'hatch': {'build': {'targets': {'wheel': {'workers': 4}}}}}}
+        builder = WheelBuilder(str(isolation), config=config)
+
+        assert builder.config.workers == 4
+
+    def test_not_integer(self, isolation):
+        config = {'tool': {'hatch': {'build': {'targets': {'wheel': {'workers': '4'}}}}}}
+        builder = WheelBuilder(str(isolation), config=config)
+
+        with pytest.raises(TypeError, match='Field `tool.hatch.build.targets.wheel.workers` must be an integer'):
+            _ = builder.config.workers
+
+    def test_boolean(self, isolation):
+        config = {'tool': {'hatch': {'build': {'targets': {'wheel': {'workers': True}}}}}}
+        builder = WheelBuilder(str(isolation), config=config)
+
+        with pytest.raises(TypeError, match='Field `tool.hatch.build.targets.wheel.workers` must be an integer'):
+            _ = builder.config.workers
+
+    def test_less_than_one(self, isolation):
+        config = {'tool': {'hatch': {'build': {'targets': {'wheel': {'workers': 0}}}}}}
+        builder = WheelBuilder(str(isolation), config=config)
+
+        with pytest.raises(
+            ValueError, match='Field `tool.hatch.build.targets.wheel.workers` must be greater than or equal to 1'
+        ):
+            _ = builder.config.workers
+
+
+class TestIncremental:
+    def test_default(self, isolation):
+        builder = WheelBuilder(str(isolation))
+
+        assert builder.config.incremental is builder.config.incremental is False
+
+    def test_correct(self, isolation):
+        config = {'tool': {'hatch': {'build': {'targets': {'wheel': {'incremental': True}}}}}}
+        builder = WheelBuilder(str(isolation), config=config)
+
+        assert builder.config.incremental is True
+
+    def test_not_boolean(self, isolation):
+        config = {'tool': {'hatch': {'build': {'targets': {'wheel': {'incremental': 9000}}}}}}
+        builder = WheelBuilder(str(isolation), config=config)
+
+        with pytest.raises(TypeError, match='Field `tool.hatch.build.targets.wheel.incremental` must be a boolean'):
+            _ = builder.config.incremental
+
+
+class TestCompressionLevel:
+    def test_default(self, isolation):
+        builder = WheelBuilder(str(isolation))
+
+        assert builder.config.compression_level == builder.config.compression_level == 6
+
+    def test_correct(self, isolation):
+        config = {'tool': {'hatch': {'build': {'targets': {'wheel': {'compression-level': 0}}}}}}
+        builder = WheelBuilder(str(isolation), config=config)
+
+        assert builder.config.compression_level == 0
+
+    def test_not_integer(self, isolation):
+        config = {'tool': {'hatch': {'build': {'targets': {'wheel': {'compression-level': '9'}}}}}}
+        builder = WheelBuilder(str(isolation), config=config)
+
+        with pytest.raises(
+            TypeError, match='Field `tool.hatch.build.targets.wheel.compression-level` must be an integer'
+        ):
+            _ = builder.config.compression_level
+
+    def test_out_of_range(self, isolation):
+        config = {'tool': {'hatch': {'build': {'targets': {'wheel': {'compression-level': 10}}}}}}
+        builder = WheelBuilder(str(isolation), config=config)
+
+        with pytest.raises(
+            ValueError, match='Field `tool.hatch.build.targets.wheel.compression-level` must be between 0 and 9'
+        ):
+            _ = builder.config.compression_level
+
+
 class TestConstructEntryPointsFile:
     def test_default(self, isolation):
         config = {'project': {}}
@@ -1381,6 +1470,288 @@ class TestBuildStandard:
         helpers.assert_files(extraction_directory, expected_files, check_contents=True)
 
     @fixed_pathlib_resolution
+    @pytest.mark.parametrize('reproducible', [True, False])
+    def test_default_workers_identical(self, hatch, temp_dir, reproducible):
+        project_name = 'My App'
+
+        with temp_dir.as_cwd():
+            result = hatch('new', project_name)
+
+        assert result.exit_code == 0, result.output
+
+        project_path = temp_dir / 'my-app'
+
+        package_path = project_path / 'my_app'
+        for i in range(50):
+            (package_path / f'module{i}.py').write_text(f'VALUE = {i!r}\n' * (i * 100))
+        (package_path / 'data.bin').write_bytes(os.urandom(100000))
+        (package_path / 'large.bin').write_bytes(os.urandom(1024) * 3000)
+
+        artifacts = []
+        for workers in (1, 4):
+            config = {
+                'project': {'name': 'my__app', 'dynamic': ['version']},
+                'tool': {
+                    'hatch': {
+                        'version': {'path': 'my_app/__about__.py'},
+                        'build': {
+                            'targets': {
+                                'wheel': {'versions': ['standard'], 'reproducible': reproducible, 'workers': workers}
+                            }
+                        },
+                    },
+                },
+            }
+            builder = WheelBuilder(str(project_path), config=config)
+
+            build_path = project_path / f'dist{workers}'
+            build_path.mkdir()
+
+            with project_path.as_cwd():
+                artifacts.extend(builder.build(str(build_path)))
+
+        assert len(artifacts) == 2
+
+        with zipfile.ZipFile(artifacts[1], 'r') as zip_archive:
+            assert zip_archive.testzip() is None
+
+        with open(artifacts[0], 'rb') as serial_file, open(artifacts[1], 'rb') as parallel_file:
+            assert serial_file.read() == parallel_file.read()
+
+    def test_default_compression_level_unsupported_by_zip_info(self, hatch, temp_dir, monkeypatch):
+        project_name = 'My App'
+
+        with temp_dir.as_cwd():
+            result = hatch('new', project_name)
+
+        assert result.exit_code == 0, result.output
+
+        project_path = temp_dir / 'my-app'
+        config = {
+            'project': {'name': 'my__app', 'dynamic': ['version']},
+            'tool': {
+                'hatch': {
+                    'version': {'path': 'my_app/__about__.py'},
+                    'build': {'targets': {'wheel': {'versions': ['standard'], 'compression-level': 1}}},
+                },
+            },
+        }
+        builder = WheelBuilder(str(project_path), config=config)
+
+        def build(build_path):
+            build_path.mkdir()
+            with project_path.as_cwd():
+                artifacts = list(builder.build(str(build_path)))
+
+            assert len(artifacts) == 1
+            with open(artifacts[0], 'rb') as f:
+                return f.read()
+
+        expected_artifact = build(project_path / 'dist1')
+
+        # Files are then compressed before being written like they are by workers
+        monkeypatch.setattr(wheel, 'ZIP_INFO_COMPRESSION_LEVEL', None)
+        assert build(project_path / 'dist2') == expected_artifact
+
+    @pytest.mark.parametrize('workers', [1, 4])
+    def test_default_no_compression(self, hatch, helpers, temp_dir, workers):
+        project_name = 'My App'
+
+        with temp_dir.as_cwd():
+            result = hatch('new', project_name)
+
+        assert result.exit_code == 0, result.output
+
+        project_path = temp_dir / 'my-app'
+        config = {
+            'project': {'name': 'my__app', 'dynamic': ['version']},
+            'tool': {
+                'hatch': {
+                    'version': {'path': 'my_app/__about__.py'},
+                    'build': {
+                        'targets': {'wheel': {'versions': ['standard'], 'compression-level': 0, 'workers': workers}}
+                    },
+                },
+            },
+        }
+        builder = WheelBuilder(str(project_path), config=config)
+
+        build_path = project_path / 'dist'
+        build_path.mkdir()
+
+        with project_path.as_cwd():
+            artifacts = list(builder.build(str(build_path)))
+
+        assert len(artifacts) == 1
+        expected_artifact = artifacts[0]
+
+        extraction_directory = temp_dir / '_archive'
+        extraction_directory.mkdir()
+
+        with zipfile.ZipFile(str(expected_artifact), 'r') as zip_archive:
+            assert zip_archive.testzip() is None
+            assert {zip_info.compress_type for zip_info in zip_archive.infolist()} == {zipfile.ZIP_STORED}
+
+            zip_archive.extractall(str(extraction_directory))
+
+        metadata_directory = f'{builder.project_id}.dist-info'
+        expected_files = helpers.get_template_files(
+            'wheel.standard_default_license_single', project_name, metadata_directory=metadata_directory
+        )
+        helpers.assert_files(extraction_directory, expected_files, check_contents=True)
+
+    @pytest.mark.parametrize('workers', [1, 4])
+    def test_default_incremental(self, hatch, temp_dir, mocker, workers):
+        project_name = 'My App'
+
+        with temp_dir.as_cwd():
+            result = hatch('new', project_name)
+
+        assert result.exit_code == 0, result.output
+
+        project_path = temp_dir / 'my-app'
+
+        package_path = project_path / 'my_app'
+        for i in range(10):
+            (package_path / f'module{i}.py').write_text(f'VALUE = {i!r}\n' * 100)
+
+        def build(incremental):
+            config = {
+                'project': {'name': 'my__app', 'dynamic': ['version']},
+                'tool': {
+                    'hatch': {
+                        'version': {'path': 'my_app/__about__.py'},
+                        'build': {
+                            'targets': {
+                                'wheel': {'versions': ['standard'], 'incremental': incremental, 'workers': workers}
+                            }
+                        },
+                    },
+                },
+            }
+            builder = WheelBuilder(str(project_path), config=config)
+
+            with project_path.as_cwd():
+                artifacts = list(builder.build(str(build_path)))
+
+            assert len(artifacts) == 1
+            with open(artifacts[0], 'rb') as f:
+                return f.read()
+
+        build_path = project_path / 'dist'
+        build_path.mkdir()
+
+        build(True)
+        (package_path / 'module0.py').write_text('VALUE = None\n')
+
+        spy = mocker.spy(PreviousWheelArchive, 'read_compressed_data')
+        incremental_artifact = build(True)
+
+        # Every file except the modified one
+        assert spy.call_count == 11
+
+        assert incremental_artifact == build(False)
+
+    def test_default_incremental_compression_level_changed(self, hatch, temp_dir, mocker):
+        project_name = 'My App'
+
+        with temp_dir.as_cwd():
+            result = hatch('new', project_name)
+
+        assert result.exit_code == 0, result.output
+
+        project_path = temp_dir / 'my-app'
+
+        package_path = project_path / 'my_app'
+        for i in range(10):
+            (package_path / f'module{i}.py').write_text(f'VALUE = {i!r}\n' * 100)
+
+        def build(incremental, compression_level):
+            config = {
+                'project': {'name': 'my__app', 'dynamic': ['version']},
+                'tool': {
+                    'hatch': {
+                        'version': {'path': 'my_app/__about__.py'},
+                        'build': {
+                            'targets': {
+                                'wheel': {
+                                    'versions': ['standard'],
+                                    'incremental': incremental,
+                                    'compression-level': compression_level,
+                                }
+                            }
+                        },
+                    },
+                },
+            }
+            builder = WheelBuilder(str(project_path), config=config)
+
+            with project_path.as_cwd():
+                artifacts = list(builder.build(str(build_path)))
+
+            assert len(artifacts) == 1
+            with open(artifacts[0], 'rb') as f:
+                return f.read()
+
+        build_path = project_path / 'dist'
+        build_path.mkdir()
+
+        build(True, 1)
+
+        spy = mocker.spy(PreviousWheelArchive, 'read_compressed_data')
+        incremental_artifact = build(True, 9)
+        assert not spy.called
+
+        # The level is recorded so unchanged files are reused again
+        build(True, 9)
+        assert spy.call_count == 12
+
+        assert incremental_artifact == build(False, 9)
+
+    def test_default_incremental_hash_cache(self, hatch, temp_dir, mocker):
+        project_name = 'My App'
+
+        with temp_dir.as_cwd():
+            result = hatch('new', project_name)
+
+        assert result.exit_code == 0, result.output
+
+        project_path = temp_dir / 'my-app'
+
+        # Pretend that files were last modified long ago so that their digests may be cached
+        for root, _, files in os.walk(str(project_path)):
+            for f in files:
+                os.utime(os.path.join(root, f), (0, 0))
+
+        config = {
+            'project': {'name': 'my__app', 'dynamic': ['version']},
+            'tool': {
+                'hatch': {
+                    'version': {'path': 'my_app/__about__.py'},
+                    'build': {'targets': {'wheel': {'versions': ['standard'], 'incremental': True}}},
+                },
+            },
+        }
+        builder = WheelBuilder(str(project_path), config=config)
+
+        build_path = project_path / 'dist'
+        build_path.mkdir()
+
+        with project_path.as_cwd():
+            list(builder.build(str(build_path)))
+
+        assert (build_path / HASH_CACHE_FILE_NAME).is_file()
+
+        spy = mocker.spy(utils, 'hash_file')
+        with project_path.as_cwd():
+            artifacts = list(builder.build(str(build_path)))
+
+        assert len(artifacts) == 1
+        assert not spy.called
+
+        builder.clean(str(build_path), ['standard'])
+        assert not (build_path / HASH_CACHE_FILE_NAME).exists()
+
     def test_editable_default(self, hatch, helpers, temp_dir, config_file):
         config_file.model.template.plugins['default']['src-layout'] = True
         config_file.save()
@@ -1609,3 +1980,44 @@ class TestBuildStandard:
             namespace='namespace',
         )
         helpers.assert_files(extraction_directory, expected_files, check_contents=True)
+
+    def test_default_build_directory_temporary_file(self, hatch, temp_dir, mocker):
+        project_name = 'My App'
+
+        with temp_dir.as_cwd():
+            result = hatch('new', project_name)
+
+        assert result.exit_code == 0, result.output
+
+        project_path = temp_dir / 'my-app'
+        config = {
+            'project': {'name': 'my__app', 'dynamic': ['version']},
+            'tool': {
+                'hatch': {
+                    'version': {'path': 'my_app/__about__.py'},
+                    'build': {'targets': {'wheel': {'versions': ['standard']}}},
+                },
+            },
+        }
+        builder = WheelBuilder(str(project_path), config=config)
+
+        build_path = project_path / 'dist'
+        build_path.mkdir()
+
+        mkstemp = mocker.spy(tempfile, 'mkstemp')
+        with project_path.as_cwd():
+            artifacts = list(builder.build(str(build_path)))
+
+        assert len(artifacts) == 1
+        assert mkstemp.call_args.kwargs['dir'] == str(build_path)
+        assert os.listdir(str(build_path)) == [os.path.basename(artifacts[0])]
+
+
+class TestWheelArchive:
+    def test_removed_on_error(self, temp_dir):
+        with pytest.raises(RuntimeError):
+            with WheelArchive('my_app-0.0.1', True, directory=str(temp_dir)) as archive:
+                assert os.path.dirname(archive.path) == str(temp_dir)
+                raise RuntimeError
+
+        assert not os.listdir(str(temp_dir))
@@ -60,3 +60,32 @@ def test_extra_met(platform):
     with TempVirtualEnv(sys.executable, platform) as venv:
         platform.run_command(['pip', 'install', 'requests[security]==2.25.1'], check=True, capture_output=True)
         assert dependencies_in_sync([Requirement('requests[security]==2.25.1')], venv.sys_path)
+
+
+def test_dependency_found_non_normalized_name(temp_dir):
+    metadata_dir = temp_dir / 'Foo_Bar-1.0.dist-info'
+    metadata_dir.mkdir()
+    (metadata_dir / 'METADATA').write_text('Metadata-Version: 2.1\nName: Foo.Bar\nVersion: 1.0\n')
+
+    assert dependencies_in_sync([Requirement('foo-bar==1.0')], [str(temp_dir)])
+    assert not dependencies_in_sync([Requirement('foo-bar>1')], [str(temp_dir)])
+
+
+def test_unrequested_metadata_not_read(temp_dir):
+    for name in ('foo', 'bar'):
+        metadata_dir = temp_dir / f'{name}-1.0.dist-info'
+        metadata_dir.mkdir()
+        (metadata_dir / 'METADATA').write_text(f'Metadata-Version: 2.1\nName: {name}\nVersion: 1.0\n')
+
+    # Without a name this would break discovery of every other distribution
+    (temp_dir / 'broken-1.0.dist-info').mkdir()
+
+    assert dependencies_in_sync([Requirement('foo'), Requirement('bar')], [str(temp_dir)])
+    assert not dependencies_in_sync([Requirement('baz')], [str(temp_dir)])
+
+
+def test_dependency_found_egg_info_file(temp_dir):
+    (temp_dir / 'Foo_Bar-1.0-py3.9.egg-info').write_text('Metadata-Version: 1.1\nName: Foo-Bar\nVersion: 1.0\n')
+
+    assert dependencies_in_sync([Requirement('foo-bar==1.0')], [str(temp_dir)])
+    assert not dependencies_in_sync([Requirement('foo-bar>1')], [str(temp_dir)])
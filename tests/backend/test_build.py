@@ -1,4 +1,12 @@
-from hatchling.build import build_editable, build_sdist, build_wheel
+import zipfile
+
+from hatchling.build import (
+    build_editable,
+    build_sdist,
+    build_wheel,
+    prepare_metadata_for_build_editable,
+    prepare_metadata_for_build_wheel,
+)
 
 
 def test_sdist(hatch, helpers, temp_dir):
@@ -113,3 +121,97 @@ def test_editable(hatch, helpers, temp_dir):
     assert len(build_artifacts) == 1
     assert expected_artifact == str(build_artifacts[0].name)
     assert expected_artifact.endswith('.whl')
+
+
+def test_prepare_metadata_for_build_wheel(hatch, helpers, temp_dir):
+    project_name = 'My App'
+
+    with temp_dir.as_cwd():
+        result = hatch('new', project_name)
+
+    assert result.exit_code == 0, result.output
+
+    project_path = temp_dir / 'my-app'
+    project_config = project_path / 'pyproject.toml'
+    project_config.write_text(
+        helpers.dedent(
+            """
+            [project]
+            name = 'my__app'
+            dynamic = [ 'version' ]
+
+            [tool.hatch.version]
+            path = 'my_app/__about__.py'
+            """
+        )
+    )
+
+    metadata_path = project_path / 'metadata'
+    metadata_path.mkdir()
+    build_path = project_path / 'dist'
+    build_path.mkdir()
+
+    with project_path.as_cwd():
+        metadata_directory = prepare_metadata_for_build_wheel(str(metadata_path))
+        expected_artifact = build_wheel(str(build_path), None, str(metadata_path / metadata_directory))
+
+    assert metadata_directory == 'my_app-0.0.1.dist-info'
+    assert sorted(path.name for path in (metadata_path / metadata_directory).iterdir()) == [
+        'METADATA',
+        'WHEEL',
+        'entry_points.txt',
+        'license_files',
+    ]
+
+    with zipfile.ZipFile(str(build_path / expected_artifact), 'r') as zip_archive:
+        assert (
+            zip_archive.read('{}/METADATA'.format(metadata_directory))
+            == (metadata_path / metadata_directory / 'METADATA').read_bytes()
+        )
+
+
+def test_prepare_metadata_for_build_editable(hatch, helpers, temp_dir):
+    project_name = 'My App'
+
+    with temp_dir.as_cwd():
+        result = hatch('new', project_name)
+
+    assert result.exit_code == 0, result.output
+
+    project_path = temp_dir / 'my-app'
+    project_config = project_path / 'pyproject.toml'
+    project_config.write_text(
+        helpers.dedent(
+            """
+            [project]
+            name = 'my__app'
+            dynamic = [ 'version' ]
+
+            [tool.hatch.version]
+            path = 'my_app/__about__.py'
+            """
+        )
+    )
+
+    metadata_path = project_path / 'metadata'
+    metadata_path.mkdir()
+    build_path = project_path / 'dist'
+    build_path.mkdir()
+
+    with project_path.as_cwd():
+        metadata_directory = prepare_metadata_for_build_editable(str(metadata_path))
+        expected_artifact = build_editable(str(build_path), None, str(metadata_path / metadata_directory))
+
+    assert metadata_directory == 'my_app-0.0.1.dist-info'
+    assert sorted(path.name for path in (metadata_path / metadata_directory).iterdir()) == [
+        'METADATA',
+        'WHEEL',
+        'entry_points.txt',
+        'license_files',
+    ]
+
+    with zipfile.ZipFile(str(build_path / expected_artifact), 'r') as zip_archive:
+        assert (
+            zip_archive.read('{}/METADATA'.format(metadata_directory))
+            == (metadata_path / metadata_directory / 'METADATA').read_bytes()
+        )
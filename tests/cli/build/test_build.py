@@ -1131,3 +1131,66 @@ def test_build_dependencies(hatch, temp_dir, helpers):
         {wheel_path.relative_to(path)}
         """
     )
+
+
+@pytest.mark.allow_backend_process
+def test_batch(hatch, temp_dir, helpers, mocker):
+    mocker.patch('hatch.env.virtual.VirtualEnvironment.build_environment')
+
+    project_name = 'My App'
+
+    with temp_dir.as_cwd():
+        result = hatch('new', project_name)
+        assert result.exit_code == 0, result.output
+
+    path = temp_dir / 'my-app'
+
+    with path.as_cwd():
+        result = hatch('build', '--batch')
+
+    assert result.exit_code == 0, result.output
+
+    build_directory = path / 'dist'
+    assert build_directory.is_dir()
+
+    artifacts = list(build_directory.iterdir())
+    assert len(artifacts) == 2
+
+    sdist_path = [artifact for artifact in artifacts if artifact.name.endswith('.tar.gz')][0]
+    wheel_path = [artifact for artifact in artifacts if artifact.name.endswith('.whl')][0]
+
+    assert result.output == helpers.dedent(
+        f"""
+        Setting up build environment
+        [sdist]
+        {sdist_path.relative_to(path)}
+
+        [wheel]
+        {wheel_path.relative_to(path)}
+        """
+    )
+
+
+@pytest.mark.allow_backend_process
+def test_batch_unknown_target(hatch, temp_dir, helpers, mocker):
+    mocker.patch('hatch.env.virtual.VirtualEnvironment.build_environment')
+
+    project_name = 'My App'
+
+    with temp_dir.as_cwd():
+        result = hatch('new', project_name)
+        assert result.exit_code == 0, result.output
+
+    path = temp_dir / 'my-app'
+
+    with path.as_cwd():
+        result = hatch('build', '--batch', '-t', 'wheel', '-t', 'foo')
+
+    assert result.exit_code == 1, result.output
+    assert result.output.endswith(
+        helpers.dedent(
+            """
+            Unknown build targets: foo
+            """
+        )
+    )
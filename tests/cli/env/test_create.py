@@ -628,6 +628,95 @@ def test_matrix(hatch, helpers, temp_dir, config_file):
     assert env_dirs[1].name == 'test.9000'
 
 
+def test_matrix_parallel(hatch, helpers, temp_dir, config_file):
+    config_file.model.template.plugins['default']['tests'] = False
+    config_file.save()
+
+    project_name = 'My App'
+
+    with temp_dir.as_cwd():
+        result = hatch('new', project_name)
+
+    assert result.exit_code == 0, result.output
+
+    project_path = temp_dir / 'my-app'
+    data_path = temp_dir / 'data'
+    data_path.mkdir()
+
+    project = Project(project_path)
+    helpers.update_project_environment(project, 'default', {'skip-install': True, **project.config.envs['default']})
+    helpers.update_project_environment(project, 'test', {'matrix': [{'version': ['9000', '42']}]})
+
+    with project_path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path)}):
+        result = hatch('env', 'create', 'test', '--parallel', '2')
+
+    assert result.exit_code == 0, result.output
+    assert result.output == helpers.dedent(
+        """
+        Creating 2 environments
+        Creating environment: test.9000
+        Creating environment: test.42
+        """
+    )
+
+    storage_path = next((data_path / 'env' / 'virtual').iterdir())
+    assert sorted(path.name for path in storage_path.iterdir()) == ['test.42', 'test.9000']
+
+    with project_path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path)}):
+        result = hatch('env', 'create', 'test', '-j', '0')
+
+    assert result.exit_code == 0, result.output
+    assert result.output == helpers.dedent(
+        """
+        Environment `test.9000` already exists
+        Environment `test.42` already exists
+        """
+    )
+
+
+def test_matrix_parallel_error(hatch, helpers, temp_dir, config_file):
+    config_file.model.template.plugins['default']['tests'] = False
+    config_file.save()
+
+    project_name = 'My App'
+
+    with temp_dir.as_cwd():
+        result = hatch('new', project_name)
+
+    assert result.exit_code == 0, result.output
+
+    project_path = temp_dir / 'my-app'
+    data_path = temp_dir / 'data'
+    data_path.mkdir()
+
+    project = Project(project_path)
+    helpers.update_project_environment(
+        project,
+        'test',
+        {
+            'matrix': [{'version': ['9000', '42']}],
+            'pre-install-commands': ['python -c "import sys;sys.exit(7)"'],
+            'overrides': {'matrix': {'version': {'skip-install': {'value': True, 'if': ['9000']}}}},
+        },
+    )
+
+    with project_path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path)}):
+        result = hatch('env', 'create', 'test', '-j', '2')
+
+    assert result.exit_code == 7
+    assert result.output == helpers.dedent(
+        """
+        Creating 2 environments
+        Creating environment: test.9000
+        Creating environment: test.42
+        Running pre-installation commands
+        Failed with exit code: 7
+        Failed to create 1 environment:
+        test.42 -> exit code 7
+        """
+    )
+
+
 def test_incompatible_single(hatch, helpers, temp_dir, config_file):
     config_file.model.template.plugins['default']['tests'] = False
     config_file.save()
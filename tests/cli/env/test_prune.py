@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 from hatch.config.constants import AppEnvVars
@@ -83,6 +85,36 @@ def test_all(hatch, helpers, temp_dir_data, config_file):
     assert not result.output
 
     assert not storage_path.is_dir()
+    assert not list(env_cache_path.iterdir())
+
+
+def test_sequential_removal(hatch, helpers, temp_dir_data, config_file, mocker):
+    config_file.model.template.plugins['default']['tests'] = False
+    config_file.save()
+
+    project_name = 'My App'
+
+    with temp_dir_data.as_cwd():
+        result = hatch('new', project_name)
+
+    assert result.exit_code == 0, result.output
+
+    project_path = temp_dir_data / 'my-app'
+
+    project = Project(project_path)
+    helpers.update_project_environment(project, 'foo', {})
+
+    mocker.patch('hatch.env.virtual.VirtualEnvironment.CONCURRENT_REMOVAL', False)
+    mocker.patch('hatch.env.virtual.VirtualEnvironment.exists', return_value=True)
+    remove = mocker.patch('hatch.env.virtual.VirtualEnvironment.remove')
+    submit = mocker.spy(ThreadPoolExecutor, 'submit')
+
+    with project_path.as_cwd():
+        result = hatch('env', 'prune')
+
+    assert result.exit_code == 0, result.output
+    assert remove.call_count == 2
+    submit.assert_not_called()
 
 
 def test_incompatible_ok(hatch, helpers, temp_dir_data, config_file):
@@ -116,3 +116,93 @@ def test_filter(hatch, helpers, temp_dir, config_file):
 
     python_path = str(output_file.read_text()).strip()
     assert str(env_path) in python_path
+
+
+def test_parallel(hatch, helpers, temp_dir, config_file):
+    config_file.model.template.plugins['default']['tests'] = False
+    config_file.save()
+
+    project_name = 'My App'
+
+    with temp_dir.as_cwd():
+        result = hatch('new', project_name)
+
+    assert result.exit_code == 0, result.output
+
+    project_path = temp_dir / 'my-app'
+    data_path = temp_dir / 'data'
+    data_path.mkdir()
+
+    project = Project(project_path)
+    helpers.update_project_environment(project, 'default', {'skip-install': True, **project.config.envs['default']})
+    helpers.update_project_environment(project, 'test', {'matrix': [{'version': ['9000', '42']}]})
+
+    with project_path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path)}):
+        result = hatch(
+            'env',
+            'run',
+            '--env',
+            'test',
+            '--parallel',
+            '2',
+            '--',
+            'python',
+            '-c',
+            "import os,sys;open('test.txt', 'a').write(sys.executable+os.linesep[-1])",
+        )
+
+    assert result.exit_code == 0, result.output
+    assert result.output == helpers.dedent(
+        """
+        ────────────────────────────────── test.9000 ───────────────────────────────────
+        Creating environment: test.9000
+        ─────────────────────────────────── test.42 ────────────────────────────────────
+        Creating environment: test.42
+        """
+    )
+
+    env_data_path = data_path / 'env' / 'virtual'
+    storage_path = next(env_data_path.iterdir())
+    env_paths = sorted(str(path) for path in storage_path.iterdir())
+    assert sorted(path.name for path in storage_path.iterdir()) == ['test.42', 'test.9000']
+
+    python_paths = (project_path / 'test.txt').read_text().splitlines()
+    assert len(python_paths) == 2
+    for env_path in env_paths:
+        assert any(python_path.startswith(env_path) for python_path in python_paths)
+
+
+def test_parallel_failure(hatch, helpers, temp_dir, config_file):
+    config_file.model.template.plugins['default']['tests'] = False
+    config_file.save()
+
+    project_name = 'My App'
+
+    with temp_dir.as_cwd():
+        result = hatch('new', project_name)
+
+    assert result.exit_code == 0, result.output
+
+    project_path = temp_dir / 'my-app'
+    data_path = temp_dir / 'data'
+    data_path.mkdir()
+
+    project = Project(project_path)
+    helpers.update_project_environment(project, 'default', {'skip-install': True, **project.config.envs['default']})
+    helpers.update_project_environment(project, 'test', {'matrix': [{'version': ['9000', '42']}]})
+
+    with project_path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path)}):
+        result = hatch(
+            'env', 'run', '-e', 'test', '-i', 'version=42', '-j', '0', '--', 'python', '-c', 'import sys;sys.exit(3)'
+        )
+
+    assert result.exit_code == 3, result.output
+    assert result.output == helpers.dedent(
+        """
+        ─────────────────────────────────── test.42 ────────────────────────────────────
+        Creating environment: test.42
+
+        Failed in 1 environment:
+        test.42 -> exit code 3
+        """
+    )
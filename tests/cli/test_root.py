@@ -1,4 +1,5 @@
 import os
+import sys
 
 from hatch.config.constants import ConfigEnvVars
 from hatch.config.user import ConfigFile
@@ -36,3 +37,15 @@ def test_no_config_file(hatch, config_file):
 
     assert result.exit_code == 1
     assert result.output == f'The selected config file `{str(config_file.path)}` does not exist.\n'
+
+
+def test_lazy_imports(platform):
+    output = platform.check_command_output(
+        [
+            sys.executable,
+            '-c',
+            "import sys;import hatch.cli;print(sorted(m for m in sys.modules if m.startswith(('hatch.cli.', 'rich'))))",
+        ]
+    )
+
+    assert output.strip() == str(['hatch.cli.application', 'hatch.cli.lazy', 'hatch.cli.terminal'])
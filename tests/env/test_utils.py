@@ -0,0 +1,24 @@
+from hatch.env.plugin.interface import EnvironmentInterface
+from hatch.env.utils import accepts_cache_directory
+
+
+class TestAcceptsCacheDirectory:
+    def test_inherited(self):
+        class Environment(EnvironmentInterface):
+            pass
+
+        assert accepts_cache_directory(Environment)
+
+    def test_keyword_arguments(self):
+        class Environment(EnvironmentInterface):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+
+        assert accepts_cache_directory(Environment)
+
+    def test_explicit_constructor(self):
+        class Environment(EnvironmentInterface):
+            def __init__(self, root, metadata, name, config, data_directory, platform, verbosity, app=None):
+                super().__init__(root, metadata, name, config, data_directory, platform, verbosity, app)
+
+        assert not accepts_cache_directory(Environment)
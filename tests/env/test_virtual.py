@@ -0,0 +1,243 @@
+import os
+import sys
+
+import pytest
+
+import hatchling.dep.core
+from hatch.env.virtual import VirtualEnvironment, VirtualEnvTemplate
+from hatch.project.core import Project
+from hatch.venv.core import VirtualEnv
+
+
+def get_environment(isolation, data_dir, platform, env_config=None):
+    config = {
+        'project': {'name': 'my_app', 'version': '0.0.1'},
+        'tool': {'hatch': {'envs': {'default': env_config or {}}}},
+    }
+    project = Project(isolation, config=config)
+    return VirtualEnvironment(
+        isolation, project.metadata, 'default', project.config.envs['default'], data_dir, platform, 0
+    )
+
+
+class TestBuildEnvironment:
+    def test_cached(self, isolation, temp_dir, platform):
+        environment = get_environment(isolation, temp_dir, platform)
+
+        with environment.build_environment([]):
+            first_executable = platform.modules.shutil.which('python')
+
+        build_env_paths = list(environment.build_cache_path.iterdir())
+        assert len(build_env_paths) == 1
+
+        with environment.build_environment([]):
+            second_executable = platform.modules.shutil.which('python')
+
+        assert list(environment.build_cache_path.iterdir()) == build_env_paths
+        assert first_executable == second_executable
+        assert first_executable.startswith(str(build_env_paths[0]))
+
+    def test_path_normalized(self, isolation, temp_dir, platform):
+        environment = get_environment(isolation, temp_dir, platform)
+
+        assert environment.get_build_environment_path(
+            ['Foo_Bar>=1', 'hatchling']
+        ) == environment.get_build_environment_path(['hatchling', 'foo-bar>=1'])
+        assert environment.get_build_environment_path(['foo-bar>=1']) != environment.get_build_environment_path(
+            ['foo-bar>=2']
+        )
+
+    def test_prune_least_recently_used(self, isolation, temp_dir, platform):
+        environment = get_environment(isolation, temp_dir, platform)
+        environment.BUILD_ENVIRONMENT_CACHE_SIZE = 2
+
+        for i in range(4):
+            build_env_path = environment.build_cache_path / str(i)
+            build_env_path.ensure_dir_exists()
+            os.utime(build_env_path, (i, i))
+
+        environment.prune_build_environments()
+
+        assert sorted(path.name for path in environment.build_cache_path.iterdir()) == ['2', '3']
+
+
+class TestTemplate:
+    @pytest.mark.requires_unix
+    def test_clone(self, temp_dir, platform, extract_installed_requirements):
+        template_dir = temp_dir / 'templates' / 'template'
+        template = VirtualEnvTemplate(template_dir, sys.executable, platform)
+
+        for name in ('venv1', 'venv2'):
+            venv_dir = temp_dir / name
+            assert template.clone(venv_dir)
+
+            venv = VirtualEnv(venv_dir, platform)
+            assert venv.exists()
+            assert str(template_dir) not in (venv_dir / 'pyvenv.cfg').read_text()
+            for path in venv.executables_directory.iterdir():
+                if not path.is_symlink():
+                    assert str(template_dir) not in path.read_text()
+
+            with venv:
+                output = platform.run_command(['pip', 'freeze'], check=True, capture_output=True).stdout.decode('utf-8')
+                assert not extract_installed_requirements(output.splitlines())
+
+                output = platform.run_command(['pip', '--version'], check=True, capture_output=True).stdout.decode(
+                    'utf-8'
+                )
+                assert str(venv_dir) in output
+
+        assert [path.name for path in template_dir.parent.iterdir()] == ['template']
+
+    @pytest.mark.requires_unix
+    @pytest.mark.parametrize('link_files', [False, True])
+    def test_clone_isolated(self, temp_dir, platform, link_files):
+        template_dir = temp_dir / 'templates' / 'template'
+        template = VirtualEnvTemplate(template_dir, sys.executable, platform)
+
+        venv_dirs = [temp_dir / 'venv1', temp_dir / 'venv2']
+        for venv_dir in venv_dirs:
+            assert template.clone(venv_dir, link_files=link_files)
+
+        def get_package_file(directory):
+            return next(directory.glob('lib/*/site-packages/pip/__init__.py'))
+
+        original_contents = get_package_file(template_dir).read_bytes()
+        with open(get_package_file(venv_dirs[0]), 'ab') as f:
+            f.write(b'# modified\n')
+
+        if link_files:
+            # Linked files are shared by the template and every environment cloned from it
+            assert get_package_file(template_dir).read_bytes() != original_contents
+            assert get_package_file(venv_dirs[1]).samefile(get_package_file(template_dir))
+        else:
+            assert get_package_file(template_dir).read_bytes() == original_contents
+            assert get_package_file(venv_dirs[1]).read_bytes() == original_contents
+
+    @pytest.mark.parametrize('env_config, link_files', [({}, False), ({'link-template-files': True}, True)])
+    def test_link_files_option(self, isolation, temp_dir, platform, mocker, env_config, link_files):
+        clone = mocker.patch.object(VirtualEnvTemplate, 'clone', return_value=True)
+        environment = get_environment(isolation, temp_dir, platform, env_config)
+
+        environment.create()
+
+        clone.assert_called_once_with(environment.virtual_env_path, link_files=link_files)
+
+    @pytest.mark.requires_unix
+    def test_path_not_clonable(self, temp_dir, platform):
+        template_dir = temp_dir / 'templates' / 'template'
+        template = VirtualEnvTemplate(template_dir, sys.executable, platform)
+
+        venv_dir = temp_dir / 'my venv'
+
+        assert not template.clone(venv_dir)
+        assert not venv_dir.exists()
+        assert not template.exists()
+
+
+class TestSyncStamp:
+    @pytest.fixture(autouse=True)
+    def no_racy_interval(self, mocker):
+        mocker.patch.object(VirtualEnvironment, 'RACY_INTERVAL', -1)
+
+    def test_skip_inspection(self, isolation, temp_dir, platform, mocker):
+        env_config = {'dependencies': ['pip'], 'skip-install': True}
+        environment = get_environment(isolation, temp_dir, platform, env_config)
+        environment.create()
+
+        dependencies_in_sync = mocker.spy(hatchling.dep.core, 'dependencies_in_sync')
+        assert environment.dependencies_in_sync()
+        assert environment.sync_stamp_file.is_file()
+        assert dependencies_in_sync.call_count == 1
+
+        environment = get_environment(isolation, temp_dir, platform, env_config)
+        assert environment.dependencies_in_sync()
+        assert dependencies_in_sync.call_count == 1
+
+        environment.remove()
+        assert not environment.sync_stamp_file.exists()
+
+    def test_unwritable(self, isolation, temp_dir, platform):
+        env_config = {'dependencies': ['pip'], 'skip-install': True}
+        environment = get_environment(isolation, temp_dir, platform, env_config)
+        environment.create()
+
+        # The parent of the stamp is not a directory
+        environment.sync_stamp_file.parent.parent.ensure_dir_exists()
+        environment.sync_stamp_file.parent.touch()
+
+        assert environment.dependencies_in_sync()
+        assert not environment.sync_stamp_file.exists()
+
+    def test_environment_modified(self, isolation, temp_dir, platform, mocker):
+        env_config = {'dependencies': ['pip'], 'skip-install': True}
+        environment = get_environment(isolation, temp_dir, platform, env_config)
+        environment.create()
+        assert environment.dependencies_in_sync()
+
+        with environment:
+            site_packages = [path for path in environment.virtual_env.sys_path if path.endswith('site-packages')][0]
+
+        os.utime(site_packages, (0, 0))
+
+        dependencies_in_sync = mocker.spy(hatchling.dep.core, 'dependencies_in_sync')
+        environment = get_environment(isolation, temp_dir, platform, env_config)
+        assert environment.dependencies_in_sync()
+        assert dependencies_in_sync.call_count == 1
+
+    def test_python_path_changed(self, isolation, temp_dir, platform, mocker):
+        env_config = {'dependencies': ['pip'], 'skip-install': True}
+        environment = get_environment(isolation, temp_dir, platform, env_config)
+        environment.create()
+        assert environment.dependencies_in_sync()
+
+        python_path = temp_dir / 'extra'
+        python_path.mkdir()
+
+        dependencies_in_sync = mocker.spy(hatchling.dep.core, 'dependencies_in_sync')
+        env_config = dict(env_config, **{'env-vars': {'PYTHONPATH': str(python_path)}})
+        environment = get_environment(isolation, temp_dir, platform, env_config)
+        assert environment.dependencies_in_sync()
+        assert dependencies_in_sync.call_count == 1
+
+    def test_dependencies_changed(self, isolation, temp_dir, platform):
+        environment = get_environment(isolation, temp_dir, platform, {'dependencies': ['pip'], 'skip-install': True})
+        environment.create()
+        assert environment.dependencies_in_sync()
+
+        environment = get_environment(
+            isolation, temp_dir, platform, {'dependencies': ['pip', 'binary'], 'skip-install': True}
+        )
+        assert not environment.dependencies_in_sync()
+
+
+class TestRemove:
+    def test_clean_up(self, isolation, temp_dir, platform):
+        environment = get_environment(isolation, temp_dir, platform)
+        environment.create()
+        assert environment.exists()
+
+        environment.remove()
+
+        assert not environment.exists()
+        assert [path.name for path in temp_dir.iterdir()] == ['.cache']
+
+    def test_not_created(self, isolation, temp_dir, platform):
+        environment = get_environment(isolation, temp_dir, platform)
+        environment.remove()
+
+        assert not list(temp_dir.iterdir())
+
+    def test_empty_trash(self, isolation, temp_dir, platform):
+        environment = get_environment(isolation, temp_dir, platform)
+
+        # Left behind by an interrupted removal
+        leftover_path = environment.trash_directory / 'foo-abc123'
+        (leftover_path / 'lib').ensure_dir_exists()
+        (leftover_path / 'lib' / 'foo.py').touch()
+
+        environment.create()
+        environment.remove()
+
+        assert not environment.trash_directory.exists()
+        assert [path.name for path in temp_dir.iterdir()] == ['.cache']
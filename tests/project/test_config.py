@@ -2,6 +2,7 @@ from itertools import product
 
 import pytest
 
+import hatch.project.config
 from hatch.plugin.manager import PluginManager
 from hatch.project.config import ProjectConfig
 from hatch.project.env import RESERVED_OPTIONS
@@ -2409,6 +2410,166 @@ class TestEnvs:
         assert project_config.matrices['foo'] == construct_matrix_data('foo', env_config)
 
 
+class TestGetEnv:
+    def test_unknown(self, isolation):
+        project_config = ProjectConfig(isolation, {'envs': {'foo': {'matrix': [{'version': ['42']}]}}}, PluginManager())
+
+        assert project_config.get_env('foo') is None
+        assert project_config.get_env('bar') is None
+
+    def test_only_selected_generated(self, isolation, mocker):
+        env_config = {
+            'foo': {
+                'matrix': [{'python': ['39', '310'], 'version': ['9000', '42']}],
+                'overrides': {'matrix': {'version': {'type': {'value': 'baz', 'if': ['42']}}}},
+            }
+        }
+        project_config = ProjectConfig(isolation, {'envs': env_config}, PluginManager())
+
+        apply_overrides = mocker.spy(hatch.project.config, 'apply_overrides')
+        assert project_config.get_env('foo.py310-42') == {'type': 'baz', 'python': '310'}
+        assert apply_overrides.call_count == 1
+        assert project_config.get_env('foo.py310-42') is project_config.get_env('foo.py310-42')
+
+        expected_envs = {
+            'default': {'type': 'virtual'},
+            'foo.py39-9000': {'type': 'virtual', 'python': '39'},
+            'foo.py39-42': {'type': 'baz', 'python': '39'},
+            'foo.py310-9000': {'type': 'virtual', 'python': '310'},
+            'foo.py310-42': {'type': 'baz', 'python': '310'},
+        }
+
+        assert project_config.envs == expected_envs
+        assert project_config.envs['foo.py310-42'] is project_config.get_env('foo.py310-42')
+        assert project_config.matrices['foo'] == construct_matrix_data('foo', env_config)
+
+    def test_matrix_name_format_override(self, isolation):
+        env_config = {
+            'foo': {
+                'matrix': [{'version': ['9000', '42']}],
+                'overrides': {'matrix': {'version': {'matrix-name-format': {'value': 'v{value}', 'if': ['42']}}}},
+            }
+        }
+        project_config = ProjectConfig(isolation, {'envs': env_config}, PluginManager())
+
+        assert project_config.get_env('foo.v42') == {'type': 'virtual'}
+        assert project_config.get_env('foo.9000') == {'type': 'virtual'}
+        assert project_config.get_env('foo.42') is None
+
+    def test_environment_collector_finalize_environments(self, isolation, mocker):
+        def finalize_environments(config):
+            config['foo.42']['type'] = 'foo'
+
+        mocker.patch(
+            'hatch.env.collectors.default.DefaultEnvironmentCollector.finalize_environments',
+            side_effect=finalize_environments,
+        )
+
+        project_config = ProjectConfig(isolation, {'envs': {'foo': {'matrix': [{'version': ['42']}]}}}, PluginManager())
+
+        assert project_config.get_env('foo.42') == {'type': 'foo'}
+
+    def test_finalize_env_overrides(self, isolation):
+        env_config = {
+            'foo': {
+                'matrix': [{'version': ['9000', '42']}],
+                'overrides': {'matrix': {'version': {'bar': 'baz'}}},
+            }
+        }
+        project_config = ProjectConfig(isolation, {'envs': env_config}, PluginManager())
+
+        project_config.finalize_env_overrides({'bar': str}, 'foo.42')
+        assert project_config.get_env('foo.42') == {'type': 'virtual', 'bar': 'baz'}
+
+        project_config.finalize_env_overrides({'bar': str}, 'foo.42')
+        assert project_config.get_env('foo.42') == {'type': 'virtual', 'bar': 'baz'}
+        assert project_config.get_env('foo.9000') == {'type': 'virtual'}
+
+
+class TestEnvCache:
+    def test_reuse(self, isolation, temp_dir, mocker):
+        cache_file = temp_dir / 'config.json'
+        env_config = {
+            'foo': {
+                'matrix': [{'version': ['9000', '42']}],
+                'overrides': {'matrix': {'version': {'type': {'value': 'baz', 'if': ['42']}}}},
+            }
+        }
+        expected_envs = {
+            'default': {'type': 'virtual'},
+            'foo.9000': {'type': 'virtual'},
+            'foo.42': {'type': 'baz'},
+        }
+
+        project_config = ProjectConfig(isolation, {'envs': env_config}, PluginManager(), cache_file=cache_file)
+        assert project_config.envs == expected_envs
+        assert cache_file.is_file()
+
+        populate_default_env_values = mocker.spy(hatch.project.config, '_populate_default_env_values')
+        project_config = ProjectConfig(isolation, {'envs': env_config}, PluginManager(), cache_file=cache_file)
+
+        assert project_config.envs == expected_envs
+        assert project_config.matrices['foo'] == construct_matrix_data('foo', env_config)
+        populate_default_env_values.assert_not_called()
+
+    def test_config_changed(self, isolation, temp_dir):
+        cache_file = temp_dir / 'config.json'
+
+        project_config = ProjectConfig(isolation, {'envs': {'foo': {}}}, PluginManager(), cache_file=cache_file)
+        assert list(project_config.envs) == ['default', 'foo']
+
+        project_config = ProjectConfig(isolation, {'envs': {'bar': {}}}, PluginManager(), cache_file=cache_file)
+        assert list(project_config.envs) == ['default', 'bar']
+
+    def test_env_var_changed(self, isolation, temp_dir):
+        cache_file = temp_dir / 'config.json'
+        env_var = 'OVERRIDES_ENV_FOO'
+        env_config = {'foo': {'overrides': {'env': {env_var: {'type': {'value': 'baz', 'if': ['bar']}}}}}}
+
+        with EnvVars({env_var: 'bar'}):
+            project_config = ProjectConfig(isolation, {'envs': env_config}, PluginManager(), cache_file=cache_file)
+            assert project_config.envs['foo'] == {'type': 'baz'}
+
+        with EnvVars(exclude=[env_var]):
+            project_config = ProjectConfig(isolation, {'envs': env_config}, PluginManager(), cache_file=cache_file)
+            assert project_config.envs['foo'] == {'type': 'virtual'}
+
+    def test_env_var_values_not_cached(self, isolation, temp_dir):
+        cache_file = temp_dir / 'config.json'
+        env_var = 'OVERRIDES_ENV_TOKEN'
+        env_config = {
+            'foo': {'overrides': {'env': {env_var: {'env-vars': 'TOKEN'}}}},
+            'bar': {'matrix': [{'version': ['42']}], 'overrides': {'env': {env_var: {'env-vars': 'TOKEN'}}}},
+        }
+
+        with EnvVars({env_var: 'secret'}):
+            project_config = ProjectConfig(isolation, {'envs': env_config}, PluginManager(), cache_file=cache_file)
+            assert project_config.envs['foo'] == {'type': 'virtual', 'env-vars': {'TOKEN': 'secret'}}
+            assert 'secret' not in cache_file.read_text()
+
+            project_config = ProjectConfig(isolation, {'envs': env_config}, PluginManager(), cache_file=cache_file)
+            assert project_config.envs['foo'] == {'type': 'virtual', 'env-vars': {'TOKEN': 'secret'}}
+            assert project_config.envs['bar.42'] == {'type': 'virtual', 'env-vars': {'TOKEN': 'secret'}}
+            assert project_config.matrices['bar']['config'] == {'type': 'virtual', 'env-vars': {'TOKEN': 'secret'}}
+
+    def test_unwritable(self, isolation, temp_dir):
+        # The parent of the cache file is not a directory
+        cache_parent = temp_dir / 'cache'
+        cache_parent.touch()
+        cache_file = cache_parent / 'config.json'
+
+        project_config = ProjectConfig(isolation, {'envs': {'foo': {}}}, PluginManager(), cache_file=cache_file)
+        assert list(project_config.envs) == ['default', 'foo']
+        assert not cache_file.exists()
+
+    def test_corrupt(self, isolation, temp_dir):
+        cache_file = temp_dir / 'config.json'
+        cache_file.write_text('{')
+
+        project_config = ProjectConfig(isolation, {'envs': {'foo': {}}}, PluginManager(), cache_file=cache_file)
+        assert list(project_config.envs) == ['default', 'foo']
+
+
 class TestPublish:
     def test_not_table(self, isolation):
         with pytest.raises(TypeError, match='Field `tool.hatch.publish` must be a table'):
@@ -0,0 +1,102 @@
+import json
+import sys
+
+import pytest
+
+from hatch.utils.env import PythonInfo
+from hatch.utils.structures import EnvVars
+
+
+@pytest.fixture(autouse=True)
+def no_racy_interval(mocker):
+    mocker.patch.object(PythonInfo, 'RACY_INTERVAL', -1)
+
+
+class TestPythonInfo:
+    def test_uncached(self, platform):
+        python_info = PythonInfo(platform, executable=sys.executable)
+
+        assert python_info.environment['sys_platform'] == sys.platform
+        assert python_info.sys_path is python_info.sys_path
+        assert python_info.cache_file is None
+
+    def test_cached(self, temp_dir, platform, mocker):
+        cache_file = temp_dir / 'python-info.json'
+        python_info = PythonInfo(platform, executable=sys.executable, cache_file=cache_file)
+        sys_path = python_info.sys_path
+
+        assert cache_file.is_file()
+
+        check_command = mocker.spy(platform, 'check_command')
+        python_info = PythonInfo(platform, executable=sys.executable, cache_file=cache_file)
+
+        assert python_info.sys_path == sys_path
+        assert python_info.environment['sys_platform'] == sys.platform
+        check_command.assert_not_called()
+
+    def test_stale(self, temp_dir, platform, mocker):
+        cache_file = temp_dir / 'python-info.json'
+        _ = PythonInfo(platform, executable=sys.executable, cache_file=cache_file).sys_path
+
+        cached_data = json.loads(cache_file.read_text())
+        cached_data['key']['paths'][-1].append(0)
+        cache_file.write_text(json.dumps(cached_data))
+
+        check_command = mocker.spy(platform, 'check_command')
+        _ = PythonInfo(platform, executable=sys.executable, cache_file=cache_file).sys_path
+
+        check_command.assert_called_once()
+        assert json.loads(cache_file.read_text())['key'] != cached_data['key']
+
+    @pytest.mark.parametrize('env_var', ['PYTHONPATH', 'PYTHONHOME', 'PYTHONNOUSERSITE', 'VIRTUAL_ENV'])
+    def test_env_var_changed(self, temp_dir, platform, env_var):
+        cache_file = temp_dir / 'python-info.json'
+        python_info = PythonInfo(platform, executable=sys.executable, cache_file=cache_file)
+        cache_key = python_info.get_cache_key(sys.executable, python_info.sys_path)
+
+        with EnvVars({env_var: str(temp_dir)}):
+            assert python_info.get_cache_key(sys.executable, python_info.sys_path) != cache_key
+
+    def test_python_path_changed(self, temp_dir, platform, mocker):
+        cache_file = temp_dir / 'python-info.json'
+        _ = PythonInfo(platform, executable=sys.executable, cache_file=cache_file).sys_path
+
+        python_path = temp_dir / 'extra'
+        python_path.mkdir()
+
+        check_command = mocker.spy(platform, 'check_command')
+        with EnvVars({'PYTHONPATH': str(python_path)}):
+            sys_path = PythonInfo(platform, executable=sys.executable, cache_file=cache_file).sys_path
+
+        check_command.assert_called_once()
+        assert str(python_path) in sys_path
+
+    def test_executable_resolved(self, temp_dir, platform, mocker):
+        cache_file = temp_dir / 'python-info.json'
+        executable = platform.modules.shutil.which('python')
+
+        check_command = mocker.spy(platform, 'check_command')
+        _ = PythonInfo(platform, cache_file=cache_file).sys_path
+
+        assert check_command.call_args[0][0][0] == executable
+        assert json.loads(cache_file.read_text())['key']['paths'][0][0] == executable
+
+    def test_corrupt(self, temp_dir, platform, mocker):
+        cache_file = temp_dir / 'python-info.json'
+        cache_file.write_text('{')
+
+        check_command = mocker.spy(platform, 'check_command')
+        python_info = PythonInfo(platform, executable=sys.executable, cache_file=cache_file)
+
+        assert python_info.environment['sys_platform'] == sys.platform
+        check_command.assert_called_once()
+
+    def test_unwritable(self, temp_dir, platform):
+        # The parent of the cache file is not a directory
+        cache_parent = temp_dir / 'cache'
+        cache_parent.touch()
+        cache_file = cache_parent / 'python-info.json'
+        python_info = PythonInfo(platform, executable=sys.executable, cache_file=cache_file)
+
+        assert python_info.environment['sys_platform'] == sys.platform
+        assert not cache_file.exists()